@@ -6,123 +6,143 @@ Validates Amazon ASINs, checks product metadata, and manages seed data
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import requests
-import json
-import re
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Callable, List, Sequence
 import threading
-from queue import Queue
-from html.parser import HTMLParser
+from queue import Empty, Queue
 from pathlib import Path
 
-@dataclass
-class ValidationResult:
-    asin: str
-    status_code: int
-    title: str
-    is_gpu: bool
-    price: Optional[float] = None
-    brand: Optional[str] = None
-    vram: Optional[str] = None
-    notes: str = ""
-    valid: bool = False
-
-class ASINVerifier:
-    """Validates Amazon ASINs and extracts product metadata"""
-
-    GPU_KEYWORDS = ['graphics card', 'gpu', 'nvidia', 'amd', 'geforce', 'radeon', 'rtx', 'rx', 'gtx']
-
-    def __init__(self):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+from asin_verifier import ASINVerifier, NegativeFilter, PriceHistory, ResultCache, ValidationJournal, ValidationResult
+from asin_verifier.export import export_results
+from asin_verifier.inputs import AsinLoader
+from asin_verifier.seed import DEFAULT_SEED_PATH, merge_products
+from asin_verifier.seedstore import SeedStore
+
+class VirtualResultsTable(ttk.Frame):
+    """
+    Treeview that only materializes the rows currently on screen.
+
+    The widget holds at most one item per visible line; scrolling re-fills
+    those items from the backing sequence instead of inserting every result,
+    so 100k rows cost the same to render as 30.
+    """
+
+    def __init__(self, parent, columns: Sequence[str], rows: Callable[[], Sequence],
+                 format_row: Callable[[object], tuple], tag_row: Callable[[object], str]):
+        super().__init__(parent)
+        self.rows = rows
+        self.format_row = format_row
+        self.tag_row = tag_row
+        self.top = 0
+        self.visible = 15
+        self.follow_tail = True
+
+        self.tree = ttk.Treeview(self, columns=columns, height=self.visible, show="headings")
+        for col in columns:
+            self.tree.heading(col, text=col)
+            width = 80 if col == "Title" else 50 if col == "Notes" else 100
+            self.tree.column(col, width=width)
 
-    def validate_asin(self, asin: str) -> ValidationResult:
-        """Validate an ASIN and extract metadata"""
-        url = f"https://www.amazon.com/dp/{asin}"
+        self.vsb = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        hsb = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.tree.xview)
+        self.tree.configure(xscroll=hsb.set)
 
-        try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            title = self._extract_title(response.text)
-            is_gpu = any(kw in title.lower() for kw in self.GPU_KEYWORDS)
-            price = self._extract_price(response.text)
-            brand = self._extract_brand(title)
-            vram = self._extract_vram(title)
-
-            notes = ""
-            if response.status_code == 404:
-                notes = "Product not found (404)"
-                valid = False
-            elif response.status_code == 200 and is_gpu:
-                notes = "Valid GPU product"
-                valid = True
-            elif response.status_code == 200:
-                notes = f"Found but not GPU: {title[:30]}..."
-                valid = False
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.vsb.grid(row=0, column=1, sticky="ns")
+        hsb.grid(row=1, column=0, sticky="ew")
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-1, "units"))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(1, "units"))
+        self.tree.bind("<Prior>", lambda e: self.scroll(-1, "pages"))
+        self.tree.bind("<Next>", lambda e: self.scroll(1, "pages"))
+
+    def tag_configure(self, tag: str, **options):
+        self.tree.tag_configure(tag, **options)
+
+    def _on_resize(self, event):
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        visible = max(1, (event.height - row_height) // row_height)
+        if visible != self.visible:
+            self.visible = visible
+            self.refresh()
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self._move_to(int(float(args[0]) * len(self.rows())))
+        elif action == "scroll":
+            self.scroll(int(args[0]), args[1])
+
+    def scroll(self, amount: int, what: str = "units"):
+        step = self.visible if what == "pages" else 3
+        self._move_to(self.top + amount * step)
+
+    def _move_to(self, top: int):
+        total = len(self.rows())
+        self.top = max(0, min(top, total - self.visible))
+        self.follow_tail = self.top >= total - self.visible
+        self.refresh()
+
+    def reset(self):
+        self.top = 0
+        self.follow_tail = True
+        self.refresh()
+
+    def refresh(self):
+        """Re-render the visible window; call after the backing rows change"""
+        rows = self.rows()
+        total = len(rows)
+        if self.follow_tail:
+            self.top = max(0, total - self.visible)
+        self.top = max(0, min(self.top, total - 1))
+        window = rows[self.top:self.top + self.visible]
+
+        items = self.tree.get_children()
+        for i, row in enumerate(window):
+            values, tags = self.format_row(row), (self.tag_row(row),)
+            if i < len(items):
+                self.tree.item(items[i], values=values, tags=tags)
             else:
-                notes = f"HTTP {response.status_code}"
-                valid = False
-
-            return ValidationResult(
-                asin=asin,
-                status_code=response.status_code,
-                title=title,
-                is_gpu=is_gpu,
-                price=price,
-                brand=brand,
-                vram=vram,
-                notes=notes,
-                valid=valid
-            )
-
-        except requests.Timeout:
-            return ValidationResult(asin=asin, status_code=0, title="Error", is_gpu=False,
-                                   notes="Request timeout")
-        except Exception as e:
-            return ValidationResult(asin=asin, status_code=0, title="Error", is_gpu=False,
-                                   notes=f"Error: {str(e)[:50]}")
-
-    def _extract_title(self, html: str) -> str:
-        """Extract product title from HTML"""
-        match = re.search(r'<title[^>]*>([^<]+)</title>', html, re.IGNORECASE)
-        return match.group(1).strip() if match else "No title"
-
-    def _extract_price(self, html: str) -> Optional[float]:
-        """Extract price from HTML"""
-        match = re.search(r'\$?([\d,]+\.?\d*)', html)
-        if match:
-            try:
-                return float(match.group(1).replace(',', ''))
-            except:
-                return None
-        return None
-
-    def _extract_brand(self, title: str) -> str:
-        """Extract brand from title"""
-        brands = ['NVIDIA', 'AMD', 'ASUS', 'MSI', 'Gigabyte', 'PowerColor', 'Sapphire', 'XFX', 'ASRock', 'PNY', 'Palit', 'Zotac']
-        for brand in brands:
-            if brand.lower() in title.lower():
-                return brand
-        return title.split()[0] if title else "Unknown"
-
-    def _extract_vram(self, title: str) -> str:
-        """Extract VRAM from title"""
-        match = re.search(r'(\d+)\s*GB', title, re.IGNORECASE)
-        return f"{match.group(1)}GB" if match else "Unknown"
+                self.tree.insert("", "end", values=values, tags=tags)
+        if len(items) > len(window):
+            self.tree.delete(*items[len(window):])
+
+        if total:
+            self.vsb.set(self.top / total, min(1.0, (self.top + len(window)) / total))
+        else:
+            self.vsb.set(0.0, 1.0)
 
 class ASINVerificationGUI:
     """GUI for ASIN verification and seed data management"""
 
+    DEFAULT_CONCURRENCY = 8
+    PUMP_INTERVAL_MS = 100
+    # Cap per tick so a flood of cache hits can't stall the event loop
+    PUMP_BATCH = 5000
+    TEXT_INPUT_LIMIT = 5000
+    METRICS_PATH = "exports/verifier-metrics.json"
+
     def __init__(self, root):
         self.root = root
         self.root.title("DXM369 ASIN Verification Tool")
         self.root.geometry("1200x700")
         self.root.configure(bg="#0a1124")
 
-        self.verifier = ASINVerifier()
+        self.cache = ResultCache()
+        self.negative = NegativeFilter()
+        self.verifier = ASINVerifier(cache=self.cache, negative=self.negative)
+        self.journal = ValidationJournal()
+        self.prices = PriceHistory()
         self.results: List[ValidationResult] = []
         self.validation_queue = Queue()
+        self._completed = []
+        self._total = 0
+        self._running = False
+        self._loaded_asins: List[str] = []
+        self._loaded_marker = ""
+        self._input_summary = ""
 
         self.setup_ui()
 
@@ -159,32 +179,32 @@ class ASINVerificationGUI:
         ttk.Button(button_frame, text="📂 Open Folder", command=self.open_output_folder).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="🌱 Inject to Seed", command=self.inject_to_seed).pack(side=tk.LEFT, padx=5)
 
-        # Results frame
-        results_frame = ttk.LabelFrame(main_frame, text="Validation Results", padding=10)
-        results_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        self.use_cache_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(button_frame, text="Use cache", variable=self.use_cache_var).pack(side=tk.RIGHT, padx=5)
 
-        # Treeview for results
-        columns = ("ASIN", "Status", "Title", "Brand", "VRAM", "Price", "Valid", "Notes")
-        self.tree = ttk.Treeview(results_frame, columns=columns, height=15)
+        self.skip_dead_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(button_frame, text="Skip known dead", variable=self.skip_dead_var).pack(side=tk.RIGHT, padx=5)
 
-        # Define column headings
-        self.tree.heading("#0", text="")
-        for col in columns:
-            self.tree.heading(col, text=col)
-            width = 80 if col == "Title" else 50 if col == "Notes" else 100
-            self.tree.column(col, width=width)
+        self.resume_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_frame, text="Resume", variable=self.resume_var).pack(side=tk.RIGHT, padx=5)
 
-        # Scrollbars
-        vsb = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        hsb = ttk.Scrollbar(results_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscroll=vsb.set, xscroll=hsb.set)
+        self.concurrency_var = tk.IntVar(value=self.DEFAULT_CONCURRENCY)
+        ttk.Spinbox(button_frame, from_=1, to=64, width=4, textvariable=self.concurrency_var).pack(side=tk.RIGHT, padx=5)
+        ttk.Label(button_frame, text="Parallel requests:").pack(side=tk.RIGHT)
 
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb.grid(row=1, column=0, sticky="ew")
+        # Results frame
+        results_frame = ttk.LabelFrame(main_frame, text="Validation Results", padding=10)
+        results_frame.pack(fill=tk.BOTH, expand=True, pady=10)
 
-        results_frame.columnconfigure(0, weight=1)
-        results_frame.rowconfigure(0, weight=1)
+        # Virtualized results table: only on-screen rows exist as Treeview items
+        columns = ("ASIN", "Status", "Title", "Brand", "VRAM", "Price", "Valid", "Notes")
+        self.table = VirtualResultsTable(
+            results_frame, columns,
+            rows=lambda: self.results,
+            format_row=self._row_values,
+            tag_row=lambda r: "valid" if r.valid else "invalid",
+        )
+        self.table.pack(fill=tk.BOTH, expand=True)
 
         # Status frame
         status_frame = ttk.Frame(main_frame)
@@ -198,83 +218,153 @@ class ASINVerificationGUI:
         self.progress.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
 
         # Configure tag colors
-        self.tree.tag_configure("valid", foreground="green")
-        self.tree.tag_configure("invalid", foreground="red")
+        self.table.tag_configure("valid", foreground="green")
+        self.table.tag_configure("invalid", foreground="red")
 
     def start_validation(self):
         """Start validation of entered ASINs"""
-        asin_text = self.input_text.get("1.0", tk.END).strip()
-        asins = [line.strip().upper() for line in asin_text.split('\n') if line.strip()]
+        # Normalize, format-check and de-duplicate locally: rejected input never reaches the network
+        loader = AsinLoader()
+        asins = list(loader.text(self.input_text.get("1.0", tk.END)))
+        if self._loaded_asins and self._loaded_marker in self.input_text.get("1.0", tk.END):
+            asins.extend(loader.values(self._loaded_asins))
 
         if not asins:
-            messagebox.showwarning("Input Error", "Please enter at least one ASIN")
+            detail = f"\n\n{loader.stats.summary()}" if loader.stats.rejected else ""
+            messagebox.showwarning("Input Error", f"Please enter at least one valid ASIN{detail}")
             return
+        if self._running:
+            messagebox.showwarning("Busy", "A validation run is already in progress")
+            return
+        self._input_summary = loader.stats.summary() if loader.stats.rejected else ""
 
         # Clear previous results
-        for item in self.tree.get_children():
-            self.tree.delete(item)
         self.results = []
+        self._completed = []
+        self._total = len(asins)
+        self.table.reset()
+
+        # Cache hits skip the network; unchecking forces a full re-fetch
+        self.verifier.cache = self.cache if self.use_cache_var.get() else None
+        # Known 404 / non-GPU ASINs are skipped unless rechecking; new dead results are recorded either way
+        self.verifier.skip_known_dead = self.skip_dead_var.get()
 
-        # Start validation in background thread
+        try:
+            concurrency = self.concurrency_var.get()
+        except tk.TclError:
+            concurrency = self.DEFAULT_CONCURRENCY
+
+        # Resume skips ASINs the journal already settled; otherwise start a fresh journal
+        resume = self.resume_var.get()
+        if not resume:
+            self.journal.reset()
+
+        # Start validation in background thread; results come back through validation_queue
         self.progress.start()
-        self.status_var.set(f"Validating {len(asins)} ASINs...")
+        skipped = f" ({self._input_summary})" if self._input_summary else ""
+        self.status_var.set(f"Validating {len(asins)} ASINs...{skipped}")
 
-        thread = threading.Thread(target=self._validate_asins, args=(asins,))
+        self._running = True
+        thread = threading.Thread(target=self._validate_asins, args=(asins, concurrency, resume))
         thread.daemon = True
         thread.start()
+        self.root.after(self.PUMP_INTERVAL_MS, self._pump_results)
 
-    def _validate_asins(self, asins: List[str]):
-        """Validate ASINs in background thread"""
-        for i, asin in enumerate(asins):
-            result = self.verifier.validate_asin(asin)
-            self.results.append(result)
-
-            # Update UI
-            tag = "valid" if result.valid else "invalid"
-            self.tree.insert("", "end", values=(
-                result.asin,
-                result.status_code,
-                result.title[:40] + "..." if len(result.title) > 40 else result.title,
-                result.brand or "-",
-                result.vram or "-",
-                f"${result.price:.2f}" if result.price else "-",
-                "✅" if result.valid else "❌",
-                result.notes[:30] + "..." if len(result.notes) > 30 else result.notes
-            ), tags=(tag,))
-
-            # Update status
-            self.status_var.set(f"Validated {i+1}/{len(asins)}")
-            self.root.update()
+    def _validate_asins(self, asins: List[str], concurrency: int, resume: bool = False):
+        """Validate ASINs in background thread (no Tk calls here: results go through the queue)"""
+        try:
+            done = self.journal.load() if resume else {}
+            for index, result in self.verifier.validate_many(asins, concurrency=concurrency, known=done.get):
+                # Journal each fetch once; resumed and coalesced duplicates are already in it
+                if done.get(result.asin) is not result:
+                    self.journal.append(result)
+                    done[result.asin] = result
+                self.validation_queue.put(("result", index, result))
+        except Exception as e:
+            self.validation_queue.put(("error", None, e))
+        finally:
+            self.validation_queue.put(("done", None, None))
+
+    def _pump_results(self):
+        """Drain queued results on the Tk thread in timed batches"""
+        finished = False
+        error = None
+        for _ in range(self.PUMP_BATCH):
+            try:
+                kind, index, payload = self.validation_queue.get_nowait()
+            except Empty:
+                break
+            if kind == "result":
+                self._completed.append((index, payload))
+                self.results.append(payload)
+            elif kind == "error":
+                error = payload
+            else:
+                finished = True
+                break
 
+        self.table.refresh()
+        metrics = self.verifier.metrics
+        rate = self.verifier.scheduler.current_rate()
+        self.status_var.set(f"Validated {len(self.results)}/{self._total} · {metrics.rate():.1f} ASINs/s · "
+                            f"p95 {metrics.recent_p95():.2f}s · {rate:.1f} req/s")
+
+        if error is not None:
+            messagebox.showerror("Error", f"Validation stopped: {str(error)}")
+
+        if not finished:
+            self.root.after(self.PUMP_INTERVAL_MS, self._pump_results)
+            return
+
+        # Results stream in completion order; keep saved/injected data in input order
+        self.results = [result for _, result in sorted(self._completed, key=lambda item: item[0])]
+        self._completed = []
+        self.table.refresh()
+
+        self._running = False
         self.progress.stop()
+        self.prices.record(self.results)
+        self.verifier.metrics.write(self.METRICS_PATH)
         valid_count = sum(1 for r in self.results if r.valid)
-        self.status_var.set(f"✅ Complete: {valid_count}/{len(asins)} valid GPUs")
+        skipped = f" · input: {self._input_summary}" if self._input_summary else ""
+        self.status_var.set(f"✅ Complete: {valid_count}/{self._total} valid GPUs{skipped}")
+
+    @staticmethod
+    def _row_values(result: ValidationResult) -> tuple:
+        return (
+            result.asin,
+            result.status_code,
+            result.title[:40] + "..." if len(result.title) > 40 else result.title,
+            result.brand or "-",
+            result.vram or "-",
+            f"${result.price:.2f}" if result.price else "-",
+            "✅" if result.valid else "❌",
+            result.notes[:30] + "..." if len(result.notes) > 30 else result.notes
+        )
 
     def load_asin_file(self):
         """Load ASINs from file"""
         filename = filedialog.askopenfilename(
-            filetypes=[("Text files", "*.txt"), ("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[("Text files", "*.txt"), ("JSON files", "*.json"), ("CSV files", "*.csv"), ("All files", "*.*")]
         )
         if not filename:
             return
 
         try:
-            with open(filename, 'r') as f:
-                content = f.read()
-
-            if filename.endswith('.json'):
-                data = json.loads(content)
-                if isinstance(data, list):
-                    asins = data
-                elif isinstance(data, dict) and 'gpu' in data:
-                    asins = [gpu['asin'] for gpu in data['gpu']]
-                else:
-                    asins = list(data.values()) if isinstance(data, dict) else []
-                content = '\n'.join(asins)
+            loader = AsinLoader()
+            asins = list(loader.file(filename))
 
+            # Big lists stay out of the Text widget; a marker line stands in for them
             self.input_text.delete("1.0", tk.END)
-            self.input_text.insert("1.0", content)
-            messagebox.showinfo("Success", f"Loaded {len(content.split())} ASINs")
+            if len(asins) > self.TEXT_INPUT_LIMIT:
+                self._loaded_asins = asins
+                self._loaded_marker = f"# {len(asins)} ASINs loaded from {Path(filename).name}"
+                self.input_text.insert("1.0", self._loaded_marker + "\n")
+            else:
+                self._loaded_asins = []
+                self.input_text.insert("1.0", "\n".join(asins))
+
+            messagebox.showinfo("Success", f"Loaded {loader.stats.summary()}")
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load file: {str(e)}")
@@ -287,46 +377,27 @@ class ASINVerificationGUI:
 
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("CSV files", "*.csv")]
+            filetypes=[("JSON files", "*.json"), ("JSON Lines", "*.jsonl"), ("CSV files", "*.csv"),
+                       ("Columnar zip", "*.colz"), ("Parquet", "*.parquet")],
+            confirmoverwrite=False
         )
         if not filename:
             return
 
         try:
-            if filename.endswith('.json'):
-                data = [
-                    {
-                        'asin': r.asin,
-                        'status_code': r.status_code,
-                        'title': r.title,
-                        'is_gpu': r.is_gpu,
-                        'valid': r.valid,
-                        'price': r.price,
-                        'brand': r.brand,
-                        'vram': r.vram,
-                        'notes': r.notes
-                    }
-                    for r in self.results
-                ]
-                with open(filename, 'w') as f:
-                    json.dump(data, f, indent=2)
-            else:
-                import csv
-                with open(filename, 'w', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=['asin', 'status_code', 'title', 'is_gpu', 'valid', 'price', 'brand', 'vram', 'notes'])
-                    writer.writeheader()
-                    for r in self.results:
-                        writer.writerow({
-                            'asin': r.asin,
-                            'status_code': r.status_code,
-                            'title': r.title,
-                            'is_gpu': r.is_gpu,
-                            'valid': r.valid,
-                            'price': r.price,
-                            'brand': r.brand,
-                            'vram': r.vram,
-                            'notes': r.notes
-                        })
+            # Existing exports can be extended instead of replaced
+            append = False
+            if Path(filename).exists():
+                if filename.endswith('.parquet'):
+                    if not messagebox.askyesno("Export exists", f"Overwrite {Path(filename).name}?"):
+                        return
+                else:
+                    choice = messagebox.askyesnocancel("Export exists", f"Append to {Path(filename).name}?\n(No overwrites it)")
+                    if choice is None:
+                        return
+                    append = choice
+
+            export_results(self.results, filename, append=append)
 
             messagebox.showinfo("Success", f"Results saved to {filename}")
 
@@ -366,48 +437,28 @@ class ASINVerificationGUI:
             return
 
         try:
-            # Load current seed file
-            seed_path = "data/asin-seed.json"
-            with open(seed_path, 'r') as f:
-                seed_data = json.load(f)
-
-            # Create GPU products from results
-            new_gpus = []
-            for result in valid_results:
-                gpu = {
-                    "asin": result.asin,
-                    "title": result.title,
-                    "brand": result.brand or "Unknown",
-                    "category": "gpu",
-                    "price": int(result.price) if result.price else 299,
-                    "previousPrice": int(result.price * 1.2) if result.price else 399,
-                    "dxmScore": 8.5,  # Default score
-                    "vram": result.vram or "8GB",
-                    "tdp": "200W",  # Default TDP
-                    "boostClock": "2.5 GHz",
-                    "baseClock": "2.0 GHz",
-                    "imageUrl": f"/images/products/gpus/{result.brand.lower().replace(' ', '_')}_gpu.svg",
-                    "domain": "com",
-                    "tags": ["gpu", "validated"],
-                    "availability": "In Stock",
-                    "primeEligible": True,
-                    "vendor": "Amazon",
-                    "affiliateUrl": f"https://www.amazon.com/dp/{result.asin}/?tag=dxm369-20"
-                }
-                new_gpus.append(gpu)
-
-            # Update seed data
-            seed_data['products']['gpu'] = new_gpus
-            seed_data['lastUpdated'] = __import__('datetime').date.today().isoformat()
-
-            # Save updated seed data
-            with open(seed_path, 'w') as f:
-                json.dump(seed_data, f, indent=2)
-
-            messagebox.showinfo("Success", f"Injected {len(new_gpus)} GPU products into seed data")
+            # Merge by ASIN into the current catalog; curated fields and other products are kept.
+            # The store looks each ASIN up by index and only the touched products are written back.
+            seed_path = DEFAULT_SEED_PATH
+            with SeedStore() as store:
+                store.sync(seed_path)
+                diff, touched = merge_products(valid_results, lambda asin: store.get(asin, "gpu"), category="gpu",
+                                               previous_prices=self.prices.previous_prices())
+
+                if not diff.changed:
+                    messagebox.showinfo("Up to date", f"Seed data already current ({diff.unchanged} GPUs unchanged)")
+                    return
+                if not messagebox.askyesno("Inject to Seed", f"Apply these changes to {seed_path}?\n\n{diff.format(limit=20)}"):
+                    return
+
+                store.upsert_many(touched.values(), "gpu")
+                store.set_field('lastUpdated', __import__('datetime').date.today().isoformat())
+                store.export(seed_path)
+
+            messagebox.showinfo("Success", f"Injected into seed data: {diff.summary()}")
 
         except FileNotFoundError:
-            messagebox.showerror("Error", "Could not find data/asin-seed.json")
+            messagebox.showerror("Error", f"Could not find {DEFAULT_SEED_PATH}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to inject data: {str(e)}")
 
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+DXM369 headless ASIN verification
+Streams JSON Lines ValidationResults to stdout; safe for servers and cron (no tkinter)
+
+Usage:
+    python3 scripts/asin-verify-cli.py validate db_asins.txt -c 16 > results.jsonl
+    cat asins.txt | python3 scripts/asin-verify-cli.py validate --no-cache
+    python3 scripts/asin-verify-cli.py reclassify data/asin-seed.json --changed-only
+    python3 scripts/asin-verify-cli.py bench --count 1000 --levels 1,8,32 --latency 0.1
+"""
+
+import sys
+
+from asin_verifier.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+DXM369 ASIN verifier core
+Network validation and metadata extraction shared by the GUI and headless tools
+"""
+
+from .archive import ArchivedPage, PageArchive, reextract
+from .cache import CacheEntry, ResultCache
+from .classifier import TitleClass, TitleClassifier
+from .export import export_results, open_writer, read_columns
+from .inputs import AsinLoader, InputStats
+from .journal import ValidationJournal
+from .metrics import Histogram, VerifierMetrics
+from .negative import BloomFilter, NegativeFilter
+from .prices import PriceHistory, PriceMove
+from .revalidate import RevalidationItem, RevalidationPlanner, within_budget
+from .scheduler import AIMDLimiter, FetchScheduler, TokenBucket
+from .seed import SeedDiff, upsert_seed
+from .seedstore import SeedStore
+from .shards import ShardJob, ShardWorker
+from .standin import AmazonStandIn, StandInConfig
+from .verifier import ASINVerifier, DeadlineExceeded, ValidationResult, is_definitive
+
+__all__ = [
+    "AIMDLimiter",
+    "AmazonStandIn",
+    "AsinLoader",
+    "ASINVerifier",
+    "ArchivedPage",
+    "BloomFilter",
+    "CacheEntry",
+    "DeadlineExceeded",
+    "FetchScheduler",
+    "Histogram",
+    "InputStats",
+    "NegativeFilter",
+    "PageArchive",
+    "PriceHistory",
+    "PriceMove",
+    "ResultCache",
+    "RevalidationItem",
+    "RevalidationPlanner",
+    "SeedDiff",
+    "SeedStore",
+    "ShardJob",
+    "ShardWorker",
+    "StandInConfig",
+    "TitleClass",
+    "TitleClassifier",
+    "TokenBucket",
+    "ValidationJournal",
+    "ValidationResult",
+    "VerifierMetrics",
+    "export_results",
+    "is_definitive",
+    "open_writer",
+    "read_columns",
+    "reextract",
+    "upsert_seed",
+    "within_budget",
+]
@@ -0,0 +1,189 @@
+"""
+Content-addressed archive of fetched product pages, for offline re-extraction
+
+Page bodies are stored once per distinct content under objects/<sha256[:2]>/
+<sha256[2:]>, deflated; an unchanged page fetched again costs only an index
+row. The SQLite index maps (ASIN, fetch time) to the blob with the HTTP
+status and charset needed to decode it. reextract() replays the extractor
+and classifier over the archive on a process pool, so a fix to extraction or
+classification reaches the whole catalog without a single request.
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .classifier import TitleClassifier
+from .extract import extract_html
+from .verifier import ValidationResult, result_from_page
+
+
+@dataclass
+class ArchivedPage:
+    asin: str
+    fetched_at: float
+    status_code: int
+    encoding: Optional[str]
+    digest: str
+    size: int
+    complete: bool
+
+
+class PageArchive:
+    """Blob store of raw page bodies plus an (ASIN, fetched_at) index"""
+
+    DEFAULT_PATH = "exports/page-archive"
+
+    def __init__(self, path: str = DEFAULT_PATH, level: int = 6):
+        self.root = Path(path)
+        self.objects = self.root / "objects"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.level = level
+        self.stored = 0
+        self.deduplicated = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.root / "index.sqlite"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                asin TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                status_code INTEGER NOT NULL,
+                encoding TEXT,
+                digest TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                complete INTEGER NOT NULL,
+                PRIMARY KEY (asin, fetched_at)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_digest ON pages(digest)")
+        self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def blob_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest[2:]
+
+    def put(self, asin: str, status_code: int, body: bytes, encoding: Optional[str] = None,
+            complete: bool = True, when: Optional[float] = None) -> str:
+        """Archive one fetched page; returns its content digest"""
+        digest = hashlib.sha256(body).hexdigest()
+        target = self.blob_path(digest)
+        if target.exists():
+            self.deduplicated += 1
+        else:
+            target.parent.mkdir(exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=".blob.", dir=str(target.parent))
+            with os.fdopen(fd, 'wb') as f:
+                f.write(zlib.compress(body, self.level))
+            # Same content always has the same name, so concurrent writers may both win
+            os.replace(tmp, target)
+            self.stored += 1
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (asin, when if when is not None else time.time(), status_code, encoding, digest,
+                 len(body), int(complete)),
+            )
+            self._conn.commit()
+        return digest
+
+    def read(self, digest: str) -> bytes:
+        with open(self.blob_path(digest), 'rb') as f:
+            return zlib.decompress(f.read())
+
+    def text(self, page: ArchivedPage) -> str:
+        return self.read(page.digest).decode(page.encoding or 'utf-8', errors='replace')
+
+    def history(self, asin: str) -> List[ArchivedPage]:
+        """Every archived fetch of one ASIN, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM pages WHERE asin = ? ORDER BY fetched_at", (asin,)
+            ).fetchall()
+        return [ArchivedPage(*row[:6], bool(row[6])) for row in rows]
+
+    def latest(self, asins: Optional[List[str]] = None) -> List[ArchivedPage]:
+        """Most recent fetch per ASIN (all ASINs, or just the given ones), ordered by ASIN"""
+        query = ("SELECT p.* FROM pages p JOIN (SELECT asin, MAX(fetched_at) AS latest FROM pages GROUP BY asin) m "
+                 "ON p.asin = m.asin AND p.fetched_at = m.latest ORDER BY p.asin")
+        with self._lock:
+            rows = self._conn.execute(query).fetchall()
+        pages = [ArchivedPage(*row[:6], bool(row[6])) for row in rows]
+        if asins is not None:
+            wanted = set(asins)
+            pages = [page for page in pages if page.asin in wanted]
+        return pages
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            fetches, asins, raw = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT asin), COALESCE(SUM(size), 0) FROM pages"
+            ).fetchone()
+            blobs = self._conn.execute("SELECT COUNT(DISTINCT digest) FROM pages").fetchone()[0]
+        on_disk = sum(entry.stat().st_size for entry in self.objects.glob("*/*"))
+        return {"fetches": fetches, "asins": asins, "blobs": blobs, "raw_bytes": raw, "bytes_on_disk": on_disk}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Per-process state for reextract() workers
+_worker: Dict[str, object] = {}
+
+
+def _init_worker(root: str):
+    _worker["objects"] = Path(root) / "objects"
+    _worker["classifier"] = TitleClassifier()
+
+
+def _reextract_batch(batch: List[Tuple[str, int, Optional[str], str]]) -> List[ValidationResult]:
+    objects: Path = _worker["objects"]
+    classifier: TitleClassifier = _worker["classifier"]
+    results = []
+    for asin, status_code, encoding, digest in batch:
+        with open(objects / digest[:2] / digest[2:], 'rb') as f:
+            text = zlib.decompress(f.read()).decode(encoding or 'utf-8', errors='replace')
+        results.append(result_from_page(asin, status_code, extract_html(text), classifier))
+    return results
+
+
+def reextract(archive: PageArchive, asins: Optional[List[str]] = None, processes: Optional[int] = None,
+              batch_size: int = 200) -> Iterator[ValidationResult]:
+    """
+    Re-run extraction and classification over each ASIN's latest archived page.
+
+    Batches are spread over `processes` worker processes (default: all cores);
+    results come back in ASIN order regardless of which worker finished first.
+    """
+    pages = [(page.asin, page.status_code, page.encoding, page.digest) for page in archive.latest(asins)]
+    batches = [pages[i:i + batch_size] for i in range(0, len(pages), batch_size)]
+    if not batches:
+        return
+    if processes == 1:
+        _init_worker(str(archive.root))
+        for batch in batches:
+            yield from _reextract_batch(batch)
+        return
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                             initargs=(str(archive.root),)) as executor:
+        for results in executor.map(_reextract_batch, batches):
+            yield from results
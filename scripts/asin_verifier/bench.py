@@ -0,0 +1,146 @@
+"""
+Verifier throughput benchmark against the local Amazon stand-in
+
+Runs ASINVerifier.validate_many over the same synthetic ASIN list at several
+concurrency levels and reports ASINs/sec, per-ASIN latency percentiles,
+outcome counts, connection reuse and memory, so scaling changes can be
+compared run to run without touching amazon.com.
+"""
+
+import math
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from .metrics import VerifierMetrics
+from .scheduler import FetchScheduler
+from .standin import AmazonStandIn, StandInConfig
+from .verifier import ASINVerifier, ValidationResult
+
+
+@dataclass
+class BenchReport:
+    concurrency: int
+    asins: int
+    seconds: float
+    throughput: float
+    p50_ms: float
+    p99_ms: float
+    peak_mem_mb: float
+    valid: int
+    outcomes: Dict[str, int] = field(default_factory=dict)
+    connections: Dict[str, int] = field(default_factory=dict)
+    server: Dict[str, int] = field(default_factory=dict)
+    phases_p50_ms: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty sample"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def synthetic_asins(count: int, offset: int = 0) -> List[str]:
+    return [f"B0{i:08d}" for i in range(offset, offset + count)]
+
+
+def _outcome(result: ValidationResult) -> str:
+    if result.valid:
+        return "valid"
+    if result.status_code == 404:
+        return "not_found"
+    if result.title == "Throttled":
+        return "throttled"
+    if result.status_code == 200:
+        return "not_gpu"
+    return f"status_{result.status_code}" if result.status_code else "error"
+
+
+def run_level(base_url: str, asins: Sequence[str], concurrency: int, scheduler: FetchScheduler,
+              track_memory: bool = True) -> BenchReport:
+    """Validate `asins` once at a fixed concurrency and measure it"""
+    # Exact per-call timings for p50/p99: the histograms' buckets are too coarse to show a tail regression
+    metrics = VerifierMetrics(keep_samples=True)
+    verifier = ASINVerifier(scheduler=scheduler, pool_size=concurrency, base_url=base_url, metrics=metrics)
+    outcomes: Counter = Counter()
+
+    if track_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    valid = 0
+    for _, result in verifier.validate_many(asins, concurrency=concurrency):
+        outcomes[_outcome(result)] += 1
+        valid += result.valid
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] if track_memory else 0
+    if track_memory:
+        tracemalloc.stop()
+
+    connections = verifier.connection_stats()
+    verifier.close()
+    return BenchReport(
+        concurrency=concurrency,
+        asins=len(asins),
+        seconds=round(elapsed, 3),
+        throughput=round(len(asins) / elapsed, 1) if elapsed else 0.0,
+        p50_ms=round(percentile(metrics.samples, 50) * 1000, 1),
+        p99_ms=round(percentile(metrics.samples, 99) * 1000, 1),
+        peak_mem_mb=round(peak / 1024 / 1024, 2),
+        valid=valid,
+        outcomes=dict(outcomes),
+        connections=connections,
+        phases_p50_ms={
+            name: round(histogram.quantile(0.5) * 1000, 2)
+            for name, histogram in metrics.histograms.items() if histogram.count
+        },
+    )
+
+
+def run_bench(levels: Sequence[int], count: int, config: Optional[StandInConfig] = None,
+              rate: float = 500.0, max_rate: float = 2000.0, track_memory: bool = True,
+              url: Optional[str] = None) -> List[BenchReport]:
+    """
+    Benchmark each concurrency level in turn against a stand-in server.
+
+    An in-process stand-in is started unless `url` points at one already running
+    (e.g. `asin-verify-cli.py standin` in another process, which keeps server
+    CPU out of the client's GIL at high concurrency). Each level gets a fresh
+    verifier and scheduler, so AIMD state does not leak between levels, and a
+    disjoint ASIN range, so nothing is served warm.
+    """
+    standin = AmazonStandIn(config).start() if url is None else None
+    base_url = standin.url if standin is not None else url
+    reports = []
+    try:
+        for n, level in enumerate(levels):
+            before = dict(standin.counters) if standin is not None else {}
+            scheduler = FetchScheduler(rate=rate, max_rate=max_rate, burst=max(4.0, float(level)),
+                                       initial_concurrency=level, max_concurrency=level, base_delay=0.2)
+            report = run_level(base_url, synthetic_asins(count, offset=n * count), level, scheduler, track_memory)
+            if standin is not None:
+                report.server = {k: v - before.get(k, 0) for k, v in standin.counters.items()}
+            reports.append(report)
+    finally:
+        if standin is not None:
+            standin.stop()
+    return reports
+
+
+def format_table(reports: Sequence[BenchReport]) -> str:
+    header = f"{'conc':>5} {'asins':>6} {'secs':>8} {'asins/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'mem MB':>7} {'reused':>7}  outcomes"
+    rows = [header, "-" * len(header)]
+    for r in reports:
+        outcomes = ", ".join(f"{k}={v}" for k, v in sorted(r.outcomes.items()))
+        rows.append(
+            f"{r.concurrency:>5} {r.asins:>6} {r.seconds:>8.2f} {r.throughput:>9.1f} {r.p50_ms:>8.1f} "
+            f"{r.p99_ms:>8.1f} {r.peak_mem_mb:>7.2f} {r.connections.get('connections_reused', 0):>7}  {outcomes}"
+        )
+    return "\n".join(rows)
@@ -0,0 +1,158 @@
+"""
+Persistent TTL cache of ValidationResults keyed by ASIN
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from .verifier import ValidationResult, is_definitive
+
+DAY = 24 * 60 * 60
+
+
+@dataclass
+class CacheEntry:
+    result: ValidationResult
+    fetched_at: float
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+class ResultCache:
+    """
+    SQLite-backed cache of validation results.
+
+    Found products and 404s expire independently (`ttl` / `not_found_ttl`).
+    Throttled, errored and other non-definitive results are never stored, so
+    they are always retried on the next run.
+    """
+
+    DEFAULT_PATH = "exports/asin-cache.sqlite"
+
+    def __init__(self, path: str = DEFAULT_PATH, ttl: float = 7 * DAY, not_found_ttl: float = 30 * DAY):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.not_found_ttl = not_found_ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                asin TEXT PRIMARY KEY,
+                result TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_expires ON results(expires_at)")
+        self._conn.commit()
+
+    def ttl_for(self, result: ValidationResult) -> float:
+        """Seconds a result stays fresh; 0 means it is not cacheable"""
+        if not is_definitive(result):
+            return 0
+        return self.not_found_ttl if result.status_code == 404 else self.ttl
+
+    def get(self, asin: str) -> Optional[CacheEntry]:
+        """Return the stored entry for an ASIN, fresh or stale"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, fetched_at, expires_at, etag, last_modified FROM results WHERE asin = ?",
+                (asin,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(
+            result=ValidationResult(**json.loads(row[0])),
+            fetched_at=row[1],
+            expires_at=row[2],
+            etag=row[3],
+            last_modified=row[4],
+        )
+
+    def fetched_times(self) -> Dict[str, float]:
+        """When each cached ASIN was last fetched (or revalidated), fresh or stale"""
+        with self._lock:
+            rows = self._conn.execute("SELECT asin, fetched_at FROM results").fetchall()
+        return dict(rows)
+
+    def put(self, result: ValidationResult, etag: Optional[str] = None, last_modified: Optional[str] = None) -> bool:
+        """Store a result if it is cacheable; returns whether it was stored"""
+        ttl = self.ttl_for(result)
+        if ttl <= 0:
+            return False
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (result.asin, json.dumps(asdict(result)), result.status_code, now, now + ttl, etag, last_modified),
+            )
+            self._conn.commit()
+        return True
+
+    def touch(self, entry: CacheEntry):
+        """Renew an entry after a 304 Not Modified revalidation"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE results SET fetched_at = ?, expires_at = ? WHERE asin = ?",
+                (now, now + self.ttl_for(entry.result), entry.result.asin),
+            )
+            self._conn.commit()
+            self.revalidated += 1
+
+    def record_lookup(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def purge_expired(self, grace: float = 0) -> int:
+        """Delete entries expired for longer than `grace` seconds"""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM results WHERE expires_at < ?", (time.time() - grace,))
+            self._conn.commit()
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            total, fresh = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(expires_at > ?), 0) FROM results", (time.time(),)
+            ).fetchone()
+        return {
+            "entries": total,
+            "fresh": fresh,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,120 @@
+"""
+Compiled GPU title classifier
+
+GPU keywords, brands, VRAM and model tiers are one compiled alternation with
+word boundaries. classify_many() lowercases each title of a batch, joins them
+into one newline-separated text and scans it in a single pass, mapping each
+match back to its title by offset. Reclassifying the whole seed catalog is one
+regex pass rather than a lower() and substring test per keyword per title.
+
+Whole systems and CPUs are excluded, but explicit card evidence wins: a title
+saying "graphics card" or "video card" is a GPU whatever else it mentions,
+and a chip model ("RTX 4060") outweighs the PC a card is sold "for".
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+# Board partners win over chip vendors: "MSI GeForce RTX 4070 (NVIDIA)" is an MSI card
+PARTNER_BRANDS = [
+    'ASUS', 'MSI', 'Gigabyte', 'PowerColor', 'Sapphire', 'XFX', 'ASRock', 'PNY', 'Palit',
+    'Zotac', 'EVGA', 'Gainward', 'Inno3D', 'Sparkle', 'Yeston', 'Biostar', 'Acer',
+]
+CHIP_BRANDS = ['NVIDIA', 'AMD', 'Intel']
+
+_CANONICAL: Dict[str, str] = {b.lower(): b for b in PARTNER_BRANDS + CHIP_BRANDS}
+
+# One alternation over the lowercased batch; a tier match ("rtx 4070 ti") also
+# marks the title as a GPU. Only horizontal whitespace inside patterns, so a
+# match never crosses from one title into the next.
+_TOKENS = re.compile(
+    r'\b(?:(?P<tier>(?:rtx|gtx)[ \t]?\d{3,4}(?:[ \t]?(?:ti[ \t]super|ti|super))?'
+    r'|rx[ \t]?\d{3,4}(?:[ \t]?(?:xtx|xt|gre))?|arc[ \t]?[ab]\d{3})'
+    r'|(?P<card>(?:graphics|video)[ \t]+card)'
+    r'|(?P<gpu>gpu|geforce|radeon|quadro|rtx|gtx)'
+    # Laptops and CPUs name their integrated/bundled graphics: only "graphics card" overrides
+    r'|(?P<not_gpu>processor|laptop|notebook)'
+    # Cards are sold "for" a PC: a chip model or "graphics card" overrides
+    r'|(?P<system>desktop[ \t]+computer|gaming[ \t]+pc)'
+    r'|(?P<brand>' + '|'.join(re.escape(b) for b in _CANONICAL) + r')'
+    r'|(?P<vram>\d{1,3})[ \t]?gb)\b'
+)
+_TIER_PARTS = re.compile(r'rtx|gtx|rx|arc|ti|super|xtx|xt|gre|[ab]?\d+')
+_TIER_CASE = {'rtx': 'RTX', 'gtx': 'GTX', 'rx': 'RX', 'arc': 'Arc', 'ti': 'Ti', 'super': 'Super',
+              'xtx': 'XTX', 'xt': 'XT', 'gre': 'GRE'}
+
+
+@dataclass(frozen=True)
+class TitleClass:
+    is_gpu: bool
+    brand: Optional[str] = None
+    vram: Optional[str] = None
+    tier: Optional[str] = None
+
+
+def _tier_name(value: str) -> str:
+    """'rtx4070 ti super' -> 'RTX 4070 Ti Super'"""
+    return " ".join(_TIER_CASE.get(part, part.upper()) for part in _TIER_PARTS.findall(value))
+
+
+class TitleClassifier:
+    """Classifies product titles: is it a GPU, and which brand, VRAM and model tier"""
+
+    def classify(self, title: str) -> TitleClass:
+        return self.classify_many([title])[0]
+
+    def classify_many(self, titles: Sequence[str]) -> List[TitleClass]:
+        """Classify a batch of titles with one regex pass over the joined text"""
+        count = len(titles)
+        if count == 0:
+            return []
+
+        # Lowered per title: lower() can change a string's length ('İ'), so offsets come after it
+        lowered = [title.replace("\n", " ").lower() for title in titles]
+        starts: List[int] = []
+        offset = 0
+        for title in lowered:
+            starts.append(offset)
+            offset += len(title) + 1
+        text = "\n".join(lowered)
+
+        is_gpu = [False] * count
+        card = [False] * count
+        excluded = [False] * count
+        system = [False] * count
+        partner: List[Optional[str]] = [None] * count
+        chip: List[Optional[str]] = [None] * count
+        vram: List[Optional[str]] = [None] * count
+        tier: List[Optional[str]] = [None] * count
+
+        for match in _TOKENS.finditer(text):
+            index = bisect_right(starts, match.start()) - 1
+            kind = match.lastgroup
+            if kind == 'tier':
+                is_gpu[index] = True
+                if tier[index] is None:
+                    tier[index] = _tier_name(match.group(kind))
+            elif kind == 'card':
+                is_gpu[index] = card[index] = True
+            elif kind == 'gpu':
+                is_gpu[index] = True
+            elif kind == 'not_gpu':
+                excluded[index] = True
+            elif kind == 'system':
+                system[index] = True
+            elif kind == 'brand':
+                brand = _CANONICAL[match.group(kind)]
+                if brand in CHIP_BRANDS:
+                    chip[index] = chip[index] or brand
+                else:
+                    partner[index] = partner[index] or brand
+            elif vram[index] is None:
+                vram[index] = f"{int(match.group(kind))}GB"
+
+        return [
+            TitleClass(is_gpu=card[i] or (is_gpu[i] and not excluded[i] and (tier[i] is not None or not system[i])),
+                       brand=partner[i] or chip[i], vram=vram[i], tier=tier[i])
+            for i in range(count)
+        ]
@@ -0,0 +1,630 @@
+"""
+Headless ASIN verification (no tkinter)
+
+Reads ASINs from a file or stdin and streams one JSON object per result to
+stdout as validations finish. Progress goes to stderr so stdout stays a clean
+JSON Lines stream for pipes and cron jobs.
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import IO, Iterator, List, Optional
+
+from .archive import PageArchive, reextract
+from .bench import format_table, run_bench
+from .cache import DAY, ResultCache
+from .classifier import TitleClassifier
+from .export import WRITERS, open_writer
+from .inputs import AsinLoader
+from .journal import ValidationJournal
+from .negative import NegativeFilter
+from .prices import PriceHistory
+from .revalidate import RevalidationPlanner, within_budget
+from .seed import DEFAULT_SEED_PATH, load_seed, upsert_seed
+from .seedstore import SeedStore
+from .shards import ShardJob, ShardWorker
+from .standin import AmazonStandIn, StandInConfig
+from .verifier import ASINVerifier, ValidationResult
+
+
+def result_record(index: int, result: ValidationResult) -> dict:
+    return {"index": index, **asdict(result)}
+
+
+def read_results(stream: IO[str]) -> Iterator[ValidationResult]:
+    """Parse `validate` output (JSON Lines result records) back into results"""
+    for line in stream:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        record.pop("index", None)
+        yield ValidationResult(**record)
+
+
+class Progress:
+    """Periodic one-line progress reports on stderr"""
+
+    def __init__(self, verifier: ASINVerifier, stream: IO[str] = sys.stderr, interval: float = 2.0,
+                 quiet: bool = False, metrics_path: Optional[str] = None):
+        self.verifier = verifier
+        self.metrics_path = metrics_path
+        self.stream = stream
+        self.interval = interval
+        self.quiet = quiet
+        self.done = 0
+        self.valid = 0
+        self.started = time.monotonic()
+        self._last = 0.0
+
+    def update(self, result: ValidationResult):
+        self.done += 1
+        self.valid += result.valid
+        now = time.monotonic()
+        if now - self._last >= self.interval:
+            self._last = now
+            if self.metrics_path:
+                self.verifier.metrics.write(self.metrics_path)
+            if not self.quiet:
+                self._emit(now)
+
+    def _emit(self, now: float):
+        rate = self.done / max(now - self.started, 1e-9)
+        print(f"[asin-verify] {self.done} validated, {self.valid} valid, {rate:.1f} ASINs/s "
+              f"(now {self.verifier.metrics.summary()})", file=self.stream, flush=True)
+
+    def finish(self):
+        if self.metrics_path:
+            self.verifier.metrics.write(self.metrics_path)
+        if self.quiet:
+            return
+        self._emit(time.monotonic())
+        print(f"[asin-verify] connections: {self.verifier.connection_stats()}", file=self.stream, flush=True)
+        if self.verifier.cache is not None:
+            print(f"[asin-verify] cache: {self.verifier.cache.stats()}", file=self.stream, flush=True)
+        if self.verifier.negative is not None:
+            print(f"[asin-verify] known dead: {self.verifier.negative.stats()}", file=self.stream, flush=True)
+
+
+def build_verifier(args: argparse.Namespace) -> ASINVerifier:
+    cache = None
+    if not args.no_cache:
+        cache = ResultCache(args.cache_path, ttl=args.ttl_days * DAY, not_found_ttl=args.not_found_ttl_days * DAY)
+    negative = None
+    if not args.no_negative:
+        negative = NegativeFilter(args.negative_path, ttl=args.dead_ttl_days * DAY,
+                                  non_gpu_ttl=args.non_gpu_ttl_days * DAY)
+    verifier = ASINVerifier(pool_size=max(args.concurrency, 1), deadline=args.deadline, cache=cache,
+                            base_url=args.base_url, negative=negative,
+                            archive=PageArchive(args.archive) if args.archive else None)
+    verifier.skip_known_dead = not args.recheck_dead
+    return verifier
+
+
+def cmd_validate(args: argparse.Namespace) -> int:
+    loader = AsinLoader(dedupe=not args.keep_duplicates)
+    asins = loader.lines(sys.stdin) if args.input == '-' else loader.file(args.input)
+    verifier = build_verifier(args)
+    progress = Progress(verifier, quiet=args.quiet, metrics_path=args.metrics)
+    out = sys.stdout
+    writer = open_writer(args.output, append=args.append) if args.output else None
+
+    journal = None
+    done = {}
+    if args.journal or args.resume:
+        journal = ValidationJournal(args.journal or ValidationJournal.DEFAULT_PATH)
+        if args.resume:
+            done = journal.load()
+            if not args.quiet:
+                print(f"[asin-verify] resuming: {len(done)} ASINs already settled in {journal.path}",
+                      file=sys.stderr, flush=True)
+        else:
+            journal.reset()
+
+    prices = None if args.no_price_history else PriceHistory(args.price_history)
+    priced: List[ValidationResult] = []
+    run_started = time.time()
+
+    try:
+        for index, result in verifier.validate_many(asins, concurrency=args.concurrency,
+                                                    known=done.get):
+            if prices is not None and result.valid and result.price:
+                priced.append(result)
+                if len(priced) >= 10_000:
+                    prices.record(priced, when=run_started)
+                    priced.clear()
+            if journal is not None and done.get(result.asin) is not result:
+                journal.append(result)
+                done[result.asin] = result
+            if writer is not None:
+                writer.write(result)
+            else:
+                out.write(json.dumps(result_record(index, result)) + "\n")
+                out.flush()
+            progress.update(result)
+    finally:
+        if prices is not None:
+            prices.record(priced, when=run_started)
+        progress.finish()
+        verifier.close()
+        if writer is not None:
+            writer.close()
+        if journal is not None:
+            journal.close()
+        asins.close()
+        if not args.quiet:
+            print(f"[asin-verify] input: {loader.stats.summary()}", file=sys.stderr, flush=True)
+            for reason, samples in loader.stats.samples.items():
+                if reason != "duplicate":
+                    print(f"[asin-verify]   {reason}: {', '.join(samples)}", file=sys.stderr, flush=True)
+    return 0
+
+
+def cmd_revalidate(args: argparse.Namespace) -> int:
+    """Validate the stalest, most valuable seed products first, within a request/time budget"""
+    verifier = build_verifier(args)
+    prices = None if args.no_price_history else PriceHistory(args.price_history)
+
+    verified_at = verifier.cache.fetched_times() if verifier.cache is not None else {}
+    volatility = {}
+    planner = RevalidationPlanner(stale_after_days=args.stale_after_days, min_age_days=args.min_age_days)
+    if prices is not None:
+        for asin, (when, _) in prices.latest().items():
+            verified_at[asin] = max(when, verified_at.get(asin, when))
+        volatility = prices.volatility(days=planner.volatility_days)
+    items = planner.plan(load_seed(args.seed), verified_at, volatility, categories=args.category)
+
+    if args.plan:
+        verifier.close()
+        for item in items[:args.limit]:
+            sys.stdout.write(json.dumps(asdict(item)) + "\n")
+        if not args.quiet:
+            print(f"[asin-verify] {len(items)} seed products due for revalidation", file=sys.stderr)
+        return 0
+
+    # Scheduled products are due by our own measure: refetch even if the cache still calls them fresh
+    verifier.serve_cached = False
+    progress = Progress(verifier, quiet=args.quiet, metrics_path=args.metrics)
+    writer = open_writer(args.output, append=args.append) if args.output else None
+    priced: List[ValidationResult] = []
+    run_started = time.time()
+    try:
+        asins = within_budget(items, limit=args.limit, seconds=args.time_budget)
+        for index, result in verifier.validate_many(asins, concurrency=args.concurrency):
+            if prices is not None and result.valid and result.price:
+                priced.append(result)
+            if writer is not None:
+                writer.write(result)
+            else:
+                sys.stdout.write(json.dumps(result_record(index, result)) + "\n")
+                sys.stdout.flush()
+            progress.update(result)
+    finally:
+        if prices is not None:
+            prices.record(priced, when=run_started)
+        progress.finish()
+        verifier.close()
+        if writer is not None:
+            writer.close()
+        if not args.quiet:
+            print(f"[asin-verify] revalidated {progress.done} of {len(items)} due seed products",
+                  file=sys.stderr, flush=True)
+    return 0
+
+
+def cmd_reclassify(args: argparse.Namespace) -> int:
+    """Re-run the title classifier over the seed catalog offline, JSONL to stdout"""
+    with open(args.seed) as f:
+        seed = json.load(f)
+
+    products = [
+        (category, product)
+        for category, items in seed.get("products", {}).items()
+        if isinstance(items, list) and (args.category is None or category == args.category)
+        for product in items
+    ]
+    classes = TitleClassifier().classify_many([product.get("title", "") for _, product in products])
+
+    changed = 0
+    for (category, product), cls in zip(products, classes):
+        differs = (cls.brand or product.get("brand")) != product.get("brand") or \
+            (cls.vram or product.get("vram")) != product.get("vram")
+        changed += differs
+        if args.changed_only and not differs:
+            continue
+        record = {
+            "asin": product.get("asin"),
+            "category": category,
+            "is_gpu": cls.is_gpu,
+            "brand": cls.brand,
+            "vram": cls.vram,
+            "tier": cls.tier,
+            "seed_brand": product.get("brand"),
+            "seed_vram": product.get("vram"),
+            "changed": differs,
+        }
+        sys.stdout.write(json.dumps(record) + "\n")
+
+    if not args.quiet:
+        print(f"[asin-verify] reclassified {len(products)} products, {changed} differ from seed",
+              file=sys.stderr)
+    return 0
+
+
+def cmd_seed_upsert(args: argparse.Namespace) -> int:
+    """Merge `validate` results into the seed catalog by ASIN"""
+    source = sys.stdin if args.results == '-' else open(args.results, 'r')
+    try:
+        previous = PriceHistory(args.price_history).previous_prices() if Path(args.price_history).exists() else None
+        diff = upsert_seed(read_results(source), path=args.seed, category=args.category, dry_run=args.dry_run,
+                           previous_prices=previous)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    if args.dry_run:
+        print(diff.format(limit=args.limit))
+    elif not args.quiet:
+        state = "written" if diff.changed else "unchanged"
+        print(f"[asin-verify] {args.seed} {state}: {diff.summary()}", file=sys.stderr)
+    return 0
+
+
+def cmd_seed_store(args: argparse.Namespace) -> int:
+    """Query the indexed seed store, importing the JSON catalog first if it changed"""
+    with SeedStore(args.store) as store:
+        if args.action == "export":
+            store.export(args.seed)
+            print(f"[asin-verify] exported {len(store)} products to {args.seed}", file=sys.stderr)
+            return 0
+
+        imported = store.import_json(args.seed) if args.action == "import" else None
+        if imported is None and store.sync(args.seed) and not args.quiet:
+            print(f"[asin-verify] re-indexed {args.seed}", file=sys.stderr)
+
+        if args.action == "import":
+            print(f"[asin-verify] indexed {imported} products from {args.seed}", file=sys.stderr)
+        elif args.action == "get":
+            for asin in args.asins:
+                for category, position, product in store.find(asin.upper()):
+                    sys.stdout.write(json.dumps({"category": category, "position": position, **product}) + "\n")
+        elif args.action == "list":
+            products = store.by_brand(args.brand, args.category) if args.brand else \
+                store.category(args.category or "gpu")
+            for product in products:
+                sys.stdout.write(json.dumps(product) + "\n")
+        elif args.action == "dups":
+            for asin, places in store.duplicates().items():
+                sys.stdout.write(json.dumps({"asin": asin, "places": places}) + "\n")
+        else:
+            print(json.dumps({"products": len(store), "categories": store.categories()}))
+    return 0
+
+
+def cmd_prices(args: argparse.Namespace) -> int:
+    """Query the price history recorded by validation runs"""
+    history = PriceHistory(args.price_history)
+    if args.action == "drops":
+        moves = history.largest_drops(days=args.days, limit=args.limit)
+    elif args.action == "lows":
+        moves = history.at_low(days=args.days)[:args.limit]
+    elif args.action == "history":
+        for asin in args.asins:
+            for when, price in history.series(asin.upper()):
+                sys.stdout.write(json.dumps({"asin": asin.upper(), "at": when, "price": price}) + "\n")
+        return 0
+    elif args.action == "compact":
+        history.compact()
+        print(json.dumps(history.stats()))
+        return 0
+    else:
+        print(json.dumps(history.stats()))
+        return 0
+
+    for move in moves:
+        record = {"asin": move.asin, "price": move.current, "reference": move.reference,
+                  "change": move.change, "change_pct": move.change_pct, "at": move.observed_at}
+        sys.stdout.write(json.dumps(record) + "\n")
+    return 0
+
+
+def cmd_archive(args: argparse.Namespace) -> int:
+    """Re-extract from or inspect the archive of fetched pages"""
+    with PageArchive(args.archive) as archive:
+        if args.action == "stats":
+            print(json.dumps(archive.stats()))
+            return 0
+        if args.action == "history":
+            for asin in args.asins:
+                for page in archive.history(asin.upper()):
+                    sys.stdout.write(json.dumps(asdict(page)) + "\n")
+            return 0
+
+        started = time.perf_counter()
+        asins = [asin.upper() for asin in args.asins] or None
+        writer = open_writer(args.output) if args.output else None
+        count = 0
+        try:
+            for count, result in enumerate(reextract(archive, asins, processes=args.processes), start=1):
+                if writer is not None:
+                    writer.write(result)
+                else:
+                    sys.stdout.write(json.dumps(result_record(count - 1, result)) + "\n")
+        finally:
+            if writer is not None:
+                writer.close()
+        if not args.quiet:
+            print(f"[asin-verify] re-extracted {count} archived pages in {time.perf_counter() - started:.1f}s",
+                  file=sys.stderr)
+    return 0
+
+
+def run_shard_worker(args: argparse.Namespace, worker_id: Optional[str] = None) -> int:
+    job = ShardJob(args.work_dir)
+    verifier = build_verifier(args)
+    worker = ShardWorker(job, verifier, concurrency=args.concurrency, worker_id=worker_id, poll=args.poll)
+
+    def report(shard: int):
+        if not args.quiet:
+            state = "done" if shard in worker.completed else "lost lease, abandoned"
+            print(f"[asin-verify] {worker.worker_id}: shard {job.name(shard)} {state} "
+                  f"({verifier.metrics.summary()})", file=sys.stderr, flush=True)
+
+    try:
+        return worker.run(on_shard=report)
+    finally:
+        verifier.close()
+
+
+def _local_worker(args: argparse.Namespace, number: int):
+    run_shard_worker(args, worker_id=f"local-{number}")
+
+
+def cmd_shard(args: argparse.Namespace) -> int:
+    """Sharded runs: plan a job directory, work it from any number of nodes, merge the results"""
+    if args.action == "plan":
+        loader = AsinLoader()
+        asins = loader.lines(sys.stdin) if args.input == '-' else loader.file(args.input)
+        try:
+            job = ShardJob.create(args.work_dir, asins, shards=args.shards, lease_seconds=args.lease_seconds)
+        finally:
+            asins.close()
+        if not args.quiet:
+            print(f"[asin-verify] {job.config['asins']} ASINs in {job.shards} shards under {job.root} "
+                  f"({loader.stats.summary()})", file=sys.stderr)
+        return 0
+
+    job = ShardJob(args.work_dir)
+    if args.action == "status":
+        if args.reap:
+            job.reap()
+        print(json.dumps(job.status()))
+    elif args.action == "work":
+        finished = run_shard_worker(args, worker_id=args.worker_id)
+        if not args.quiet:
+            print(f"[asin-verify] no shards left; this worker finished {finished}", file=sys.stderr)
+    elif args.action == "run":
+        # Local stand-in for a fleet: N worker processes on this machine, same protocol
+        workers = [multiprocessing.Process(target=_local_worker, args=(args, number))
+                   for number in range(args.workers)]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join()
+        if not job.finished():
+            print(f"[asin-verify] workers exited with shards unfinished: {job.status()}", file=sys.stderr)
+            return 1
+        if args.output:
+            rows = job.merge(args.output)
+            print(f"[asin-verify] merged {rows} results into {args.output}", file=sys.stderr)
+    else:
+        if not args.output:
+            print("[asin-verify] merge needs -o/--output", file=sys.stderr)
+            return 2
+        try:
+            rows = job.merge(args.output)
+        except RuntimeError as e:
+            print(f"[asin-verify] {e}", file=sys.stderr)
+            return 1
+        if not args.quiet:
+            print(f"[asin-verify] merged {rows} results into {args.output}", file=sys.stderr)
+    return 0
+
+
+def standin_config(args: argparse.Namespace) -> StandInConfig:
+    return StandInConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        not_found_rate=args.not_found_rate,
+        throttle_rps=args.throttle_rps,
+        page_kb=args.page_kb,
+        pages_dir=args.pages_dir,
+    )
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    levels = [int(level) for level in args.levels.split(",") if level.strip()]
+    reports = run_bench(levels, args.count, standin_config(args), rate=args.rate, max_rate=args.max_rate,
+                        track_memory=not args.no_memory, url=args.url)
+    if args.json:
+        for report in reports:
+            sys.stdout.write(json.dumps(report.to_dict()) + "\n")
+    else:
+        print(format_table(reports))
+    return 0
+
+
+def cmd_standin(args: argparse.Namespace) -> int:
+    standin = AmazonStandIn(standin_config(args), port=args.port)
+    print(f"[asin-verify] Amazon stand-in serving {standin.url}/dp/<ASIN>; use --base-url {standin.url}",
+          file=sys.stderr, flush=True)
+    standin.serve_forever()
+    return 0
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def add_standin_options(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency", type=float, default=0.05, help="mean server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of HTTP 500 responses")
+    parser.add_argument("--not-found-rate", type=float, default=0.05, help="share of ASINs that 404")
+    parser.add_argument("--throttle-rps", type=float, default=0.0, help="server 503/captcha above this rate")
+    parser.add_argument("--page-kb", type=int, default=200, help="synthetic page size")
+    parser.add_argument("--pages-dir", help="serve recorded <ASIN>.html pages from here when present")
+
+
+def add_verifier_options(parser: argparse.ArgumentParser):
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="parallel requests (default: 8)")
+    parser.add_argument("--deadline", type=float, default=30.0, help="total seconds per ASIN incl. retries")
+    parser.add_argument("--base-url", default="https://www.amazon.com", help="storefront origin (e.g. a stand-in)")
+    parser.add_argument("--no-cache", action="store_true", help="always fetch, ignore the result cache")
+    parser.add_argument("--cache-path", default=ResultCache.DEFAULT_PATH)
+    parser.add_argument("--ttl-days", type=float, default=7, help="freshness of found products")
+    parser.add_argument("--not-found-ttl-days", type=float, default=30, help="freshness of 404s")
+    parser.add_argument("--no-negative", action="store_true", help="don't consult or update the known-dead filter")
+    parser.add_argument("--recheck-dead", action="store_true", help="fetch known 404 / non-GPU ASINs anyway")
+    parser.add_argument("--negative-path", default=NegativeFilter.DEFAULT_PATH)
+    parser.add_argument("--dead-ttl-days", type=float, default=30, help="how long a 404 is trusted")
+    parser.add_argument("--non-gpu-ttl-days", type=float, default=90, help="how long a non-GPU listing is trusted")
+    parser.add_argument("--archive", help="store every fetched page here for offline re-extraction "
+                                          f"(e.g. {PageArchive.DEFAULT_PATH})")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress on stderr")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="asin-verify-cli", description="Headless DXM369 ASIN verification")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser("validate", help="validate ASINs, JSONL results to stdout")
+    validate.add_argument("input", nargs="?", default="-",
+                          help="ASIN list (txt, JSONL, CSV or JSON by extension); '-' for stdin")
+    validate.add_argument("--keep-duplicates", action="store_true",
+                          help="emit a result for every repeated input ASIN (still fetched once)")
+    validate.add_argument("--journal", help=f"append each result here (default with --resume: "
+                                            f"{ValidationJournal.DEFAULT_PATH})")
+    validate.add_argument("--resume", action="store_true", help="skip ASINs the journal already settled")
+    validate.add_argument("-o", "--output", help=f"write results here instead of stdout ({', '.join(WRITERS)})")
+    validate.add_argument("--append", action="store_true", help="append to an existing --output export")
+    validate.add_argument("--price-history", default=PriceHistory.DEFAULT_PATH)
+    validate.add_argument("--metrics", help="keep phase timings/counters here (.prom = Prometheus text, else JSON)")
+    validate.add_argument("--no-price-history", action="store_true", help="don't record prices from this run")
+    add_verifier_options(validate)
+    validate.set_defaults(func=cmd_validate)
+
+    revalidate = commands.add_parser("revalidate", help="revalidate seed products by staleness and value")
+    revalidate.add_argument("--seed", default=DEFAULT_SEED_PATH)
+    revalidate.add_argument("--category", action="append", help="only this seed category (repeatable)")
+    revalidate.add_argument("--limit", type=int, help="request budget: validate at most this many products")
+    revalidate.add_argument("--time-budget", type=float, help="stop starting new validations after this many seconds")
+    revalidate.add_argument("--stale-after-days", type=float, default=7, help="age at which a product counts as stale")
+    revalidate.add_argument("--min-age-days", type=float, default=1, help="never revalidate anything younger")
+    revalidate.add_argument("--plan", action="store_true", help="print the ranked schedule, validate nothing")
+    revalidate.add_argument("-o", "--output", help=f"write results here instead of stdout ({', '.join(WRITERS)})")
+    revalidate.add_argument("--append", action="store_true", help="append to an existing --output export")
+    revalidate.add_argument("--price-history", default=PriceHistory.DEFAULT_PATH)
+    revalidate.add_argument("--no-price-history", action="store_true", help="don't use or record price history")
+    revalidate.add_argument("--metrics", help="keep phase timings/counters here (.prom = Prometheus text, else JSON)")
+    add_verifier_options(revalidate)
+    revalidate.set_defaults(func=cmd_revalidate)
+
+    reclassify = commands.add_parser("reclassify", help="classify seed titles offline (no network)")
+    reclassify.add_argument("seed", nargs="?", default="data/asin-seed.json")
+    reclassify.add_argument("--category", help="only this seed category (e.g. gpu)")
+    reclassify.add_argument("--changed-only", action="store_true", help="only products whose brand/VRAM differ")
+    reclassify.add_argument("-q", "--quiet", action="store_true")
+    reclassify.set_defaults(func=cmd_reclassify)
+
+    seed = commands.add_parser("seed-upsert", help="merge validate results into the seed catalog by ASIN")
+    seed.add_argument("results", nargs="?", default="-", help="JSONL from `validate`; '-' for stdin")
+    seed.add_argument("--seed", default=DEFAULT_SEED_PATH)
+    seed.add_argument("--category", default="gpu")
+    seed.add_argument("--dry-run", action="store_true", help="print the diff, leave the seed file untouched")
+    seed.add_argument("--limit", type=int, default=200, help="products listed in the dry-run diff")
+    seed.add_argument("--price-history", default=PriceHistory.DEFAULT_PATH, help="source of real previousPrice")
+    seed.add_argument("-q", "--quiet", action="store_true")
+    seed.set_defaults(func=cmd_seed_upsert)
+
+    prices = commands.add_parser("prices", help="price history queries (drops, lows vs window minimum)")
+    prices.add_argument("action", choices=["drops", "lows", "history", "stats", "compact"])
+    prices.add_argument("asins", nargs="*", help="ASINs for 'history'")
+    prices.add_argument("--days", type=float, default=7, help="window for drops/lows (default: 7)")
+    prices.add_argument("--limit", type=int, default=20)
+    prices.add_argument("--price-history", default=PriceHistory.DEFAULT_PATH)
+    prices.set_defaults(func=cmd_prices)
+
+    store = commands.add_parser("seed-store", help="indexed lookups over the seed catalog")
+    store.add_argument("action", choices=["import", "export", "get", "list", "dups", "stats"])
+    store.add_argument("asins", nargs="*", help="ASINs for 'get'")
+    store.add_argument("--seed", default=DEFAULT_SEED_PATH)
+    store.add_argument("--store", default=SeedStore.DEFAULT_PATH)
+    store.add_argument("--category", help="category for 'list' (default: gpu)")
+    store.add_argument("--brand", help="list products of this brand")
+    store.add_argument("-q", "--quiet", action="store_true")
+    store.set_defaults(func=cmd_seed_store)
+
+    shard = commands.add_parser("shard", help="split a run into shards worked by many nodes via a shared dir")
+    shard.add_argument("action", choices=["plan", "work", "run", "status", "merge"],
+                       help="plan: write shards; work: claim and validate shards until none are left; "
+                            "run: work a planned job with --workers local processes; status; merge")
+    shard.add_argument("work_dir", help="shared job directory (local disk or a network mount)")
+    shard.add_argument("input", nargs="?", default="-", help="ASIN list for 'plan'; '-' for stdin")
+    shard.add_argument("--shards", type=positive_int, default=64, help="shard count for 'plan' (default: 64)")
+    shard.add_argument("--lease-seconds", type=float, default=120.0,
+                       help="a shard whose worker misses heartbeats this long is reassigned")
+    shard.add_argument("--worker-id", help="name shown in leases (default: host-pid)")
+    shard.add_argument("--workers", type=int, default=4, help="local worker processes for 'run'")
+    shard.add_argument("--poll", type=float, default=5.0, help="seconds between checks while shards are leased")
+    shard.add_argument("--reap", action="store_true", help="'status': release expired leases first")
+    shard.add_argument("-o", "--output", help=f"merged export for 'merge'/'run' ({', '.join(WRITERS)})")
+    add_verifier_options(shard)
+    shard.set_defaults(func=cmd_shard)
+
+    archive = commands.add_parser("archive", help="re-extract results from archived pages, no network")
+    archive.add_argument("action", choices=["reextract", "stats", "history"])
+    archive.add_argument("asins", nargs="*", help="ASINs to re-extract / show (default for reextract: all)")
+    archive.add_argument("--archive", default=PageArchive.DEFAULT_PATH)
+    archive.add_argument("--processes", type=int, help="worker processes (default: all cores)")
+    archive.add_argument("-o", "--output", help=f"write results here instead of stdout ({', '.join(WRITERS)})")
+    archive.add_argument("-q", "--quiet", action="store_true")
+    archive.set_defaults(func=cmd_archive)
+
+    bench = commands.add_parser("bench", help="throughput benchmark against a local Amazon stand-in")
+    bench.add_argument("--count", type=int, default=500, help="ASINs per concurrency level")
+    bench.add_argument("--levels", default="1,4,16,32", help="comma-separated concurrency levels")
+    bench.add_argument("--rate", type=float, default=500.0, help="scheduler starting rate (req/s)")
+    bench.add_argument("--max-rate", type=float, default=2000.0, help="scheduler rate ceiling (req/s)")
+    bench.add_argument("--no-memory", action="store_true", help="skip tracemalloc (less overhead)")
+    bench.add_argument("--json", action="store_true", help="JSON Lines reports instead of a table")
+    bench.add_argument("--url", help="use an already running stand-in instead of an in-process one")
+    add_standin_options(bench)
+    bench.set_defaults(func=cmd_bench)
+
+    standin = commands.add_parser("standin", help="run the local Amazon stand-in server")
+    standin.add_argument("--port", type=int, default=8369)
+    add_standin_options(standin)
+    standin.set_defaults(func=cmd_standin)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # Downstream consumer (head, jq ...) went away
+        return 0
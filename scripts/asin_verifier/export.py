@@ -0,0 +1,299 @@
+"""
+Streaming result exporters shared by the GUI and CLI
+
+Every writer takes results one at a time and holds at most one row group in
+memory, so exporting a 100k-ASIN run costs the same memory as exporting ten.
+Formats are picked from the file extension:
+
+    .jsonl  JSON Lines, one result per line
+    .json   JSON array (streamed; appending splices into the existing array)
+    .csv    CSV with a header row
+    .colz   zip of per-column JSON arrays, one member per column per row group;
+            readers load only the columns they ask for (no dependencies)
+    .parquet  Apache Parquet, when pyarrow is installed
+
+All writers except Parquet can append to an existing export of the same format
+and field layout.
+"""
+
+import csv
+import json
+import os
+import zipfile
+from abc import ABC, abstractmethod
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Sequence
+
+from .verifier import ValidationResult
+
+FIELDS: List[str] = [f.name for f in fields(ValidationResult)]
+
+
+class ResultWriter(ABC):
+    """Base class: write() results one by one, close() when done"""
+
+    def __init__(self, path: str, append: bool = False):
+        self.path = Path(path)
+        self.append = append
+        self.rows = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @abstractmethod
+    def write(self, result: ValidationResult):
+        """Write one result"""
+
+    def write_many(self, results: Iterable[ValidationResult]) -> int:
+        for result in results:
+            self.write(result)
+        return self.rows
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _existing(self) -> bool:
+        return self.append and self.path.exists() and self.path.stat().st_size > 0
+
+    def _check_fields(self, existing: Sequence[str]):
+        """Appends must not mix column layouts (e.g. an export from before `tier`)"""
+        if list(existing) != FIELDS:
+            raise ValueError(f"Cannot append to {self.path}: it has fields {list(existing)}, "
+                             f"this version writes {FIELDS}; export to a new file")
+
+
+class JsonLinesWriter(ResultWriter):
+    def __init__(self, path: str, append: bool = False):
+        super().__init__(path, append)
+        if self._existing():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._check_fields(json.loads(f.readline()))
+        self._file: IO[str] = open(self.path, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, result: ValidationResult):
+        self._file.write(json.dumps(asdict(result)) + "\n")
+        self.rows += 1
+
+    def close(self):
+        self._file.close()
+
+
+class JsonArrayWriter(ResultWriter):
+    """Pretty JSON array written element by element"""
+
+    def __init__(self, path: str, append: bool = False):
+        super().__init__(path, append)
+        self._first = True
+        if self._existing():
+            existing = self._first_fields()
+            if existing is not None:
+                self._check_fields(existing)
+            self._file: IO[str] = self._reopen_array()
+        else:
+            self._file = open(self.path, 'w', encoding='utf-8')
+            self._file.write("[")
+
+    def _first_fields(self) -> Optional[List[str]]:
+        """Keys of the existing array's first element (None for an empty array), reading only its head"""
+        decoder = json.JSONDecoder()
+        with open(self.path, 'r', encoding='utf-8') as f:
+            text = f.read(4096)
+            while True:
+                body = text.lstrip()
+                if not body.startswith("["):
+                    raise ValueError(f"{self.path} is not a JSON array export")
+                body = body[1:].lstrip()
+                if body.startswith("]"):
+                    return None
+                try:
+                    return list(decoder.raw_decode(body)[0])
+                except json.JSONDecodeError:
+                    chunk = f.read(len(text))
+                    if not chunk:
+                        raise
+                    text += chunk
+
+    def _reopen_array(self) -> IO[str]:
+        """Drop the closing bracket of the existing array so new elements follow the old ones"""
+        with open(self.path, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            tail_start = max(0, end - 64)
+            f.seek(tail_start)
+            tail = f.read()
+            bracket = tail.rstrip().rfind(b"]")
+            if bracket < 0:
+                raise ValueError(f"{self.path} is not a JSON array export")
+            body = tail[:bracket].rstrip()
+            self._first = body.endswith(b"[")
+            f.truncate(tail_start + len(body))
+        return open(self.path, 'a', encoding='utf-8')
+
+    def write(self, result: ValidationResult):
+        item = json.dumps(asdict(result), indent=2).replace("\n", "\n  ")
+        self._file.write(("\n  " if self._first else ",\n  ") + item)
+        self._first = False
+        self.rows += 1
+
+    def close(self):
+        self._file.write("\n]\n" if not self._first else "]\n")
+        self._file.close()
+
+
+class CsvWriter(ResultWriter):
+    def __init__(self, path: str, append: bool = False):
+        super().__init__(path, append)
+        existing = self._existing()
+        if existing:
+            with open(self.path, 'r', newline='', encoding='utf-8') as f:
+                self._check_fields(next(csv.reader(f), []))
+        self._file: IO[str] = open(self.path, 'a' if append else 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=FIELDS)
+        if not existing:
+            self._writer.writeheader()
+
+    def write(self, result: ValidationResult):
+        self._writer.writerow(asdict(result))
+        self.rows += 1
+
+    def close(self):
+        self._file.close()
+
+
+class ColumnarZipWriter(ResultWriter):
+    """
+    Column-per-member zip archive.
+
+    Each row group of `group_size` results becomes one deflated member per
+    column (`g00000/asin.json`, ...), and a schema member records the row
+    groups. Appending adds row groups and a newer schema member; nothing
+    already written is rewritten.
+    """
+
+    SCHEMA_PREFIX = "_schema/"
+
+    def __init__(self, path: str, append: bool = False, group_size: int = 10_000):
+        super().__init__(path, append)
+        self.group_size = group_size
+        self._columns: Dict[str, List[Any]] = {name: [] for name in FIELDS}
+        self._groups: List[int] = []
+        self._revision = 0
+        if self._existing():
+            schema = read_colz_schema(self.path)
+            self._check_fields(schema["fields"])
+            self._groups = schema["row_groups"]
+            self._revision = schema["revision"] + 1
+            self._zip = zipfile.ZipFile(self.path, 'a', compression=zipfile.ZIP_DEFLATED)
+        else:
+            self._zip = zipfile.ZipFile(self.path, 'w', compression=zipfile.ZIP_DEFLATED)
+
+    def write(self, result: ValidationResult):
+        for name in FIELDS:
+            self._columns[name].append(getattr(result, name))
+        self.rows += 1
+        if len(self._columns["asin"]) >= self.group_size:
+            self._flush_group()
+
+    def _flush_group(self):
+        count = len(self._columns["asin"])
+        if not count:
+            return
+        group = f"g{len(self._groups):05d}"
+        for name, values in self._columns.items():
+            self._zip.writestr(f"{group}/{name}.json", json.dumps(values, separators=(",", ":")))
+            values.clear()
+        self._groups.append(count)
+
+    def close(self):
+        self._flush_group()
+        schema = {"format": "dxm-colz", "version": 1, "revision": self._revision, "fields": FIELDS,
+                  "row_groups": self._groups}
+        self._zip.writestr(f"{self.SCHEMA_PREFIX}{self._revision:05d}.json", json.dumps(schema))
+        self._zip.close()
+
+
+class ParquetWriter(ResultWriter):
+    """Parquet via pyarrow, one row group per `group_size` results"""
+
+    def __init__(self, path: str, append: bool = False, group_size: int = 10_000):
+        super().__init__(path, append)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow); use .colz instead") from e
+        if self._existing():
+            raise ValueError("Parquet files cannot be appended in place; use .colz or .jsonl for appends")
+
+        self._pa = pa
+        self.group_size = group_size
+        self._schema = pa.schema([
+            ("asin", pa.string()), ("status_code", pa.int32()), ("title", pa.string()),
+            ("is_gpu", pa.bool_()), ("price", pa.float64()), ("brand", pa.string()),
+            ("vram", pa.string()), ("notes", pa.string()), ("valid", pa.bool_()), ("tier", pa.string()),
+        ])
+        self._writer = pq.ParquetWriter(str(self.path), self._schema, compression="zstd")
+        self._buffer: List[Dict[str, Any]] = []
+
+    def write(self, result: ValidationResult):
+        self._buffer.append(asdict(result))
+        self.rows += 1
+        if len(self._buffer) >= self.group_size:
+            self._flush_group()
+
+    def _flush_group(self):
+        if self._buffer:
+            self._writer.write_table(self._pa.Table.from_pylist(self._buffer, schema=self._schema))
+            self._buffer = []
+
+    def close(self):
+        self._flush_group()
+        self._writer.close()
+
+
+WRITERS = {
+    ".jsonl": JsonLinesWriter,
+    ".json": JsonArrayWriter,
+    ".csv": CsvWriter,
+    ".colz": ColumnarZipWriter,
+    ".parquet": ParquetWriter,
+}
+
+
+def open_writer(path: str, append: bool = False) -> ResultWriter:
+    """Writer for the format implied by the file extension"""
+    suffix = Path(path).suffix.lower()
+    if suffix not in WRITERS:
+        raise ValueError(f"Unsupported export format '{suffix}' (use one of {', '.join(WRITERS)})")
+    return WRITERS[suffix](path, append=append)
+
+
+def export_results(results: Iterable[ValidationResult], path: str, append: bool = False) -> int:
+    """Stream results into `path`; returns the number written"""
+    with open_writer(path, append=append) as writer:
+        return writer.write_many(results)
+
+
+def read_colz_schema(path: Path) -> Dict[str, Any]:
+    with zipfile.ZipFile(path) as archive:
+        # Appends add a newer schema member; the highest revision is authoritative
+        schemas = sorted(name for name in archive.namelist() if name.startswith(ColumnarZipWriter.SCHEMA_PREFIX))
+        if not schemas:
+            raise ValueError(f"{path} is not a .colz export")
+        return json.loads(archive.read(schemas[-1]))
+
+
+def read_columns(path: str, columns: Optional[Sequence[str]] = None) -> Iterator[Dict[str, List[Any]]]:
+    """Yield {column: values} per row group of a .colz export, reading only `columns`"""
+    schema = read_colz_schema(Path(path))
+    wanted = list(columns) if columns else schema["fields"]
+    unknown = [name for name in wanted if name not in schema["fields"]]
+    if unknown:
+        raise ValueError(f"Unknown columns {unknown}; export has {schema['fields']}")
+    with zipfile.ZipFile(path) as archive:
+        for index in range(len(schema["row_groups"])):
+            yield {name: json.loads(archive.read(f"g{index:05d}/{name}.json")) for name in wanted}
@@ -0,0 +1,155 @@
+"""
+Single-pass incremental extraction of product fields from an Amazon page
+
+PageExtractor is fed decoded chunks as they arrive from the socket. One
+compiled alternation scans each chunk once; a short tail is carried over so
+tokens split across chunk boundaries are still matched. Once title, price and
+byline are known the caller can stop downloading the rest of the page.
+"""
+
+import codecs
+import html
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+# Tokens never span more than this many characters; kept between chunks
+CARRY = 4096
+# Captcha/throttle markers are only looked for near the top of the page
+HEAD_CHARS = 20000
+# best_title when the page yielded neither a product title nor a <title>
+NO_TITLE = "No title"
+
+# Case-sensitive on purpose: Amazon markup is lowercase, and literal branch
+# prefixes let the regex engine skip non-candidate positions quickly
+_TOKENS = re.compile(
+    r'<span[^>]*\bid="productTitle"[^>]*>\s*(?P<title>[^<]+?)\s*</span>'
+    r'|<title[^>]*>\s*(?P<page_title>[^<]+?)\s*</title>'
+    r'|id="(?P<price_anchor>corePrice_feature_div|corePriceDisplay_desktop_feature_div|corePrice_desktop'
+    r'|apex_desktop|price_inside_buybox)"'
+    r'|id="(?:priceblock_ourprice|priceblock_dealprice)"[^>]*>\s*\$\s*(?P<block_price>[\d,]+(?:\.\d{1,2})?)\s*<'
+    r'|<span class="a-offscreen">\s*\$\s*(?P<price>[\d,]+(?:\.\d{1,2})?)\s*</span>'
+    r'|id="bylineInfo"[^>]*>\s*(?P<byline>[^<]+?)\s*</a>'
+    r'|Graphics (?:Card )?RAM Size(?:\s|:|&lrm;|\u200e|</?(?:th|td|span)[^>]*>)*(?P<spec_vram>\d+)\s*GB'
+)
+_BYLINE = re.compile(r'^(?:Visit the\s+(?P<store>.+?)\s+Store|Brand:\s*(?P<brand>.+))$', re.IGNORECASE)
+
+
+def _to_price(text: str) -> Optional[float]:
+    try:
+        return float(text.replace(',', ''))
+    except ValueError:
+        return None
+
+
+@dataclass
+class PageFields:
+    title: Optional[str] = None
+    page_title: Optional[str] = None
+    price: Optional[float] = None
+    brand: Optional[str] = None
+    vram: Optional[str] = None
+    head: str = ""
+    bytes_read: int = 0
+    truncated: bool = False
+    # Raw page bytes, only when extract_stream() was asked to keep them
+    body: Optional[bytes] = None
+
+    @property
+    def best_title(self) -> str:
+        return self.title or self.page_title or NO_TITLE
+
+
+class PageExtractor:
+    """Incremental field extractor; feed() text chunks, then close()"""
+
+    def __init__(self):
+        self.fields = PageFields()
+        self._buffer = ""
+        self._price_armed = False
+
+    @property
+    def complete(self) -> bool:
+        f = self.fields
+        return f.title is not None and f.price is not None and f.brand is not None
+
+    def feed(self, text: str):
+        if len(self.fields.head) < HEAD_CHARS:
+            self.fields.head += text[:HEAD_CHARS - len(self.fields.head)]
+
+        buffer = self._buffer + text
+        consumed = 0
+        for match in _TOKENS.finditer(buffer):
+            self._handle(match)
+            consumed = match.end()
+        self._buffer = buffer[max(consumed, len(buffer) - CARRY):]
+
+    def close(self) -> PageFields:
+        # Anything left in the carry was already scanned with no complete token
+        self._buffer = ""
+        return self.fields
+
+    def _handle(self, match: "re.Match"):
+        f = self.fields
+        kind = match.lastgroup
+        value = match.group(kind)
+
+        if kind == 'title' and f.title is None:
+            f.title = html.unescape(value)
+        elif kind == 'page_title' and f.page_title is None:
+            f.page_title = html.unescape(value)
+        elif kind == 'price_anchor':
+            self._price_armed = True
+        elif kind == 'block_price' and f.price is None:
+            f.price = _to_price(value)
+        elif kind == 'price' and f.price is None and self._price_armed:
+            # Only the first a-offscreen after the buy-box anchor is the product price;
+            # earlier/later ones belong to ads and carousels
+            f.price = _to_price(value)
+        elif kind == 'byline' and f.brand is None:
+            byline = _BYLINE.match(html.unescape(value))
+            if byline:
+                f.brand = byline.group('store') or byline.group('brand')
+        elif kind == 'spec_vram' and f.vram is None:
+            f.vram = f"{value}GB"
+
+
+def extract_stream(chunks: Iterable[bytes], encoding: Optional[str] = None, max_bytes: int = 4 * 1024 * 1024,
+                   stop_early: bool = True, keep_body: bool = False) -> PageFields:
+    """
+    Decode and extract from a byte stream, stopping as soon as all fields are found.
+
+    The caller owns the underlying response; whatever was not read is simply
+    left unconsumed. `truncated` is set when reading stopped before the end.
+    keep_body: also return the bytes read as `body` (for archiving).
+    """
+    decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+    extractor = PageExtractor()
+    read = 0
+    kept = [] if keep_body else None
+
+    for chunk in chunks:
+        read += len(chunk)
+        if kept is not None:
+            kept.append(chunk)
+        extractor.feed(decoder.decode(chunk))
+        if (stop_early and extractor.complete) or read >= max_bytes:
+            extractor.fields.truncated = True
+            break
+    else:
+        extractor.feed(decoder.decode(b'', final=True))
+
+    fields = extractor.close()
+    fields.bytes_read = read
+    if kept is not None:
+        fields.body = b"".join(kept)
+    return fields
+
+
+def extract_html(text: str) -> PageFields:
+    """Extract from an already-downloaded page (same rules as the streaming path)"""
+    extractor = PageExtractor()
+    extractor.feed(text)
+    fields = extractor.close()
+    fields.bytes_read = len(text.encode('utf-8', errors='replace'))
+    return fields
@@ -0,0 +1,170 @@
+"""
+Streaming ASIN input loading with local normalization and format checks
+
+Inputs are trimmed, unquoted and uppercased, Amazon product URLs are reduced
+to their ASIN, and anything that does not match ^[A-Z0-9]{10}$ (the seed
+catalog rule) or was already seen is dropped before it can be queued, so bad
+input never costs an HTTP round trip. Rejections are counted per reason.
+"""
+
+import csv
+import io
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Set
+
+ASIN_PATTERN = re.compile(r'^[A-Z0-9]{10}$')
+_DP_URL = re.compile(r'/(?:dp|gp/product|gp/aw/d)/([A-Za-z0-9]{10})(?:[/?#]|$)')
+_INVALID_CHARS = re.compile(r'[^A-Z0-9]')
+
+SAMPLES_PER_REASON = 5
+
+
+@dataclass
+class InputStats:
+    accepted: int = 0
+    rejected: Dict[str, int] = field(default_factory=dict)
+    samples: Dict[str, List[str]] = field(default_factory=dict)
+
+    def reject(self, reason: str, raw: str):
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        examples = self.samples.setdefault(reason, [])
+        if len(examples) < SAMPLES_PER_REASON:
+            examples.append(raw)
+
+    @property
+    def total(self) -> int:
+        return self.accepted + sum(self.rejected.values())
+
+    def summary(self) -> str:
+        if not self.rejected:
+            return f"{self.accepted} ASINs accepted"
+        reasons = ", ".join(f"{count} {reason.replace('_', ' ')}" for reason, count in sorted(self.rejected.items()))
+        return f"{self.accepted} ASINs accepted, {sum(self.rejected.values())} skipped ({reasons})"
+
+
+def normalize(raw: str) -> str:
+    """' b0c2pshqfp ' / '"B0C2PSHQFP"' / 'https://amazon.com/dp/B0C2PSHQFP?th=1' -> 'B0C2PSHQFP'"""
+    value = raw.strip().strip('"\'').strip()
+    if '/' in value:
+        match = _DP_URL.search(value)
+        if match:
+            value = match.group(1)
+    return value.upper()
+
+
+def rejection_reason(asin: str) -> Optional[str]:
+    """Why a normalized value is not an ASIN, or None if it is one"""
+    if ASIN_PATTERN.match(asin):
+        return None
+    if _INVALID_CHARS.search(asin):
+        return "invalid_characters"
+    return "too_short" if len(asin) < 10 else "too_long"
+
+
+class AsinLoader:
+    """
+    Yields normalized, valid, (optionally) unique ASINs from files, streams or
+    values, counting everything it drops in `stats`.
+    """
+
+    def __init__(self, dedupe: bool = True):
+        self.dedupe = dedupe
+        self.stats = InputStats()
+        self._seen: Set[str] = set()
+
+    def values(self, raw_values: Iterable[Any]) -> Iterator[str]:
+        for raw in raw_values:
+            if raw is None:
+                continue
+            if not isinstance(raw, str):
+                self.stats.reject("not_a_string", repr(raw)[:40])
+                continue
+            asin = normalize(raw)
+            if not asin:
+                continue
+            reason = rejection_reason(asin)
+            if reason is not None:
+                self.stats.reject(reason, raw.strip()[:40])
+                continue
+            if self.dedupe:
+                if asin in self._seen:
+                    self.stats.reject("duplicate", asin)
+                    continue
+                self._seen.add(asin)
+            self.stats.accepted += 1
+            yield asin
+
+    def lines(self, stream: Iterable[str]) -> Iterator[str]:
+        """Plain lines or JSON Lines ({"asin": ...} / "ASIN"); '#' comments and blanks skipped"""
+        return self.values(self._line_values(stream))
+
+    def text(self, text: str) -> Iterator[str]:
+        return self.lines(io.StringIO(text))
+
+    def read_csv(self, stream: IO[str]) -> Iterator[str]:
+        """The 'asin' column (any case) if there is a header with one, else the first column"""
+        return self.values(self._csv_values(stream))
+
+    def read_json(self, stream: IO[str]) -> Iterator[str]:
+        """A JSON list, a {"category": [...]} map or a seed catalog ({"products": {...}})"""
+        return self.values(self._json_values(json.load(stream)))
+
+    def file(self, path: str) -> Iterator[str]:
+        """Pick the parser from the extension (.json, .csv, anything else as lines)"""
+        suffix = Path(path).suffix.lower()
+        with open(path, 'r', encoding='utf-8-sig', errors='replace', newline='' if suffix == '.csv' else None) as f:
+            if suffix == '.json':
+                yield from self.read_json(f)
+            elif suffix == '.csv':
+                yield from self.read_csv(f)
+            else:
+                yield from self.lines(f)
+
+    @staticmethod
+    def _line_values(stream: Iterable[str]) -> Iterator[str]:
+        for line in stream:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line[0] == '{':
+                try:
+                    value = json.loads(line)
+                except json.JSONDecodeError:
+                    pass
+                else:
+                    line = value.get('asin', '') if isinstance(value, dict) else line
+            yield line
+
+    @staticmethod
+    def _csv_values(stream: IO[str]) -> Iterator[str]:
+        reader = csv.reader(stream)
+        column = 0
+        for row_number, row in enumerate(reader):
+            if not row:
+                continue
+            if row_number == 0:
+                header = [cell.strip().lower() for cell in row]
+                if 'asin' in header:
+                    column = header.index('asin')
+                    continue
+            if column < len(row):
+                yield row[column]
+
+    @classmethod
+    def _json_values(cls, data: Any) -> Iterator[Any]:
+        if isinstance(data, list):
+            for item in data:
+                yield item.get('asin') if isinstance(item, dict) else item
+        elif isinstance(data, dict):
+            if isinstance(data.get('products'), dict):
+                data = data['products']
+            for value in data.values():
+                if isinstance(value, list):
+                    yield from cls._json_values(value)
+                elif isinstance(value, dict):
+                    yield value.get('asin')
+                else:
+                    yield value
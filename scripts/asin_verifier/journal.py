@@ -0,0 +1,91 @@
+"""
+Append-only journal of completed validations, for resuming interrupted runs
+
+One JSON object per line, flushed as each result lands. On resume the journal
+is replayed and ASINs with a definitive result (found or 404) are skipped;
+throttled and errored ones are retried. A run killed mid-write leaves at most
+one truncated last line, which is ignored.
+"""
+
+import json
+import os
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict
+
+from .verifier import ValidationResult, is_definitive
+
+
+class ValidationJournal:
+    """Thread-safe JSON Lines journal of ValidationResults"""
+
+    DEFAULT_PATH = "exports/validation-journal.jsonl"
+
+    def __init__(self, path: str = DEFAULT_PATH, fsync: bool = False):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self.appended = 0
+        self._lock = threading.Lock()
+        self._file = None
+
+    def load(self) -> Dict[str, ValidationResult]:
+        """Latest definitive result per ASIN from previous runs"""
+        done: Dict[str, ValidationResult] = {}
+        if not self.path.exists():
+            return done
+        with open(self.path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                try:
+                    result = ValidationResult(**json.loads(line))
+                except (ValueError, TypeError):
+                    # Torn write from a killed run, or a foreign line
+                    continue
+                if is_definitive(result):
+                    done[result.asin] = result
+                else:
+                    done.pop(result.asin, None)
+        return done
+
+    def append(self, result: ValidationResult):
+        line = json.dumps(asdict(result)) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = self._open_append()
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self.appended += 1
+
+    def _open_append(self):
+        """Open for appending, terminating a torn last line so the next record starts on its own line"""
+        f = open(self.path, 'a+b')
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.close()
+        return open(self.path, 'a', encoding='utf-8')
+
+    def reset(self):
+        """Start a fresh journal, discarding previous runs"""
+        with self._lock:
+            self._close()
+            self._file = open(self.path, 'w', encoding='utf-8')
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def __enter__(self) -> "ValidationJournal":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
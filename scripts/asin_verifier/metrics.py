@@ -0,0 +1,269 @@
+"""
+Verifier instrumentation: per-phase timings, counters and latency histograms
+
+Phases of one fetch attempt:
+
+    queue     waiting for a scheduler slot (concurrency limit + rate token)
+    connect   DNS + TCP + TLS for a new pooled connection (0 when reused)
+    server    request sent -> response headers, minus connect
+    download  waiting on body chunks
+    extract   streaming field extraction
+    backoff   sleeping between throttled/failed attempts
+
+plus `asin`, the wall time of a whole validate_asin() call. Snapshots export
+as JSON or Prometheus text exposition format.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Sequence
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+PHASES = ("queue", "connect", "server", "download", "extract", "backoff", "asin")
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Connect time of the current thread's request; read back by the verifier after session.get()
+_connect = threading.local()
+
+
+def take_connect_time() -> float:
+    """Seconds spent connecting since the last call on this thread"""
+    spent = getattr(_connect, "seconds", 0.0)
+    _connect.seconds = 0.0
+    return spent
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect.seconds = getattr(_connect, "seconds", 0.0) + time.perf_counter() - started
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect.seconds = getattr(_connect, "seconds", 0.0) + time.perf_counter() - started
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose new connections report their connect time (see take_connect_time)"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram (Prometheus semantics)"""
+
+    def __init__(self, buckets: Sequence[float] = BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Bucket-interpolated quantile estimate"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for i, bound in enumerate(self.buckets):
+            if seen + self.counts[i] >= rank:
+                return lower + (bound - lower) * (rank - seen) / max(self.counts[i], 1)
+            seen += self.counts[i]
+            lower = bound
+        return self.buckets[-1]
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "p50": round(self.quantile(0.5), 4),
+            "p95": round(self.quantile(0.95), 4),
+            "p99": round(self.quantile(0.99), 4),
+            "buckets": {str(bound): n for bound, n in zip(self.buckets + (float("inf"),), self.counts)},
+        }
+
+
+class VerifierMetrics:
+    """Thread-safe counters and histograms for one verifier, plus live rate / p95 windows"""
+
+    def __init__(self, window: float = 10.0, recent: int = 1000, keep_samples: bool = False):
+        """keep_samples: also keep every validate_asin() duration in `samples`, for exact percentiles"""
+        self.window = window
+        self.started = time.time()
+        self.histograms: Dict[str, Histogram] = {phase: Histogram() for phase in PHASES}
+        self.status_codes: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.sources: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {"attempts": 0, "retries": 0, "throttled": 0, "bytes": 0}
+        self._completions: Deque[float] = deque()
+        self._recent: Deque[float] = deque(maxlen=recent)
+        self.samples: Optional[List[float]] = [] if keep_samples else None
+        self._lock = threading.Lock()
+
+    # -- recording -------------------------------------------------------
+
+    def phase(self, name: str, seconds: float):
+        with self._lock:
+            self.histograms[name].observe(max(0.0, seconds))
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def error(self, kind: str):
+        with self._lock:
+            self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def attempt(self, status_code: int, throttled: bool, retry: bool):
+        with self._lock:
+            self.counters["attempts"] += 1
+            self.counters["retries"] += retry
+            self.counters["throttled"] += throttled
+            key = str(status_code)
+            self.status_codes[key] = self.status_codes.get(key, 0) + 1
+
+    def completed(self, seconds: float, source: str):
+        """One validate_asin() call finished; source is remote, cache or negative"""
+        now = time.monotonic()
+        with self._lock:
+            self.histograms["asin"].observe(seconds)
+            if self.samples is not None:
+                self.samples.append(seconds)
+            self.sources[source] = self.sources.get(source, 0) + 1
+            self._completions.append(now)
+            if source == "remote":
+                self._recent.append(seconds)
+
+    # -- live views ------------------------------------------------------
+
+    def rate(self) -> float:
+        """ASINs completed per second over the last window"""
+        cutoff = time.monotonic() - self.window
+        with self._lock:
+            while self._completions and self._completions[0] < cutoff:
+                self._completions.popleft()
+            return len(self._completions) / self.window
+
+    def recent_p95(self) -> float:
+        """p95 latency of the most recent network validations (exact, not bucketed)"""
+        with self._lock:
+            recent = sorted(self._recent)
+        if not recent:
+            return 0.0
+        return recent[min(len(recent) - 1, int(0.95 * len(recent)))]
+
+    # -- export ----------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, object]:
+        rate = self.rate()
+        p95 = self.recent_p95()
+        with self._lock:
+            return {
+                "uptime_seconds": round(time.time() - self.started, 1),
+                "asins_per_second": round(rate, 2),
+                "recent_p95_seconds": round(p95, 4),
+                "counters": dict(self.counters),
+                "status_codes": dict(self.status_codes),
+                "errors": dict(self.errors),
+                "sources": dict(self.sources),
+                "phases": {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+            }
+
+    def to_prometheus(self, prefix: str = "dxm_asin_verifier") -> str:
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        family("asins_per_second", "gauge", "ASINs validated per second over the live window")
+        lines.append(f"{prefix}_asins_per_second {snapshot['asins_per_second']}")
+        family("recent_p95_seconds", "gauge", "p95 of recent network validations")
+        lines.append(f"{prefix}_recent_p95_seconds {snapshot['recent_p95_seconds']}")
+
+        for name, value in snapshot["counters"].items():
+            family(f"{name}_total", "counter", f"Fetch {name}")
+            lines.append(f"{prefix}_{name}_total {value}")
+        for metric, label, values, help_text in (
+            ("responses_total", "code", snapshot["status_codes"], "Fetch attempts by HTTP status"),
+            ("errors_total", "kind", snapshot["errors"], "Failed fetch attempts by error kind"),
+            ("results_total", "source", snapshot["sources"], "Validations by result source"),
+        ):
+            family(metric, "counter", help_text)
+            for key, value in sorted(values.items()):
+                lines.append(f'{prefix}_{metric}{{{label}="{key}"}} {value}')
+
+        family("phase_seconds", "histogram", "Time per fetch phase")
+        with self._lock:
+            histograms = [(name, h.buckets, list(h.counts), h.count, h.sum) for name, h in self.histograms.items()]
+        for name, buckets, counts, count, total in histograms:
+            cumulative = 0
+            for bound, n in zip(buckets + (float("inf"),), counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_phase_seconds_bucket{{phase="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_phase_seconds_sum{{phase="{name}"}} {total:.6f}')
+            lines.append(f'{prefix}_phase_seconds_count{{phase="{name}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Atomically write metrics; .prom/.txt -> Prometheus text, anything else -> JSON"""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.suffix in (".prom", ".txt"):
+            body = self.to_prometheus()
+        else:
+            body = json.dumps(self.snapshot(), indent=2)
+        fd, tmp = tempfile.mkstemp(prefix=f".{target.name}.", dir=str(target.parent))
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(body)
+        os.replace(tmp, target)
+
+    def summary(self) -> str:
+        """One line for logs / status bars"""
+        phases = ", ".join(
+            f"{name} {self.histograms[name].quantile(0.5) * 1000:.0f}ms"
+            for name in ("queue", "connect", "server", "download", "extract") if self.histograms[name].count
+        )
+        return f"{self.rate():.1f} ASINs/s, p95 {self.recent_p95():.2f}s" + (f" · p50 {phases}" if phases else "")
+
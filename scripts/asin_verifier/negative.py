@@ -0,0 +1,192 @@
+"""
+Persistent filter of ASINs already confirmed dead (404) or not a GPU
+
+An in-memory Bloom filter answers "definitely not known-dead" for the bulk of
+a discovery list without touching disk. Its positives are confirmed against
+the exact set in SQLite (ASIN, reason, expiry), so a false positive can never
+skip a live ASIN. Entries expire, after which the ASIN is fetched again.
+"""
+
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .cache import DAY
+from .verifier import ValidationResult, is_definitive
+
+NOT_FOUND = "not_found"
+NOT_GPU = "not_gpu"
+# Title of the stand-in result for a skipped ASIN
+SKIPPED = "Skipped"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing from one blake2b digest)"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def add(self, key: str):
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    @property
+    def full(self) -> bool:
+        return self.count > self.capacity
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+class NegativeFilter:
+    """
+    Known-dead ASIN registry.
+
+    ttl: how long a 404 is trusted; non_gpu_ttl: how long a non-GPU listing is.
+    Listings get relisted and ASINs reused, so both eventually expire.
+    """
+
+    DEFAULT_PATH = "exports/negative-asins.sqlite"
+
+    def __init__(self, path: str = DEFAULT_PATH, ttl: float = 30 * DAY, non_gpu_ttl: float = 90 * DAY,
+                 capacity: int = 100_000, error_rate: float = 0.001):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.non_gpu_ttl = non_gpu_ttl
+        self.error_rate = error_rate
+        self.skipped = 0
+        self.false_positives = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS negatives (
+                asin TEXT PRIMARY KEY,
+                reason TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+        self._rebuild(capacity)
+
+    def _rebuild(self, capacity: int):
+        """Drop expired entries and rebuild the Bloom filter from the exact set"""
+        with self._lock:
+            self._conn.execute("DELETE FROM negatives WHERE expires_at < ?", (time.time(),))
+            self._conn.commit()
+            count = self._conn.execute("SELECT COUNT(*) FROM negatives").fetchone()[0]
+            bloom = BloomFilter(max(capacity, count * 2), self.error_rate)
+            for (asin,) in self._conn.execute("SELECT asin FROM negatives"):
+                bloom.add(asin)
+            self._bloom = bloom
+
+    @staticmethod
+    def reason_for(result: ValidationResult) -> Optional[str]:
+        """Why a result marks its ASIN as dead, or None if it does not"""
+        if not is_definitive(result):
+            return None
+        if result.status_code == 404:
+            return NOT_FOUND
+        if not result.is_gpu:
+            return NOT_GPU
+        return None
+
+    def lookup(self, asin: str) -> Optional[Tuple[str, float]]:
+        """(reason, expires_at) if the ASIN is known dead and not expired"""
+        if asin not in self._bloom:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT reason, expires_at FROM negatives WHERE asin = ?", (asin,)
+            ).fetchone()
+            if row is None or row[1] < time.time():
+                self.false_positives += row is None
+                return None
+            self.skipped += 1
+        return row[0], row[1]
+
+    def __contains__(self, asin: str) -> bool:
+        return self.lookup(asin) is not None
+
+    def record(self, result: ValidationResult) -> bool:
+        """Remember dead results and forget ASINs that came back alive; returns whether it was stored"""
+        reason = self.reason_for(result)
+        if reason is None:
+            if result.valid and result.asin in self._bloom:
+                self.discard(result.asin)
+            return False
+
+        expires_at = time.time() + (self.ttl if reason == NOT_FOUND else self.non_gpu_ttl)
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO negatives VALUES (?, ?, ?)", (result.asin, reason, expires_at))
+            self._conn.commit()
+            self._bloom.add(result.asin)
+            full = self._bloom.full
+        if full:
+            self._rebuild(self._bloom.capacity * 2)
+        return True
+
+    def discard(self, asin: str):
+        """Forget an ASIN (the Bloom bit stays set; the exact set has the final word)"""
+        with self._lock:
+            self._conn.execute("DELETE FROM negatives WHERE asin = ?", (asin,))
+            self._conn.commit()
+
+    def skip_result(self, asin: str) -> Optional[ValidationResult]:
+        """
+        Stand-in result for a known-dead ASIN, or None if it should be fetched.
+
+        No page was fetched, so like an error it has status 0: it is not
+        definitive, and neither the journal nor the cache takes it as settled.
+        """
+        known = self.lookup(asin)
+        if known is None:
+            return None
+        reason, expires_at = known
+        until = time.strftime("%Y-%m-%d", time.localtime(expires_at))
+        what = "404" if reason == NOT_FOUND else "non-GPU listing"
+        return ValidationResult(asin=asin, status_code=0, title=SKIPPED, is_gpu=False,
+                                notes=f"Skipped: known {what} (until {until})")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows = dict(self._conn.execute("SELECT reason, COUNT(*) FROM negatives GROUP BY reason").fetchall())
+        return {
+            NOT_FOUND: rows.get(NOT_FOUND, 0),
+            NOT_GPU: rows.get(NOT_GPU, 0),
+            "skipped": self.skipped,
+            "bloom_false_positives": self.false_positives,
+            "bloom_kb": self._bloom.nbytes // 1024,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
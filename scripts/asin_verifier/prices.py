@@ -0,0 +1,310 @@
+"""
+Compact price history fed by validation runs
+
+Observations live in three parallel array columns (ASIN id, epoch seconds,
+price in cents) in time order. On disk each record() call appends one
+segment: new ASIN names plus the columns delta-encoded (time against the
+segment base, price against the same ASIN's previous price) and deflated, so
+an unchanged catalog costs a few bytes per product per run. Queries are
+single sweeps over the columns from a bisected window start.
+
+Segments depend on every segment before them (ASIN ids, price bases), so
+writers append under an exclusive file lock and first decode whatever other
+instances (the GUI session, a CLI run) appended since they last read.
+"""
+
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .cache import DAY
+from .verifier import ValidationResult
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory lock; appends still catch up with the file first
+    fcntl = None
+
+_MAGIC = b"DXPH"
+_FRAME = struct.Struct(">4sI")
+
+
+@dataclass
+class PriceMove:
+    asin: str
+    current: float
+    reference: float       # window max for drops, window min for lows
+    observed_at: float
+
+    @property
+    def change(self) -> float:
+        return round(self.current - self.reference, 2)
+
+    @property
+    def change_pct(self) -> float:
+        return round(100.0 * (self.current - self.reference) / self.reference, 1) if self.reference else 0.0
+
+
+class PriceHistory:
+    """Append-only per-ASIN price time series"""
+
+    DEFAULT_PATH = "exports/price-history.bin"
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._reset()
+        self._load()
+
+    def _reset(self):
+        self.asins: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.asin_col = array('I')
+        self.time_col = array('q')
+        self.price_col = array('q')
+        # Latest price per ASIN id, the delta base for the next segment
+        self._last_price = array('q')
+        # How much of which file has been decoded; later segments are read before the next append
+        self._inode: Optional[int] = None
+        self._offset = 0
+
+    def __len__(self) -> int:
+        return len(self.time_col)
+
+    # -- persistence -----------------------------------------------------
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path, 'rb') as f:
+            self._read_new(f)
+
+    def _read_new(self, f: BinaryIO) -> bool:
+        """Decode the segments appended since the last read; True if the file ends in a torn segment"""
+        stat = os.fstat(f.fileno())
+        if self._inode is not None and (stat.st_ino != self._inode or stat.st_size < self._offset):
+            # Compacted by another instance: the file was replaced, read it from the start
+            self._reset()
+        self._inode = stat.st_ino
+        f.seek(self._offset)
+        data = f.read()
+        offset = 0
+        while offset + _FRAME.size <= len(data):
+            magic, length = _FRAME.unpack_from(data, offset)
+            body = data[offset + _FRAME.size:offset + _FRAME.size + length]
+            if magic != _MAGIC or len(body) < length:
+                # Torn tail from an interrupted append
+                break
+            self._decode_segment(zlib.decompress(body))
+            offset += _FRAME.size + length
+        self._offset += offset
+        return offset < len(data)
+
+    @contextmanager
+    def _locked(self) -> Iterator[BinaryIO]:
+        """The file open for appending under an exclusive lock, with other writers' segments decoded"""
+        while True:
+            f = open(self.path, 'a+b')
+            if fcntl is None:
+                break
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            # compact() may have replaced the file while we waited; lock the current one
+            try:
+                if os.stat(self.path).st_ino == os.fstat(f.fileno()).st_ino:
+                    break
+            except FileNotFoundError:
+                pass
+            f.close()
+        try:
+            if self._read_new(f) and fcntl is not None:
+                # No writer holds the lock, so an incomplete tail is left over from a crash
+                f.truncate(self._offset)
+            yield f
+        finally:
+            f.close()
+
+    def _decode_segment(self, payload: bytes):
+        header_len = struct.unpack_from(">I", payload)[0]
+        header = json.loads(payload[4:4 + header_len])
+        for asin in header["new_asins"]:
+            self.ids[asin] = len(self.asins)
+            self.asins.append(asin)
+            self._last_price.append(0)
+
+        count = header["count"]
+        columns = payload[4 + header_len:]
+        ids, time_deltas, price_deltas = array('I'), array('q'), array('q')
+        width_i, width_q = ids.itemsize * count, time_deltas.itemsize * count
+        ids.frombytes(columns[:width_i])
+        time_deltas.frombytes(columns[width_i:width_i + width_q])
+        price_deltas.frombytes(columns[width_i + width_q:width_i + 2 * width_q])
+
+        base = header["base_time"]
+        last = self._last_price
+        for asin_id, dt, dp in zip(ids, time_deltas, price_deltas):
+            price = last[asin_id] + dp
+            last[asin_id] = price
+            self.asin_col.append(asin_id)
+            self.time_col.append(base + dt)
+            self.price_col.append(price)
+
+    def _encode_segment(self, rows: List[Tuple[int, int, int]], new_asins: List[str], base_time: int) -> bytes:
+        ids, time_deltas, price_deltas = array('I'), array('q'), array('q')
+        last = self._last_price
+        for asin_id, when, cents in rows:
+            ids.append(asin_id)
+            time_deltas.append(when - base_time)
+            price_deltas.append(cents - last[asin_id])
+            last[asin_id] = cents
+        header = json.dumps({"count": len(rows), "base_time": base_time, "new_asins": new_asins}).encode()
+        payload = struct.pack(">I", len(header)) + header + ids.tobytes() + time_deltas.tobytes() + \
+            price_deltas.tobytes()
+        body = zlib.compress(payload, 9)
+        return _FRAME.pack(_MAGIC, len(body)) + body
+
+    def record(self, results: Iterable[ValidationResult], when: Optional[float] = None) -> int:
+        """Append one observation per priced, valid result; returns how many were stored"""
+        with self._lock, self._locked() as f:
+            now = int(when if when is not None else time.time())
+            # Columns stay time-ordered so window queries can bisect
+            if self.time_col:
+                now = max(now, self.time_col[-1])
+
+            new_asins: List[str] = []
+            rows: Dict[int, Tuple[int, int, int]] = {}
+            for result in results:
+                if not result.valid or not result.price:
+                    continue
+                asin_id = self.ids.get(result.asin)
+                if asin_id is None:
+                    asin_id = len(self.asins)
+                    self.ids[result.asin] = asin_id
+                    self.asins.append(result.asin)
+                    self._last_price.append(0)
+                    new_asins.append(result.asin)
+                rows[asin_id] = (asin_id, now, int(round(result.price * 100)))
+            if not rows:
+                return 0
+
+            ordered = list(rows.values())
+            segment = self._encode_segment(ordered, new_asins, now)
+            f.write(segment)
+            f.flush()
+            self._offset += len(segment)
+            for asin_id, when_, cents in ordered:
+                self.asin_col.append(asin_id)
+                self.time_col.append(when_)
+                self.price_col.append(cents)
+            return len(ordered)
+
+    def compact(self):
+        """Rewrite all segments as one (atomic replace)"""
+        with self._lock, self._locked():
+            rows = list(zip(self.asin_col, self.time_col, self.price_col))
+            self._last_price = array('q', [0]) * len(self.asins)
+            segment = self._encode_segment(rows, list(self.asins), rows[0][1] if rows else 0) if rows else b""
+            fd, tmp = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=str(self.path.parent))
+            with os.fdopen(fd, 'wb') as f:
+                f.write(segment)
+                f.flush()
+                os.fsync(f.fileno())
+                self._inode = os.fstat(f.fileno()).st_ino
+            os.replace(tmp, self.path)
+            self._offset = len(segment)
+
+    # -- queries ---------------------------------------------------------
+
+    def series(self, asin: str) -> List[Tuple[float, float]]:
+        """[(epoch seconds, price)] for one ASIN, oldest first"""
+        asin_id = self.ids.get(asin)
+        if asin_id is None:
+            return []
+        return [(t, p / 100) for a, t, p in zip(self.asin_col, self.time_col, self.price_col) if a == asin_id]
+
+    def latest(self) -> Dict[str, Tuple[float, float]]:
+        """Current (epoch seconds, price) for every ASIN"""
+        current: Dict[int, Tuple[int, int]] = {}
+        for asin_id, when, cents in zip(self.asin_col, self.time_col, self.price_col):
+            current[asin_id] = (when, cents)
+        return {self.asins[i]: (when, cents / 100) for i, (when, cents) in current.items()}
+
+    def previous_prices(self) -> Dict[str, float]:
+        """Price each ASIN had before its latest change (only ASINs whose price has changed)"""
+        current = array('q', [-1]) * len(self.asins)
+        previous: Dict[int, int] = {}
+        for asin_id, cents in zip(self.asin_col, self.price_col):
+            if current[asin_id] != cents:
+                if current[asin_id] >= 0:
+                    previous[asin_id] = current[asin_id]
+                current[asin_id] = cents
+        return {self.asins[i]: cents / 100 for i, cents in previous.items()}
+
+    def previous_price(self, asin: str) -> Optional[float]:
+        history = self.series(asin)
+        for _, price in reversed(history[:-1]):
+            if price != history[-1][1]:
+                return price
+        return None
+
+    def _window(self, days: float, now: Optional[float]) -> Tuple[Dict[int, int], Dict[int, int], Dict[int, Tuple[int, int]]]:
+        """Per-ASIN (min, max) within the window and current price, in one sweep"""
+        cutoff = (now if now is not None else time.time()) - days * DAY
+        start = bisect_left(self.time_col, int(cutoff))
+        lows: Dict[int, int] = {}
+        highs: Dict[int, int] = {}
+        current: Dict[int, Tuple[int, int]] = {}
+        asin_col, time_col, price_col = self.asin_col, self.time_col, self.price_col
+        for i in range(start, len(time_col)):
+            asin_id, cents = asin_col[i], price_col[i]
+            if cents < lows.get(asin_id, cents + 1):
+                lows[asin_id] = cents
+            if cents > highs.get(asin_id, -1):
+                highs[asin_id] = cents
+            current[asin_id] = (time_col[i], cents)
+        return lows, highs, current
+
+    def largest_drops(self, days: float = 7, limit: int = 20, now: Optional[float] = None) -> List[PriceMove]:
+        """ASINs whose current price is furthest below their high of the last `days`"""
+        _, highs, current = self._window(days, now)
+        moves = [
+            PriceMove(self.asins[asin_id], cents / 100, highs[asin_id] / 100, when)
+            for asin_id, (when, cents) in current.items() if cents < highs[asin_id]
+        ]
+        moves.sort(key=lambda move: move.change_pct)
+        return moves[:limit]
+
+    def at_low(self, days: float = 30, now: Optional[float] = None) -> List[PriceMove]:
+        """Current price vs the `days` minimum for every ASIN seen in the window, cheapest-relative first"""
+        lows, _, current = self._window(days, now)
+        moves = [
+            PriceMove(self.asins[asin_id], cents / 100, lows[asin_id] / 100, when)
+            for asin_id, (when, cents) in current.items()
+        ]
+        moves.sort(key=lambda move: move.change_pct)
+        return moves
+
+    def volatility(self, days: float = 30, now: Optional[float] = None) -> Dict[str, float]:
+        """(high - low) / current over the last `days` for every ASIN seen in the window"""
+        lows, highs, current = self._window(days, now)
+        return {
+            self.asins[asin_id]: (highs[asin_id] - lows[asin_id]) / cents if cents else 0.0
+            for asin_id, (_, cents) in current.items()
+        }
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "asins": len(self.asins),
+            "observations": len(self.time_col),
+            "bytes_on_disk": self.path.stat().st_size if self.path.exists() else 0,
+        }
@@ -0,0 +1,138 @@
+"""
+Priority-driven revalidation of the seed catalog
+
+Every seed product gets a priority: how stale its last verification is (from
+the result cache and price history) times how much a wrong listing would
+cost (dxmScore, recent price volatility, whether it carries a live affiliate
+link). Products verified more recently than `min_age` are left alone. With a
+request or time budget, the highest priorities are validated first, so
+limited fetch capacity goes to the products that matter.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .cache import DAY
+
+Product = Dict[str, Any]
+
+
+@dataclass
+class RevalidationItem:
+    asin: str
+    category: str
+    priority: float
+    age_days: Optional[float]      # None: never verified
+    volatility: float
+    dxm_score: float
+    affiliate: bool
+    reasons: List[str] = field(default_factory=list)
+
+
+def is_live_affiliate(product: Product) -> bool:
+    """Product links out with our associate tag"""
+    url = product.get("affiliateUrl") or ""
+    return "tag=" in url and "/dp/" in url
+
+
+class RevalidationPlanner:
+    """Rank seed products by staleness x catalog value"""
+
+    def __init__(self, stale_after_days: float = 7, min_age_days: float = 1, max_staleness: float = 4.0,
+                 score_weight: float = 1.0, volatility_weight: float = 2.0, affiliate_weight: float = 1.0,
+                 volatility_days: float = 30):
+        """
+        stale_after_days: age at which staleness reaches 1; it grows linearly up to `max_staleness`,
+            which is also what never-verified products get.
+        min_age_days: products verified more recently are not scheduled at all.
+        *_weight: contribution of dxmScore (0-10, scaled to 0-1), price volatility ((high - low) /
+            current over `volatility_days`, capped at 1) and a live affiliate link to the value factor.
+        """
+        self.stale_after = stale_after_days * DAY
+        self.min_age = min_age_days * DAY
+        self.max_staleness = max_staleness
+        self.score_weight = score_weight
+        self.volatility_weight = volatility_weight
+        self.affiliate_weight = affiliate_weight
+        self.volatility_days = volatility_days
+
+    def plan(self, seed: Dict[str, Any], verified_at: Optional[Dict[str, float]] = None,
+             volatility: Optional[Dict[str, float]] = None, categories: Optional[Iterable[str]] = None,
+             now: Optional[float] = None) -> List[RevalidationItem]:
+        """
+        Due products of a seed document, highest priority first (one item per ASIN).
+
+        verified_at: last verification time per ASIN (epoch seconds).
+        volatility: per-ASIN price volatility, e.g. PriceHistory.volatility().
+        """
+        now = now if now is not None else time.time()
+        verified_at = verified_at or {}
+        volatility = volatility or {}
+        wanted = set(categories) if categories is not None else None
+
+        items: Dict[str, RevalidationItem] = {}
+        for category, products in seed.get("products", {}).items():
+            if not isinstance(products, list) or (wanted is not None and category not in wanted):
+                continue
+            for product in products:
+                asin = product.get("asin")
+                if not asin:
+                    continue
+                item = self.rank(asin, category, product, verified_at.get(asin), volatility.get(asin, 0.0), now)
+                if item is not None and (asin not in items or item.priority > items[asin].priority):
+                    items[asin] = item
+
+        return sorted(items.values(), key=lambda item: (-item.priority, item.asin))
+
+    def rank(self, asin: str, category: str, product: Product, verified: Optional[float], volatility: float,
+             now: float) -> Optional[RevalidationItem]:
+        """Priority of one product, or None when it was verified too recently to schedule"""
+        reasons = []
+        if verified is None:
+            age = None
+            staleness = self.max_staleness
+            reasons.append("never verified")
+        else:
+            age = max(now - verified, 0.0)
+            if age < self.min_age:
+                return None
+            staleness = min(age / self.stale_after, self.max_staleness)
+            if age >= self.stale_after:
+                reasons.append(f"verified {age / DAY:.0f}d ago")
+
+        try:
+            score = float(product.get("dxmScore") or 0)
+        except (TypeError, ValueError):
+            score = 0.0
+        affiliate = is_live_affiliate(product)
+        value = 1.0 + self.score_weight * min(max(score, 0.0), 10.0) / 10 + \
+            self.volatility_weight * min(volatility, 1.0) + self.affiliate_weight * affiliate
+        if score >= 8:
+            reasons.append(f"dxmScore {score:g}")
+        if volatility >= 0.05:
+            reasons.append(f"price moved {volatility:.0%}")
+        if affiliate:
+            reasons.append("live affiliate link")
+
+        return RevalidationItem(asin=asin, category=category, priority=round(staleness * value, 4),
+                                age_days=round(age / DAY, 2) if age is not None else None,
+                                volatility=round(volatility, 4), dxm_score=score, affiliate=affiliate,
+                                reasons=reasons)
+
+
+def within_budget(items: Iterable[RevalidationItem], limit: Optional[int] = None,
+                  seconds: Optional[float] = None) -> Iterator[str]:
+    """
+    ASINs of `items` in order until `limit` have been handed out or `seconds` have passed.
+
+    Lazy, so when fed to validate_many the clock is checked as each ASIN is
+    about to be submitted; requests already in flight still finish.
+    """
+    stop_at = time.monotonic() + seconds if seconds is not None else None
+    for count, item in enumerate(items):
+        if limit is not None and count >= limit:
+            return
+        if stop_at is not None and time.monotonic() >= stop_at:
+            return
+        yield item.asin
@@ -0,0 +1,210 @@
+"""
+Per-host request pacing for product-page fetches
+
+Each host gets a token bucket (request rate) and an AIMD concurrency limit.
+Successful responses additively raise both; throttling responses (429/503,
+captcha pages, timeouts) halve them. The scheduler therefore settles near the
+highest rate the host tolerates instead of bursting into a wall of 503s.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose refill rate can be changed at runtime"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Block until a token is available; return the time spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available right now, without waiting"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def set_rate(self, rate: float):
+        """Change the refill rate, crediting tokens earned at the old rate first"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+
+class AIMDLimiter:
+    """Concurrency limit with additive increase and multiplicative decrease"""
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 32, decrease: float = 0.5):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self):
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    def on_success(self):
+        # +1 slot per full window of successes
+        with self._cond:
+            self._limit = min(self.maximum, self._limit + 1.0 / self._limit)
+            self._cond.notify_all()
+
+    def on_throttle(self):
+        with self._cond:
+            self._limit = max(self.minimum, self._limit * self.decrease)
+
+
+class HostState:
+    """Pacing state and counters for a single host"""
+
+    def __init__(self, bucket: TokenBucket, limiter: AIMDLimiter):
+        self.bucket = bucket
+        self.limiter = limiter
+        self.requests = 0
+        self.throttled = 0
+        self.completions: Deque[float] = deque()
+
+
+class FetchScheduler:
+    """Token bucket + AIMD concurrency per host, with jittered retry backoff"""
+
+    def __init__(self, rate: float = 5.0, max_rate: float = 20.0, min_rate: float = 0.5,
+                 rate_step: float = 0.25, burst: float = 4.0, initial_concurrency: int = 4,
+                 max_concurrency: int = 32, max_retries: int = 3, base_delay: float = 1.0,
+                 max_delay: float = 30.0, rate_window: float = 10.0):
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.rate_step = rate_step
+        self.burst = burst
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rate_window = rate_window
+        self._hosts: Dict[str, HostState] = {}
+        self._lock = threading.Lock()
+
+    def host(self, host: str) -> HostState:
+        """Get (or lazily create) the pacing state for a host"""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = HostState(
+                    TokenBucket(self.rate, self.burst),
+                    AIMDLimiter(self.initial_concurrency, maximum=self.max_concurrency),
+                )
+                self._hosts[host] = state
+            return state
+
+    @contextmanager
+    def slot(self, host: str) -> Iterator[HostState]:
+        """Hold a concurrency slot and a rate token for one request"""
+        state = self.host(host)
+        state.limiter.acquire()
+        try:
+            state.bucket.acquire()
+            yield state
+        finally:
+            state.limiter.release()
+
+    def record(self, host: str, throttled: bool):
+        """Feed a request outcome back into the host's rate and concurrency"""
+        state = self.host(host)
+        now = time.monotonic()
+        with self._lock:
+            state.requests += 1
+            state.completions.append(now)
+            if throttled:
+                state.throttled += 1
+
+        if throttled:
+            state.limiter.on_throttle()
+            state.bucket.set_rate(max(self.min_rate, state.bucket.rate * state.limiter.decrease))
+        else:
+            state.limiter.on_success()
+            state.bucket.set_rate(min(self.max_rate, state.bucket.rate + self.rate_step))
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Full-jitter exponential backoff, honouring a numeric Retry-After header"""
+        if retry_after:
+            try:
+                return min(self.max_delay, float(retry_after)) + random.uniform(0, self.base_delay)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def current_rate(self, host: Optional[str] = None) -> float:
+        """Observed completions per second over the last rate window"""
+        cutoff = time.monotonic() - self.rate_window
+        total = 0
+        with self._lock:
+            states = [self._hosts[host]] if host in self._hosts else ([] if host else list(self._hosts.values()))
+            for state in states:
+                while state.completions and state.completions[0] < cutoff:
+                    state.completions.popleft()
+                total += len(state.completions)
+        return total / self.rate_window
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Snapshot of pacing state for every host seen so far"""
+        with self._lock:
+            hosts = list(self._hosts.items())
+        return {
+            host: {
+                "rate_limit": round(state.bucket.rate, 2),
+                "observed_rate": round(self.current_rate(host), 2),
+                "concurrency": state.limiter.limit,
+                "in_flight": state.limiter.in_flight,
+                "requests": state.requests,
+                "throttled": state.throttled,
+            }
+            for host, state in hosts
+        }
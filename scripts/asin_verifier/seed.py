@@ -0,0 +1,215 @@
+"""
+Incremental upsert of validated products into data/asin-seed.json
+
+Results are merged into a category by ASIN: fields the verifier observes
+(title, brand, VRAM, price) are refreshed, previousPrice comes from the
+recorded price history when there is one, everything curated by hand
+(dxmScore, tdp, clocks, tags, image) is kept, and new ASINs are appended
+with defaults. The merged catalog is written to a temp file in the same
+directory and renamed over the original, so a crash mid-write leaves the
+previous catalog intact.
+"""
+
+import datetime
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .classifier import TitleClassifier
+from .verifier import ValidationResult
+
+DEFAULT_SEED_PATH = "data/asin-seed.json"
+# What result_from_page() reports when it detected nothing
+UNDETECTED = (None, "", "Unknown")
+
+_classifier = TitleClassifier()
+
+Change = Tuple[Any, Any]
+
+
+@dataclass
+class SeedDiff:
+    """What an upsert changed (or would change, for a dry run)"""
+    category: str
+    added: List[str] = field(default_factory=list)
+    updated: Dict[str, Dict[str, Change]] = field(default_factory=dict)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated)
+
+    def summary(self) -> str:
+        return (f"{self.category}: {len(self.added)} added, {len(self.updated)} updated, "
+                f"{self.unchanged} unchanged")
+
+    def format(self, limit: int = 50) -> str:
+        """Human-readable diff, at most `limit` products listed"""
+        lines = [self.summary()]
+        for asin in self.added[:limit]:
+            lines.append(f"+ {asin}")
+        for asin, fields in list(self.updated.items())[:max(0, limit - len(self.added))]:
+            changes = ", ".join(f"{name}: {old!r} -> {new!r}" for name, (old, new) in fields.items())
+            lines.append(f"~ {asin}  {changes}")
+        hidden = len(self.added) + len(self.updated) - limit
+        if hidden > 0:
+            lines.append(f"... {hidden} more")
+        return "\n".join(lines)
+
+
+def new_product(result: ValidationResult, category: str = "gpu",
+                previous_price: Optional[float] = None) -> Dict[str, Any]:
+    """Seed entry for an ASIN not yet in the catalog"""
+    brand = result.brand or "Unknown"
+    if previous_price:
+        reference = int(previous_price)
+    else:
+        # No recorded price change: don't advertise a discount that never happened
+        reference = int(result.price) if result.price else 399
+    return {
+        "asin": result.asin,
+        "title": result.title,
+        "brand": brand,
+        "category": category,
+        "price": int(result.price) if result.price else 299,
+        "previousPrice": reference,
+        "dxmScore": 8.5,  # Default score
+        "vram": result.vram or "8GB",
+        "tdp": "200W",  # Default TDP
+        "boostClock": "2.5 GHz",
+        "baseClock": "2.0 GHz",
+        "imageUrl": f"/images/products/gpus/{brand.lower().replace(' ', '_')}_gpu.svg",
+        "domain": "com",
+        "tags": [category, "validated"],
+        "availability": "In Stock",
+        "primeEligible": True,
+        "vendor": "Amazon",
+        "affiliateUrl": f"https://www.amazon.com/dp/{result.asin}/?tag=dxm369-20"
+    }
+
+
+def detected_brand(result: ValidationResult) -> Optional[str]:
+    """
+    The result's brand if the classifier or the page byline found it.
+
+    result_from_page() falls back to the title's first word; that guess is not
+    detected data. A byline brand equal to the first word cannot be told apart
+    from the guess either, and is treated as one.
+    """
+    brand = result.brand
+    if brand in UNDETECTED:
+        return None
+    if _classifier.classify(result.title).brand == brand:
+        return brand
+    words = result.title.split()
+    return None if words and words[0] == brand else brand
+
+
+def observed_fields(result: ValidationResult) -> Dict[str, Any]:
+    """Fields the verifier can vouch for; anything it did not detect is left alone"""
+    fields: Dict[str, Any] = {"title": result.title}
+    brand = detected_brand(result)
+    if brand is not None:
+        fields["brand"] = brand
+    if result.vram not in UNDETECTED:
+        fields["vram"] = result.vram
+    if result.price:
+        fields["price"] = int(result.price)
+    return fields
+
+
+def merge_products(results: Iterable[ValidationResult], lookup: Callable[[str], Optional[Dict[str, Any]]],
+                   category: str = "gpu", previous_prices: Optional[Dict[str, float]] = None
+                   ) -> Tuple[SeedDiff, Dict[str, Dict[str, Any]]]:
+    """
+    Merge valid results over the products `lookup` finds by ASIN.
+
+    Existing products are updated in place. Returns the diff and every added or
+    updated product by ASIN, for the caller to store. previous_prices: price
+    before each ASIN's latest change, from PriceHistory; it becomes
+    previousPrice. Without it a changed price moves the old seed price there.
+    """
+    previous_prices = previous_prices or {}
+    touched: Dict[str, Dict[str, Any]] = {}
+    diff = SeedDiff(category)
+
+    for result in results:
+        if not result.valid:
+            continue
+        current = touched.get(result.asin) or lookup(result.asin)
+        if current is None:
+            touched[result.asin] = new_product(result, category, previous_prices.get(result.asin))
+            diff.added.append(result.asin)
+            continue
+
+        changes: Dict[str, Change] = {}
+        for name, value in observed_fields(result).items():
+            if current.get(name) != value:
+                changes[name] = (current.get(name), value)
+        reference = previous_prices.get(result.asin)
+        if reference is not None:
+            reference = int(reference)
+        elif "price" in changes and changes["price"][0] is not None:
+            # Last seen price becomes the reference price
+            reference = changes["price"][0]
+        if reference is not None and current.get("previousPrice") != reference:
+            changes["previousPrice"] = (current.get("previousPrice"), reference)
+
+        if changes:
+            for name, (_, value) in changes.items():
+                current[name] = value
+            diff.updated[result.asin] = changes
+            touched[result.asin] = current
+        else:
+            diff.unchanged += 1
+
+    return diff, touched
+
+
+def merge_results(seed: Dict[str, Any], results: Iterable[ValidationResult], category: str = "gpu",
+                  previous_prices: Optional[Dict[str, float]] = None) -> SeedDiff:
+    """Upsert valid results into seed['products'][category] in place (see merge_products)"""
+    products: List[Dict[str, Any]] = seed.setdefault("products", {}).setdefault(category, [])
+    index = {product.get("asin"): product for product in products}
+    diff, touched = merge_products(results, index.get, category, previous_prices)
+    products.extend(touched[asin] for asin in diff.added)
+    return diff
+
+
+def load_seed(path: str = DEFAULT_SEED_PATH) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_seed(seed: Dict[str, Any], path: str = DEFAULT_SEED_PATH):
+    """Write the catalog atomically: temp file in the same directory, fsync, rename"""
+    target = Path(path)
+    fd, tmp = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=str(target.parent))
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(seed, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        if target.exists():
+            os.chmod(tmp, target.stat().st_mode & 0o777)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def upsert_seed(results: Iterable[ValidationResult], path: str = DEFAULT_SEED_PATH, category: str = "gpu",
+                dry_run: bool = False, previous_prices: Optional[Dict[str, float]] = None) -> SeedDiff:
+    """Merge results into the seed file; with dry_run, only report the diff"""
+    seed = load_seed(path)
+    diff = merge_results(seed, results, category, previous_prices)
+    if diff.changed and not dry_run:
+        seed["lastUpdated"] = datetime.date.today().isoformat()
+        write_seed(seed, path)
+    return diff
@@ -0,0 +1,258 @@
+"""
+Indexed SQLite copy of the seed catalog
+
+data/asin-seed.json stays the source of truth; the store is an index over it
+(asin, category, brand) so lookups, duplicate checks and category listings are
+index queries instead of a full JSON parse and scan. sync() re-imports only
+when the JSON file changed since the last import, and export() writes the
+store back out in the same format and order.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .seed import DEFAULT_SEED_PATH, write_seed
+
+Product = Dict[str, Any]
+
+
+class SeedStore:
+    """SQLite-backed product index with JSON import/export"""
+
+    DEFAULT_PATH = "exports/asin-seed.sqlite"
+    # Part of the recorded source: a store written by an older layout is re-imported by sync()
+    VERSION = 2
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS products (
+                id INTEGER PRIMARY KEY,
+                category TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                asin TEXT NOT NULL,
+                brand TEXT,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_products_asin ON products(asin);
+            CREATE INDEX IF NOT EXISTS idx_products_category ON products(category, position);
+            CREATE INDEX IF NOT EXISTS idx_products_brand ON products(brand COLLATE NOCASE);
+            """
+        )
+        self._conn.commit()
+
+    # -- import / export -------------------------------------------------
+
+    def import_json(self, path: str = DEFAULT_SEED_PATH) -> int:
+        """Replace the store contents with a seed JSON file; returns the product count"""
+        source = Path(path)
+        with open(source, 'r', encoding='utf-8') as f:
+            seed = json.load(f)
+
+        products = seed.get("products", {})
+        # Top-level keys keep their order; non-list entries under "products" are kept verbatim
+        document = {
+            key: {name: items for name, items in products.items() if not isinstance(items, list)}
+            if key == "products" else value
+            for key, value in seed.items()
+        }
+        rows = [
+            (category, position, product.get("asin", ""), product.get("brand"), json.dumps(product))
+            for category, items in products.items() if isinstance(items, list)
+            for position, product in enumerate(items)
+        ]
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM products")
+            self._conn.executemany(
+                "INSERT INTO products (category, position, asin, brand, data) VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self._set_meta("document", document)
+            self._set_meta("categories", list(products))
+            self._set_meta("source", self._source(source))
+        return len(rows)
+
+    def _source(self, path: Path) -> Dict[str, Any]:
+        stat = path.stat()
+        return {"path": str(path.resolve()), "mtime": stat.st_mtime, "size": stat.st_size, "version": self.VERSION}
+
+    def current(self, path: str = DEFAULT_SEED_PATH) -> bool:
+        """Whether the store holds the JSON file as it is now (sync() would not re-import)"""
+        return self._get_meta("source") == self._source(Path(path))
+
+    def sync(self, path: str = DEFAULT_SEED_PATH) -> bool:
+        """Re-import only if the JSON file changed since the last import; returns whether it did"""
+        if self.current(path):
+            return False
+        self.import_json(path)
+        return True
+
+    def to_document(self) -> Dict[str, Any]:
+        """Rebuild the seed JSON document, categories and products in their original order"""
+        document = dict(self._get_meta("document") or {})
+        products: Dict[str, Any] = {}
+        extras = document.get("products", {})
+        for category in self._get_meta("categories") or []:
+            products[category] = extras[category] if category in extras else list(self.category(category))
+        for category in self.categories():
+            products.setdefault(category, list(self.category(category)))
+        document["products"] = products
+        return document
+
+    def export(self, path: str = DEFAULT_SEED_PATH):
+        """Write the store out as seed JSON (atomic replace); the store then mirrors that file"""
+        write_seed(self.to_document(), path)
+        with self._lock, self._conn:
+            self._set_meta("source", self._source(Path(path)))
+
+    # -- queries ---------------------------------------------------------
+
+    def get(self, asin: str, category: Optional[str] = None) -> Optional[Product]:
+        """First product with this ASIN (in `category`, if given), in catalog order"""
+        query = "SELECT data FROM products WHERE asin = ?"
+        params: Tuple[Any, ...] = (asin,)
+        if category is not None:
+            query += " AND category = ?"
+            params += (category,)
+        with self._lock:
+            row = self._conn.execute(query + " ORDER BY id LIMIT 1", params).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find(self, asin: str) -> List[Tuple[str, int, Product]]:
+        """Every (category, position, product) carrying this ASIN"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT category, position, data FROM products WHERE asin = ? ORDER BY id", (asin,)
+            ).fetchall()
+        return [(category, position, json.loads(data)) for category, position, data in rows]
+
+    def __contains__(self, asin: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM products WHERE asin = ? LIMIT 1", (asin,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def category(self, name: str) -> Iterator[Product]:
+        """Products of one category in catalog order, streamed from the index"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM products WHERE category = ? ORDER BY position", (name,)
+            ).fetchall()
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def by_brand(self, brand: str, category: Optional[str] = None) -> List[Product]:
+        query = "SELECT data FROM products WHERE brand = ? COLLATE NOCASE"
+        params: Tuple[Any, ...] = (brand,)
+        if category is not None:
+            query += " AND category = ?"
+            params += (category,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY id", params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def categories(self) -> Dict[str, int]:
+        """Product count per category"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT category, COUNT(*) FROM products GROUP BY category ORDER BY MIN(id)"
+            ).fetchall()
+        return dict(rows)
+
+    def listing(self) -> List[Tuple[str, int, str, Optional[str]]]:
+        """(category, position, asin, title) for every product, in catalog order, without decoding products"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT category, position, asin, json_extract(data, '$.title') FROM products ORDER BY id"
+            ).fetchall()
+
+    def fields(self) -> List[str]:
+        """Top-level keys of the seed document"""
+        return list(self._get_meta("document") or {})
+
+    def duplicates(self) -> Dict[str, List[Tuple[str, int, str]]]:
+        """ASINs listed more than once: asin -> [(category, position, title), ...]"""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT asin, category, position, json_extract(data, '$.title') FROM products
+                WHERE asin IN (SELECT asin FROM products WHERE asin != '' GROUP BY asin HAVING COUNT(*) > 1)
+                ORDER BY asin, id
+                """
+            ).fetchall()
+        found: Dict[str, List[Tuple[str, int, str]]] = {}
+        for asin, category, position, title in rows:
+            found.setdefault(asin, []).append((category, position, title or "Unknown"))
+        return found
+
+    # -- writes ----------------------------------------------------------
+
+    def upsert(self, product: Product, category: str):
+        """Replace the product with this ASIN in `category`, or append it"""
+        self.upsert_many([product], category)
+
+    def upsert_many(self, products: Iterable[Product], category: str):
+        """upsert() each product, in one transaction"""
+        with self._lock, self._conn:
+            for product in products:
+                asin = product.get("asin", "")
+                data = json.dumps(product)
+                updated = self._conn.execute(
+                    "UPDATE products SET brand = ?, data = ? WHERE category = ? AND asin = ?",
+                    (product.get("brand"), data, category, asin),
+                ).rowcount
+                if not updated:
+                    position = self._conn.execute(
+                        "SELECT COALESCE(MAX(position) + 1, 0) FROM products WHERE category = ?", (category,)
+                    ).fetchone()[0]
+                    self._conn.execute(
+                        "INSERT INTO products (category, position, asin, brand, data) VALUES (?, ?, ?, ?, ?)",
+                        (category, position, asin, product.get("brand"), data),
+                    )
+            # The store no longer mirrors the JSON file until it is exported
+            self._conn.execute("DELETE FROM meta WHERE key = 'source'")
+
+    def set_field(self, name: str, value: Any):
+        """Set a top-level field of the seed document (e.g. lastUpdated) for the next export"""
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'document'").fetchone()
+            document = json.loads(row[0]) if row else {}
+            document[name] = value
+            self._set_meta("document", document)
+            self._conn.execute("DELETE FROM meta WHERE key = 'source'")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "SeedStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -- meta ------------------------------------------------------------
+
+    def _get_meta(self, key: str) -> Any:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set_meta(self, key: str, value: Any):
+        # Caller holds the lock and the transaction
+        self._conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, json.dumps(value)))
@@ -0,0 +1,335 @@
+"""
+Sharded validation across worker processes or machines via a shared directory
+
+    <work_dir>/job.json               shard count, lease length
+    <work_dir>/shards/0007.txt        "index<TAB>ASIN" lines; ASIN -> shard by blake2b hash
+    <work_dir>/leases/0007.json       current holder and expiry (created with O_EXCL)
+    <work_dir>/results/0007.jsonl     finished shard, result records sorted by index
+
+Workers claim a shard by creating its lease file exclusively, heartbeat from a
+timer thread while validating, write results to a temp file and rename it
+into place. A lease whose heartbeat stops is expired; the next worker
+atomically renames it away and takes the shard over, and the old holder
+notices at its next heartbeat and abandons the shard. Every step is a create/rename on the shared
+directory, so any filesystem with atomic rename (local disk, NFS) works as
+the queue; there is no coordinator process to keep alive. Each worker runs
+its own ASINVerifier, so per-IP limits apply per machine.
+"""
+
+import hashlib
+import heapq
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from dataclasses import asdict
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .export import open_writer
+from .verifier import ASINVerifier, ValidationResult
+
+
+def shard_of(asin: str, shards: int) -> int:
+    """Stable shard number for an ASIN, identical on every machine and Python version"""
+    digest = hashlib.blake2b(asin.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shards
+
+
+def _write_atomic(path: Path, text: str):
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class ShardJob:
+    """A sharded validation job living in a shared directory"""
+
+    def __init__(self, work_dir: str):
+        self.root = Path(work_dir)
+        self.shard_dir = self.root / "shards"
+        self.lease_dir = self.root / "leases"
+        self.result_dir = self.root / "results"
+        self._config: Optional[Dict] = None
+
+    @property
+    def config(self) -> Dict:
+        if self._config is None:
+            with open(self.root / "job.json", encoding='utf-8') as f:
+                self._config = json.load(f)
+        return self._config
+
+    @property
+    def shards(self) -> int:
+        return self.config["shards"]
+
+    @property
+    def lease_seconds(self) -> float:
+        return self.config["lease_seconds"]
+
+    def name(self, shard: int) -> str:
+        return f"{shard:04d}"
+
+    def result_path(self, shard: int) -> Path:
+        return self.result_dir / f"{self.name(shard)}.jsonl"
+
+    def lease_path(self, shard: int) -> Path:
+        return self.lease_dir / f"{self.name(shard)}.json"
+
+    # -- planning --------------------------------------------------------
+
+    @classmethod
+    def create(cls, work_dir: str, asins: Iterable[str], shards: int = 64,
+               lease_seconds: float = 120.0) -> "ShardJob":
+        """Split ASINs into shard files; the input is streamed, one open file per shard"""
+        if shards < 1:
+            raise ValueError(f"shard count must be at least 1, got {shards}")
+        job = cls(work_dir)
+        if (job.root / "job.json").exists():
+            raise FileExistsError(f"{work_dir} already holds a job; merge or remove it first")
+        for directory in (job.shard_dir, job.lease_dir, job.result_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        files: Dict[int, IO[str]] = {}
+        counts = [0] * shards
+        try:
+            for index, asin in enumerate(asins):
+                shard = shard_of(asin, shards)
+                if shard not in files:
+                    files[shard] = open(job.shard_dir / f"{job.name(shard)}.txt", 'w', encoding='utf-8')
+                files[shard].write(f"{index}\t{asin}\n")
+                counts[shard] += 1
+        finally:
+            for f in files.values():
+                f.close()
+
+        # Empty shards still get a file so every shard number is claimable and mergeable
+        for shard in range(shards):
+            if not counts[shard]:
+                (job.shard_dir / f"{job.name(shard)}.txt").touch()
+        config = {"shards": shards, "lease_seconds": lease_seconds, "asins": sum(counts),
+                  "created": time.time()}
+        _write_atomic(job.root / "job.json", json.dumps(config, indent=2))
+        job._config = config
+        return job
+
+    def read_shard(self, shard: int) -> List[Tuple[int, str]]:
+        entries = []
+        with open(self.shard_dir / f"{self.name(shard)}.txt", encoding='utf-8') as f:
+            for line in f:
+                index, asin = line.rstrip("\n").split("\t")
+                entries.append((int(index), asin))
+        return entries
+
+    # -- leases ----------------------------------------------------------
+
+    def read_lease(self, shard: int) -> Optional[Dict]:
+        try:
+            with open(self.lease_path(shard), encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # Mid-write by another worker; treat as held
+            return {"worker": "?", "expires": time.time() + self.lease_seconds}
+
+    def try_lease(self, shard: int, worker: str) -> bool:
+        """Claim a shard: exclusive create, or take over an expired lease"""
+        path = self.lease_path(shard)
+        lease = self.read_lease(shard)
+        if lease is not None:
+            if lease["expires"] > time.time():
+                return False
+            # Only one contender wins the rename of the expired lease
+            try:
+                os.rename(path, path.with_name(f"{path.name}.expired-{uuid.uuid4().hex[:8]}"))
+            except FileNotFoundError:
+                return False
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        now = time.time()
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"worker": worker, "acquired": now, "expires": now + self.lease_seconds,
+                       "taken_over": lease is not None}, f)
+        return True
+
+    def renew(self, shard: int, worker: str) -> bool:
+        """
+        Extend our lease; False if another worker has taken the shard over.
+
+        An expired lease is never renewed, since a takeover may be under way.
+        Reading then writing is not atomic, so the lease is read back after
+        the write: a takeover that landed in between shows up there, and one
+        our write clobbered shows up at the new holder's next renewal.
+        """
+        lease = self.read_lease(shard)
+        if lease is None or lease.get("worker") != worker or lease["expires"] <= time.time():
+            return False
+        lease["expires"] = time.time() + self.lease_seconds
+        _write_atomic(self.lease_path(shard), json.dumps(lease))
+        lease = self.read_lease(shard)
+        return lease is not None and lease.get("worker") == worker
+
+    def release(self, shard: int, worker: str):
+        lease = self.read_lease(shard)
+        if lease is not None and lease.get("worker") == worker:
+            try:
+                os.unlink(self.lease_path(shard))
+            except FileNotFoundError:
+                pass
+
+    def reap(self) -> int:
+        """Remove expired leases so their shards are immediately claimable; returns how many"""
+        reaped = 0
+        now = time.time()
+        for shard in range(self.shards):
+            lease = self.read_lease(shard)
+            if lease is not None and lease["expires"] <= now and not self.result_path(shard).exists():
+                path = self.lease_path(shard)
+                try:
+                    os.rename(path, path.with_name(f"{path.name}.expired-{uuid.uuid4().hex[:8]}"))
+                    reaped += 1
+                except FileNotFoundError:
+                    pass
+        return reaped
+
+    # -- results ---------------------------------------------------------
+
+    def done(self, shard: int) -> bool:
+        return self.result_path(shard).exists()
+
+    def complete(self, shard: int, records: List[dict]):
+        records.sort(key=lambda record: record["index"])
+        _write_atomic(self.result_path(shard), "".join(json.dumps(record) + "\n" for record in records))
+
+    def status(self) -> Dict[str, object]:
+        now = time.time()
+        state = {"done": 0, "leased": 0, "expired": 0, "pending": 0}
+        workers: Dict[str, int] = {}
+        for shard in range(self.shards):
+            if self.done(shard):
+                state["done"] += 1
+                continue
+            lease = self.read_lease(shard)
+            if lease is None:
+                state["pending"] += 1
+            elif lease["expires"] <= now:
+                state["expired"] += 1
+            else:
+                state["leased"] += 1
+                workers[lease["worker"]] = workers.get(lease["worker"], 0) + 1
+        return {"shards": self.shards, "asins": self.config.get("asins"), **state, "workers": workers}
+
+    def finished(self) -> bool:
+        return all(self.done(shard) for shard in range(self.shards))
+
+    def merged_records(self) -> Iterator[dict]:
+        """All results in original input order (k-way merge of the sorted shard files)"""
+        files = [open(self.result_path(shard), encoding='utf-8') for shard in range(self.shards)]
+        try:
+            streams = [(json.loads(line) for line in f) for f in files]
+            yield from heapq.merge(*streams, key=lambda record: record["index"])
+        finally:
+            for f in files:
+                f.close()
+
+    def merge(self, output: str) -> int:
+        """Write every shard's results, in input order, to one export; returns the row count"""
+        missing = [shard for shard in range(self.shards) if not self.done(shard)]
+        if missing:
+            raise RuntimeError(f"{len(missing)} shards not finished yet (e.g. {self.name(missing[0])})")
+        with open_writer(output) as writer:
+            for record in self.merged_records():
+                record.pop("index")
+                writer.write(ValidationResult(**record))
+            return writer.rows
+
+
+class ShardWorker:
+    """Claims shards from a ShardJob and validates them until none are left"""
+
+    def __init__(self, job: ShardJob, verifier: ASINVerifier, concurrency: int = 8,
+                 worker_id: Optional[str] = None, poll: float = 5.0):
+        self.job = job
+        self.verifier = verifier
+        self.concurrency = concurrency
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:4]}"
+        self.poll = poll
+        self.completed: List[int] = []
+        self.abandoned: List[int] = []
+
+    def claim(self) -> Optional[int]:
+        # Start at a worker-specific offset so workers don't all race for shard 0
+        shards = self.job.shards
+        start = shard_of(self.worker_id, shards)
+        for step in range(shards):
+            shard = (start + step) % shards
+            if not self.job.done(shard) and self.job.try_lease(shard, self.worker_id):
+                if self.job.done(shard):
+                    # Finished by a previous holder between our checks
+                    self.job.release(shard, self.worker_id)
+                    continue
+                return shard
+        return None
+
+    def _heartbeat(self, shard: int, stop: threading.Event, lost: threading.Event):
+        """Renew the lease every quarter lease until stopped; sets `lost` once it fails"""
+        while not stop.wait(self.job.lease_seconds / 4):
+            if not self.job.renew(shard, self.worker_id):
+                lost.set()
+                return
+
+    def process(self, shard: int) -> bool:
+        """Validate one leased shard; False if the lease was lost midway"""
+        entries = self.job.read_shard(shard)
+        indexes: Dict[str, List[int]] = {}
+        for index, asin in entries:
+            indexes.setdefault(asin, []).append(index)
+
+        # Renewals run on their own thread so a slow validation cannot let the lease lapse
+        stop, lost = threading.Event(), threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(shard, stop, lost),
+                                     name=f"lease-{self.job.name(shard)}", daemon=True)
+        records: List[dict] = []
+        results = self.verifier.validate_many((asin for asin in indexes), concurrency=self.concurrency)
+        heartbeat.start()
+        try:
+            for _, result in results:
+                if lost.is_set():
+                    break
+                for index in indexes[result.asin]:
+                    records.append({"index": index, **asdict(result)})
+        finally:
+            stop.set()
+            heartbeat.join()
+            results.close()
+
+        # A last renewal confirms the shard is still ours before its results are published
+        if lost.is_set() or not self.job.renew(shard, self.worker_id):
+            self.abandoned.append(shard)
+            return False
+        self.job.complete(shard, records)
+        self.job.release(shard, self.worker_id)
+        self.completed.append(shard)
+        return True
+
+    def run(self, on_shard=None) -> int:
+        """Work until every shard is done; returns the number of shards this worker finished"""
+        while True:
+            shard = self.claim()
+            if shard is None:
+                if self.job.finished():
+                    return len(self.completed)
+                # Everything left is leased by live workers; wait for them or for an expiry
+                time.sleep(self.poll)
+                continue
+            self.process(shard)
+            if on_shard is not None:
+                on_shard(shard)
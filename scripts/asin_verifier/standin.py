@@ -0,0 +1,195 @@
+"""
+Local Amazon stand-in for offline verifier runs and benchmarks
+
+Serves /dp/<ASIN> product pages shaped like Amazon's (productTitle, bylineInfo,
+corePrice buy box, spec table) with configurable latency, error rate, 404
+rate, server-side throttling and page size. Pages are synthetic and
+deterministic per ASIN unless a directory of recorded <ASIN>.html pages is
+given.
+"""
+
+import hashlib
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+
+from .scheduler import TokenBucket
+
+_GPUS = [
+    ("MSI", "Gaming GeForce RTX 4070 Ti SUPER", 16, 799.99),
+    ("ASUS", "TUF Gaming GeForce RTX 4090 OC", 24, 1899.00),
+    ("Sapphire", "Pulse AMD Radeon RX 7800 XT Gaming", 16, 499.99),
+    ("Gigabyte", "GeForce RTX 4060 Ti Gaming OC", 8, 389.99),
+    ("XFX", "Speedster MERC310 AMD Radeon RX 7900XTX", 24, 929.99),
+    ("PNY", "GeForce RTX 4070 SUPER Verto", 12, 589.99),
+]
+_OTHER = [
+    ("Corsair", "Vengeance DDR5 32GB (2x16GB) 6000MHz Desktop Memory", 109.99),
+    ("Samsung", "990 PRO 2TB PCIe 4.0 NVMe SSD", 169.99),
+    ("AMD", "Ryzen 7 7800X3D 8-Core Desktop Processor", 369.00),
+]
+
+CAPTCHA_PAGE = (
+    '<html><head><title>Robot Check</title></head><body>'
+    '<form action="/errors/validateCaptcha">Type the characters you see</form></body></html>'
+)
+NOT_FOUND_PAGE = '<html><head><title>Page Not Found</title></head><body>Sorry! We couldn\'t find that page.</body></html>'
+
+
+@dataclass
+class StandInConfig:
+    latency: float = 0.05          # mean seconds before the first byte
+    jitter: float = 0.02           # +/- uniform spread around latency
+    error_rate: float = 0.0        # share of requests answered with HTTP 500
+    not_found_rate: float = 0.05   # share of ASINs that 404 (stable per ASIN)
+    non_gpu_rate: float = 0.1      # share of found ASINs that are not graphics cards (stable per ASIN)
+    throttle_rps: float = 0.0      # server-side limit; above it requests get 503 (0 = unlimited)
+    captcha_share: float = 0.5     # share of throttled requests answered with a 200 captcha page instead
+    page_kb: int = 200             # approximate product page size
+    pages_dir: Optional[str] = None
+    seed: int = 369
+
+
+def _bucket(asin: str, salt: str) -> float:
+    """Stable pseudo-random fraction in [0, 1) for an ASIN"""
+    digest = hashlib.blake2b(f"{salt}:{asin}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2 ** 64
+
+
+def product_page(asin: str, page_kb: int, non_gpu_rate: float = 0.1) -> str:
+    """Synthetic product page with buy-box fields placed roughly where Amazon puts them"""
+    pick = int(_bucket(asin, "model") * 1000)
+    if _bucket(asin, "kind") < non_gpu_rate:
+        brand, name, price = _OTHER[pick % len(_OTHER)]
+        title, spec = f"{brand} {name}", ""
+    else:
+        brand, name, vram, price = _GPUS[pick % len(_GPUS)]
+        title = f"{brand} {name} {vram}GB GDDR6 Graphics Card"
+        spec = f'<tr><th class="a-span3"> Graphics RAM Size </th><td> &lrm;{vram} GB </td></tr>'
+
+    filler = '<div class="a-row"><span class="a-size-base">Customers also viewed $19.99</span></div>\n'
+    blocks = max(1, page_kb * 1024 // len(filler))
+    head = blocks // 10
+    return (
+        f'<!doctype html><html><head><title>Amazon.com: {title}</title></head><body>'
+        + filler * head
+        + f'<span id="productTitle" class="a-size-large product-title-word-break">   {title}   </span>'
+        + f'<a id="bylineInfo" class="a-link-normal" href="/stores/{brand}">Visit the {brand} Store</a>'
+        + filler * head
+        + '<div id="corePrice_feature_div"><span class="a-price"><span class="a-offscreen">'
+        + f'${price:,.2f}</span></span></div>'
+        + filler * (blocks - 2 * head)
+        + f'<table id="productDetails_techSpec_section_1">{spec}</table></body></html>'
+    )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_StandInServer"
+
+    def do_GET(self):
+        standin = self.server.standin
+        cfg = standin.config
+        parts = self.path.strip("/").split("/")
+        asin = parts[1].upper() if len(parts) >= 2 and parts[0] == "dp" else ""
+
+        delay = max(0.0, cfg.latency + standin.rng.uniform(-cfg.jitter, cfg.jitter))
+        time.sleep(delay)
+
+        if not asin:
+            return self._send(404, NOT_FOUND_PAGE)
+        if standin.throttle is not None and not standin.throttle.try_acquire():
+            standin.count("throttled")
+            if standin.rng.random() < cfg.captcha_share:
+                return self._send(200, CAPTCHA_PAGE)
+            return self._send(503, CAPTCHA_PAGE, {"Retry-After": "1"})
+        if standin.rng.random() < cfg.error_rate:
+            standin.count("errors")
+            return self._send(500, "<html><title>Internal Error</title></html>")
+        if _bucket(asin, "404") < cfg.not_found_rate:
+            standin.count("not_found")
+            return self._send(404, NOT_FOUND_PAGE)
+
+        standin.count("ok")
+        return self._send(200, standin.page(asin))
+
+    def _send(self, status: int, body: str, headers: Optional[Dict[str, str]] = None):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html;charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        try:
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client stopped reading early (streaming extractor); expected
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+    standin: "AmazonStandIn"
+
+    def handle_error(self, request, client_address):
+        # Clients hanging up mid-body are routine here; keep benchmark output clean
+        pass
+
+
+class AmazonStandIn:
+    """Threaded local HTTP server imitating Amazon product pages; use as a context manager"""
+
+    def __init__(self, config: Optional[StandInConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StandInConfig()
+        self.rng = random.Random(self.config.seed)
+        self.throttle = TokenBucket(self.config.throttle_rps, max(1.0, self.config.throttle_rps)) \
+            if self.config.throttle_rps > 0 else None
+        self.counters: Dict[str, int] = {"ok": 0, "not_found": 0, "errors": 0, "throttled": 0}
+        self._lock = threading.Lock()
+        self._server = _StandInServer((host, port), _Handler)
+        self._server.standin = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key: str):
+        with self._lock:
+            self.counters[key] += 1
+
+    def page(self, asin: str) -> str:
+        if self.config.pages_dir:
+            recorded = Path(self.config.pages_dir) / f"{asin}.html"
+            if recorded.exists():
+                return recorded.read_text(encoding="utf-8", errors="replace")
+        # Regenerated per request: cheap, and keeps server memory flat on huge ASIN lists
+        return product_page(asin, self.config.page_kb, self.config.non_gpu_rate)
+
+    def start(self) -> "AmazonStandIn":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="amazon-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def __enter__(self) -> "AmazonStandIn":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
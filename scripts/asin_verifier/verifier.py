@@ -0,0 +1,383 @@
+"""
+ASIN validation against Amazon product pages
+"""
+
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from urllib3.util import make_headers
+
+from .classifier import TitleClassifier
+from .extract import NO_TITLE, PageFields, extract_stream
+from .metrics import TimedHTTPAdapter, VerifierMetrics, take_connect_time
+from .scheduler import FetchScheduler
+
+if TYPE_CHECKING:
+    from .archive import PageArchive
+    from .cache import CacheEntry, ResultCache
+    from .negative import NegativeFilter
+
+
+@dataclass
+class ValidationResult:
+    asin: str
+    status_code: int
+    title: str
+    is_gpu: bool
+    price: Optional[float] = None
+    brand: Optional[str] = None
+    vram: Optional[str] = None
+    notes: str = ""
+    valid: bool = False
+    tier: Optional[str] = None
+
+
+def is_definitive(result: ValidationResult) -> bool:
+    """
+    True when a result settles the ASIN (found or 404), False when it is worth retrying.
+
+    A 200 page without an extracted title (new markup, a captcha served as 200)
+    settles nothing; the cache, journal and negative filter all go by this.
+    """
+    if result.status_code == 404:
+        return True
+    return result.status_code == 200 and result.title not in ("Throttled", NO_TITLE)
+
+
+def result_from_page(asin: str, status_code: int, page: PageFields,
+                     classifier: TitleClassifier) -> ValidationResult:
+    """Build the result for a fetched (non-throttled) page; shared by live runs and archive re-extraction"""
+    title = page.best_title
+    classified = classifier.classify(title)
+    is_gpu = classified.is_gpu
+    # Title first, then the page byline / spec table, then the old first-word guess
+    brand = classified.brand or page.brand or (title.split()[0] if title else "Unknown")
+    vram = classified.vram or page.vram or "Unknown"
+
+    if status_code == 404:
+        notes = "Product not found (404)"
+        valid = False
+    elif status_code == 200 and is_gpu:
+        notes = "Valid GPU product"
+        valid = True
+    elif status_code == 200:
+        notes = f"Found but not GPU: {title[:30]}..."
+        valid = False
+    else:
+        notes = f"HTTP {status_code}"
+        valid = False
+
+    return ValidationResult(
+        asin=asin,
+        status_code=status_code,
+        title=title,
+        is_gpu=is_gpu,
+        price=page.price,
+        brand=brand,
+        vram=vram,
+        notes=notes,
+        valid=valid,
+        tier=classified.tier
+    )
+
+
+class DeadlineExceeded(requests.Timeout):
+    """A page fetch (including retries and body download) ran past its total deadline"""
+
+
+class ASINVerifier:
+    """Validates Amazon ASINs and extracts product metadata"""
+
+    THROTTLE_STATUSES = {429, 503}
+    CAPTCHA_MARKERS = ('/errors/validateCaptcha', 'Robot Check', 'api-services-support@amazon.com')
+    # After early termination, bodies with at most this much left are drained to keep the connection
+    DRAIN_BYTES = 64 * 1024
+
+    def __init__(self, scheduler: Optional[FetchScheduler] = None, pool_size: int = 32,
+                 timeout: Union[float, Tuple[float, float]] = (5, 10), deadline: float = 30.0,
+                 cache: Optional["ResultCache"] = None, base_url: str = "https://www.amazon.com",
+                 negative: Optional["NegativeFilter"] = None, metrics: Optional[VerifierMetrics] = None,
+                 archive: Optional["PageArchive"] = None):
+        """
+        pool_size: keep-alive connections kept per host; match the highest concurrency used.
+        timeout: per-request (connect, read) socket timeout in seconds.
+        deadline: total wall time per ASIN across retries, backoff and body download.
+        cache: optional ResultCache; fresh entries skip the network entirely.
+        base_url: storefront origin; point at a local stand-in for offline runs and benchmarks.
+        negative: optional NegativeFilter; known 404 / non-GPU ASINs are skipped while
+            `skip_known_dead` is set, and fresh dead results are always recorded.
+        metrics: VerifierMetrics to record phase timings and counters into (one is created if omitted).
+        archive: optional PageArchive; every fetched page is downloaded in full (no early
+            stop) and stored for offline re-extraction.
+        """
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            # gzip/deflate always, br when brotli is installed for urllib3 to decode it
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
+        }
+        self.scheduler = scheduler or FetchScheduler()
+        self.timeout = timeout
+        self.deadline = deadline
+        self.cache = cache
+        self.negative = negative
+        self.archive = archive
+        self.skip_known_dead = True
+        # False: fresh cache entries only supply ETag/Last-Modified, the page is always re-fetched
+        self.serve_cached = True
+        self.base_url = base_url.rstrip('/')
+        self.classifier = TitleClassifier()
+        self.metrics = metrics or VerifierMetrics()
+
+        self._adapter = TimedHTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def connection_stats(self) -> Dict[str, int]:
+        """Requests sent vs. TCP/TLS connections opened by the pool (live pools only)"""
+        pools = self._adapter.poolmanager.pools
+        requests_sent = connections = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                requests_sent += pool.num_requests
+                connections += pool.num_connections
+        return {
+            "requests": requests_sent,
+            "connections_opened": connections,
+            "connections_reused": max(0, requests_sent - connections),
+        }
+
+    def validate_asin(self, asin: str) -> ValidationResult:
+        """Validate an ASIN and extract metadata, serving fresh cached results when available"""
+        started = time.perf_counter()
+        result, source = self._validate(asin)
+        self.metrics.completed(time.perf_counter() - started, source)
+        return result
+
+    def _validate(self, asin: str) -> Tuple[ValidationResult, str]:
+        """(result, where it came from: negative, cache or remote)"""
+        if self.negative is not None and self.skip_known_dead:
+            skipped = self.negative.skip_result(asin)
+            if skipped is not None:
+                return skipped, "negative"
+
+        if self.cache is None:
+            return self._validate_remote(asin), "remote"
+
+        entry = self.cache.get(asin)
+        self.cache.record_lookup(hit=entry is not None and entry.fresh and self.serve_cached)
+        if entry is not None and entry.fresh and self.serve_cached:
+            return entry.result, "cache"
+        return self._validate_remote(asin, entry if entry is not None and entry.revalidatable else None), "remote"
+
+    def _validate_remote(self, asin: str, stale: Optional["CacheEntry"] = None) -> ValidationResult:
+        """Fetch the product page; revalidate conditionally when a stale cache entry is given"""
+        url = f"{self.base_url}/dp/{asin}"
+
+        conditional = {}
+        if stale is not None:
+            if stale.etag:
+                conditional['If-None-Match'] = stale.etag
+            if stale.last_modified:
+                conditional['If-Modified-Since'] = stale.last_modified
+
+        try:
+            response, page = self._fetch(url, conditional)
+            if response.status_code == 304 and stale is not None:
+                self.cache.touch(stale)
+                return stale.result
+            if self._is_throttled(response, page):
+                reason = "captcha page" if response.status_code == 200 else f"HTTP {response.status_code}"
+                return ValidationResult(asin=asin, status_code=response.status_code, title="Throttled",
+                                        is_gpu=False, notes=f"Throttled after retries ({reason})")
+
+            result = result_from_page(asin, response.status_code, page, self.classifier)
+            if self.archive is not None and page.body is not None:
+                self.archive.put(asin, response.status_code, page.body, response.encoding,
+                                 complete=not page.truncated)
+            if self.cache is not None:
+                self.cache.put(result, etag=response.headers.get('ETag'),
+                               last_modified=response.headers.get('Last-Modified'))
+            if self.negative is not None:
+                self.negative.record(result)
+            return result
+
+        except requests.Timeout:
+            self.metrics.error("timeout")
+            return ValidationResult(asin=asin, status_code=0, title="Error", is_gpu=False,
+                                   notes="Request timeout")
+        except Exception as e:
+            self.metrics.error("connection" if isinstance(e, requests.ConnectionError) else type(e).__name__)
+            return ValidationResult(asin=asin, status_code=0, title="Error", is_gpu=False,
+                                   notes=f"Error: {str(e)[:50]}")
+
+    def _fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[requests.Response, PageFields]:
+        """GET a page through the host scheduler, retrying throttled attempts with backoff"""
+        host = urlsplit(url).hostname or ""
+        deadline_at = time.monotonic() + self.deadline
+        attempt = 0
+
+        metrics = self.metrics
+        while True:
+            try:
+                waiting = time.perf_counter()
+                with self.scheduler.slot(host):
+                    sent = time.perf_counter()
+                    metrics.phase("queue", sent - waiting)
+                    take_connect_time()
+                    response = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+                    connect = take_connect_time()
+                    metrics.phase("connect", connect)
+                    metrics.phase("server", time.perf_counter() - sent - connect)
+                    page = self._read_page(response, deadline_at)
+            except (requests.Timeout, requests.ConnectionError) as e:
+                # Stalled or refused connections are congestion too
+                metrics.attempt(0, throttled=True, retry=attempt > 0)
+                self.scheduler.record(host, throttled=True)
+                delay = self.scheduler.backoff_delay(attempt)
+                if attempt >= self.scheduler.max_retries or time.monotonic() + delay > deadline_at:
+                    raise
+                # Only retried failures count here; the final one is counted where the error result is built
+                metrics.error("timeout" if isinstance(e, requests.Timeout) else "connection")
+            else:
+                throttled = self._is_throttled(response, page)
+                metrics.attempt(response.status_code, throttled=throttled, retry=attempt > 0)
+                self.scheduler.record(host, throttled=throttled)
+                if not throttled or attempt >= self.scheduler.max_retries:
+                    return response, page
+                delay = self.scheduler.backoff_delay(attempt, response.headers.get('Retry-After'))
+                if time.monotonic() + delay > deadline_at:
+                    return response, page
+
+            time.sleep(delay)
+            metrics.phase("backoff", delay)
+            attempt += 1
+
+    def _read_page(self, response: requests.Response, deadline_at: float) -> PageFields:
+        """Stream the body through the extractor, stopping once every field is found"""
+        waited = 0.0
+
+        def chunks():
+            nonlocal waited
+            body = response.iter_content(chunk_size=16384)
+            while True:
+                started = time.perf_counter()
+                chunk = next(body, None)
+                waited += time.perf_counter() - started
+                if chunk is None:
+                    return
+                yield chunk
+                if time.monotonic() > deadline_at:
+                    raise DeadlineExceeded(f"deadline of {self.deadline}s exceeded")
+
+        started = time.perf_counter()
+        try:
+            archiving = self.archive is not None
+            page = extract_stream(chunks(), response.encoding, stop_early=not archiving, keep_body=archiving)
+            self.metrics.phase("download", waited)
+            self.metrics.phase("extract", time.perf_counter() - started - waited)
+            self.metrics.incr("bytes", page.bytes_read)
+            if page.truncated:
+                self._drain(response)
+        finally:
+            # Fully read bodies go back to the pool; partially read ones are dropped
+            response.close()
+        return page
+
+    def _drain(self, response: requests.Response):
+        """Finish short remainders so the connection stays reusable; give up on long ones"""
+        drained = 0
+        for chunk in response.iter_content(chunk_size=16384):
+            drained += len(chunk)
+            if drained > self.DRAIN_BYTES:
+                return
+
+    def _is_throttled(self, response: requests.Response, page: PageFields) -> bool:
+        """True for rate-limit responses, including 200 OK captcha interstitials"""
+        if response.status_code in self.THROTTLE_STATUSES:
+            return True
+        if response.status_code == 200:
+            return any(marker in page.head for marker in self.CAPTCHA_MARKERS)
+        return False
+
+    def validate_many(self, asins: Iterable[str], concurrency: int = 8,
+                      known: Optional[Callable[[str], Optional[ValidationResult]]] = None,
+                      coalesce_window: int = 100_000) -> Iterator[Tuple[int, ValidationResult]]:
+        """
+        Validate ASINs concurrently, yielding (input index, result) as each finishes.
+
+        At most `concurrency` requests run at once and only twice that many ASINs
+        are pulled from `asins` ahead of completion, so arbitrarily long inputs
+        (generators, file streams) are validated in bounded memory. Results arrive
+        in completion order; use the index to restore input order if needed.
+
+        known: lookup returning an already-settled result (e.g. from a resume
+            journal); such ASINs are yielded immediately without a fetch.
+        coalesce_window: repeated ASINs share one fetch. In-flight duplicates wait
+            for it; finished ones are answered from the last `coalesce_window`
+            distinct results.
+        """
+        concurrency = max(1, int(concurrency))
+        window = concurrency * 2
+        source = iter(enumerate(asins))
+        pending: Dict[Future, str] = {}
+        waiting: Dict[str, List[int]] = {}
+        finished: "OrderedDict[str, ValidationResult]" = OrderedDict()
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="asin-verify")
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < window:
+                    try:
+                        index, asin = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+
+                    if asin in waiting:
+                        waiting[asin].append(index)
+                        continue
+                    result = finished.get(asin)
+                    if result is None and known is not None:
+                        result = known(asin)
+                    if result is not None:
+                        yield index, result
+                        continue
+
+                    waiting[asin] = [index]
+                    pending[executor.submit(self.validate_asin, asin)] = asin
+
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    asin = pending.pop(future)
+                    result = future.result()
+                    if coalesce_window > 0:
+                        finished[asin] = result
+                        if len(finished) > coalesce_window:
+                            finished.popitem(last=False)
+                    for index in waiting.pop(asin):
+                        yield index, result
+        finally:
+            # Consumer stopped early (or finished): drop queued work, don't block on it
+            executor.shutdown(wait=False, cancel_futures=True)
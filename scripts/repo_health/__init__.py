@@ -0,0 +1,25 @@
+"""
+DXM repo health scanner
+Source-tree and seed-catalog checks behind scripts/dxm-repo-health-scanner.py
+"""
+
+from .cache import ScanCache
+from .context import JsonDocument, ScanContext, SourceFile
+from .graph import ImportEdge, ModuleGraph, PathAliases
+from .lexer import ImportRecord, Lexed, lex, tokenize
+from .scanner import DXMRepoScanner
+
+__all__ = [
+    "DXMRepoScanner",
+    "ImportEdge",
+    "ImportRecord",
+    "JsonDocument",
+    "Lexed",
+    "ModuleGraph",
+    "PathAliases",
+    "ScanCache",
+    "ScanContext",
+    "SourceFile",
+    "lex",
+    "tokenize",
+]
@@ -0,0 +1,146 @@
+"""
+Lexer vs regex extraction benchmark over the real source tree
+
+Times the previous whole-file regex extraction (identifier sweep plus the
+import and export patterns, exactly as SourceFile ran them) against the
+lexer on the same decoded files, and
+compares what each feeds the checks: "possible undefined" names and import
+edges (the regexes also pick up imports that sit in comments or strings).
+"""
+
+import re
+import time
+from dataclasses import asdict, dataclass
+from typing import List, Set, Tuple
+
+from .context import ScanContext
+from .lexer import lex
+
+# The regex extraction SourceFile did before the lexer, reproduced in full as the baseline
+IDENTIFIER = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b')
+NAMED_IMPORT = re.compile(r'import\s+{([^}]+)}\s+from')
+DEFAULT_IMPORT = re.compile(r'import\s+(\w+)\s+from')
+IMPORT_FROM = re.compile(r"""\bimport\s+(?:type\s+)?([\w$]+\s*,?\s*)?(\*\s*as\s+[\w$]+|{[^}]*})?\s*from\s*['"]([^'"]+)['"]""")
+IMPORT_BARE = re.compile(r"""\bimport\s*['"]([^'"]+)['"]|\bimport\(\s*['"]([^'"]+)['"]\s*\)|\brequire\(\s*['"]([^'"]+)['"]\s*\)""")
+EXPORT_FROM = re.compile(r"""\bexport\s+(?:type\s+)?(\*(?:\s*as\s+([\w$]+))?|{([^}]*)})\s*(?:from\s*['"]([^'"]+)['"])?""")
+EXPORT_DECLARATION = re.compile(
+    r'\bexport\s+(?:declare\s+)?(default\s+)?(?:async\s+)?(?:abstract\s+)?'
+    r'(?:function\s*\*?|class|const|let|var|interface|type|enum|namespace)\s+([\w$]+)'
+)
+EXPORT_DEFAULT = re.compile(r'\bexport\s+default\b')
+EXPORT_OPAQUE = re.compile(r'\bexport\s*=|\bmodule\.exports\b|\bexports\.[\w$]+\s*=|\bexport\s+(?:const|let|var)\s*[{\[]')
+
+
+def _imported_names(specifiers: str) -> Tuple[str, ...]:
+    names = []
+    for specifier in specifiers.split(','):
+        parts = specifier.split()
+        if parts and parts[0] == "type" and len(parts) > 1 and parts[1] != "as":
+            parts = parts[1:]
+        if parts:
+            names.append(parts[0])
+    return tuple(names)
+
+
+def _local_names(specifiers: str) -> List[str]:
+    return [specifier.split()[-1] for specifier in specifiers.split(',') if specifier.split()]
+
+
+def regex_extract(text: str) -> Tuple[Set[str], Set[str], List[Tuple[str, Tuple[str, ...]]]]:
+    """(identifiers, locally bound import names, module imports) the way SourceFile used to compute them"""
+    identifiers = set(IDENTIFIER.findall(text))
+    bound = set(DEFAULT_IMPORT.findall(text))
+    for specifiers in NAMED_IMPORT.findall(text):
+        bound.update(_local_names(specifiers))
+
+    imports: List[Tuple[str, Tuple[str, ...]]] = []
+    for default, clause, specifier in IMPORT_FROM.findall(text):
+        names: Tuple[str, ...] = ("default",) if default.strip(" ,") else ()
+        if clause.startswith("{"):
+            names += _imported_names(clause[1:-1])
+        elif clause:
+            names += ("*",)
+        imports.append((specifier, names))
+    for groups in IMPORT_BARE.findall(text):
+        imports.append((next(group for group in groups if group), ()))
+    for _, _, names, specifier in EXPORT_FROM.findall(text):
+        if specifier:
+            imports.append((specifier, _imported_names(names) if names else ()))
+
+    # Export table and star exports: computed then, compared by nothing here
+    exported = {"default" if default else name for default, name in EXPORT_DECLARATION.findall(text)}
+    if EXPORT_DEFAULT.search(text):
+        exported.add("default")
+    for _, alias, specifiers, _ in EXPORT_FROM.findall(text):
+        if alias:
+            exported.add(alias)
+        elif specifiers:
+            exported.update(_local_names(specifiers))
+    if EXPORT_OPAQUE.search(text):
+        exported.add("*")
+    {specifier for star, _, _, specifier in EXPORT_FROM.findall(text) if specifier and star == "*"}
+    return identifiers, bound, imports
+
+
+@dataclass
+class ExtractionReport:
+    method: str
+    files: int
+    megabytes: float
+    seconds: float
+    undefined: int          # "possible undefined" names reported, after the scanner's filters
+    imports: int            # import edges found
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.megabytes / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "mb_per_second": round(self.mb_per_second, 2)}
+
+
+def _reported(names: Set[str], builtins: Set[str]) -> Set[str]:
+    return {name for name in names - builtins if len(name) > 2 and not name[0].isupper()}
+
+
+def run_lexer_bench(context: ScanContext, builtins: Set[str], repeat: int = 5) -> List[ExtractionReport]:
+    """
+    Best of `repeat` timings for each method over every readable file of the context.
+
+    The methods alternate within each round, so a noisy neighbour slows both
+    rather than whichever happened to run during it.
+    """
+    sources = [source for source in context.files if source.error is None and source.text]
+    megabytes = sum(len(source.text) for source in sources) / 1e6
+    methods = {
+        "regex": lambda source: regex_extract(source.text),
+        "lexer": lambda source: lex(source.text, jsx=source.path.suffix == ".tsx"),
+    }
+    seconds = {name: float("inf") for name in methods}
+    outputs = {}
+    for _ in range(repeat):
+        for name, extract in methods.items():
+            started = time.perf_counter()
+            outputs[name] = [extract(source) for source in sources]
+            seconds[name] = min(seconds[name], time.perf_counter() - started)
+    regex_out, lexer_out = outputs["regex"], outputs["lexer"]
+
+    regex_undefined = sum(len(_reported(identifiers - bound, builtins)) for identifiers, bound, _ in regex_out)
+    lexer_undefined = sum(
+        len(_reported(lexed.references.keys() - lexed.declared - lexed.imported, builtins)) for lexed in lexer_out
+    )
+    return [
+        ExtractionReport("regex", len(sources), round(megabytes, 3), seconds["regex"], regex_undefined,
+                         sum(len(specifiers) for _, _, specifiers in regex_out)),
+        ExtractionReport("lexer", len(sources), round(megabytes, 3), seconds["lexer"], lexer_undefined,
+                         sum(len(lexed.imports) for lexed in lexer_out)),
+    ]
+
+
+def format_table(reports: List[ExtractionReport]) -> str:
+    header = f"{'method':>7} {'files':>6} {'MB':>7} {'secs':>8} {'MB/s':>7} {'undefined':>10} {'imports':>8}"
+    rows = [header, "-" * len(header)]
+    for r in reports:
+        rows.append(f"{r.method:>7} {r.files:>6} {r.megabytes:>7.2f} {r.seconds:>8.3f} {r.mb_per_second:>7.2f} "
+                    f"{r.undefined:>10} {r.imports:>8}")
+    return "\n".join(rows)
@@ -0,0 +1,81 @@
+"""
+Persistent per-file scan cache (.dxm-scan-cache)
+
+Stores each source file's extractions keyed by path, with its size, mtime
+and content hash. A file whose size and mtime are unchanged is not read at
+all; one whose mtime moved but whose content hash matches (checkout, touch)
+is read but not re-analyzed. Cross-file findings (dead components, broken
+imports) are always recomputed from the cached per-file data, so files that
+depend on a changed one are re-judged without being re-analyzed. The cache
+is rewritten atomically and only holds files seen in the latest scan.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Bump when an extraction changes so stale artifacts are never reused
+CACHE_VERSION = 3
+
+Entry = Dict[str, Any]
+
+
+class ScanCache:
+    """path -> {size, mtime_ns, digest, error, artifacts}"""
+
+    DEFAULT_NAME = ".dxm-scan-cache"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, Entry] = {}
+        self.fresh: Dict[str, Entry] = {}
+        self.unchanged = 0
+        self.same_content = 0
+        self.analyzed = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if document.get("version") == CACHE_VERSION:
+            self.entries = document.get("files", {})
+
+    def lookup(self, rel: str, stat: os.stat_result) -> Optional[Entry]:
+        """The entry for a file whose size and mtime are unchanged"""
+        entry = self.entries.get(rel)
+        if entry is not None and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry
+        return None
+
+    def digest(self, rel: str) -> Optional[str]:
+        entry = self.entries.get(rel)
+        return entry["digest"] if entry is not None else None
+
+    def store(self, rel: str, stat: os.stat_result, digest: str, error: Optional[str], artifacts: Dict[str, Any]):
+        self.fresh[rel] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest,
+                           "error": error, "artifacts": artifacts}
+
+    def save(self):
+        """Replace the cache file with this scan's entries"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f"{self.path.name}.", suffix=".tmp", dir=str(self.path.parent))
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"version": CACHE_VERSION, "files": self.fresh}, f, separators=(',', ':'))
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+        self.entries = self.fresh
+
+    def summary(self) -> str:
+        return (f"{self.unchanged} unchanged, {self.same_content} touched but identical, "
+                f"{self.analyzed} analyzed")
@@ -0,0 +1,307 @@
+"""
+Shared scan context: the source tree is walked and read once per scan
+
+Every .ts/.tsx file under src/ is read and decoded a single time; what the
+checks need (imports, exports, declarations, references) comes from one
+lexer pass per file, computed lazily and kept, and the seed JSON is parsed once for
+all the checks that look at it. When an asin_verifier SeedStore already
+indexes the seed as it is now, the seed checks query that instead; the scan
+never creates or updates the store. With a ScanCache, files unchanged
+since the last scan are not read at all.
+
+With jobs > 1 the per-file reading and extraction runs up front on a process
+pool instead; files come back in walk order, so results do not depend on
+which worker finished first.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from .cache import ScanCache
+from .lexer import Lexed, lex
+
+if TYPE_CHECKING:
+    from asin_verifier.seedstore import SeedStore
+
+SOURCE_SUFFIXES = (".ts", ".tsx")
+# SeedStore.DEFAULT_PATH; asin_verifier (and requests) is only imported when this file exists
+SEED_STORE_PATH = "exports/asin-seed.sqlite"
+
+@dataclass
+class SourceFile:
+    path: Path
+    rel: str
+    text: str = ""
+    error: Optional[str] = None
+    digest: str = ""
+    # Content matched the cached digest; extractions were not computed
+    unchanged: bool = False
+
+    @classmethod
+    def from_cache(cls, path: Path, entry: Dict[str, Any]) -> "SourceFile":
+        source = cls(path=path, rel=str(path), error=entry["error"], digest=entry["digest"])
+        for name, decode in EXTRACTIONS.items():
+            if name in entry["artifacts"]:
+                # Primes the cached_property, so the (unread) text is never consulted
+                source.__dict__[name] = decode(entry["artifacts"][name])
+        return source
+
+    def artifacts(self) -> Dict[str, Any]:
+        """Extractions in JSON-friendly form (none for unreadable files)"""
+        if self.error is not None:
+            return {}
+        return {
+            name: sorted(value) if isinstance(value, frozenset) else value
+            for name, value in ((name, getattr(self, name)) for name in EXTRACTIONS)
+        }
+
+    @cached_property
+    def lexed(self) -> Lexed:
+        """Tokens classified by the lexer (not cached on disk; the properties below are)"""
+        return lex(self.text, jsx=self.path.suffix == ".tsx")
+
+    @cached_property
+    def module_imports(self) -> List[Tuple[str, Tuple[str, ...]]]:
+        """
+        [(module specifier, imported names)] for every import, re-export, dynamic import and require.
+
+        Names are what the module must export: "default" for default imports,
+        "*" for namespaces; side-effect and dynamic imports name nothing.
+        """
+        return [(record.specifier, record.names) for record in self.lexed.imports]
+
+    @cached_property
+    def exports(self) -> frozenset:
+        """Names this module exports itself ("*" when they cannot be enumerated)"""
+        return frozenset(self.lexed.exports)
+
+    @cached_property
+    def star_exports(self) -> frozenset:
+        """Specifiers re-exported wholesale with `export * from`"""
+        return frozenset(self.lexed.star_exports)
+
+    @cached_property
+    def imported_names(self) -> frozenset:
+        """Local names bound by imports"""
+        return frozenset(self.lexed.imported)
+
+    @cached_property
+    def declared(self) -> frozenset:
+        """Names declared in the file (variables, functions, classes, types, parameters)"""
+        return frozenset(self.lexed.declared)
+
+    @cached_property
+    def references(self) -> Dict[str, int]:
+        """Identifiers used as values or types (not property names or keys) -> first line"""
+        return self.lexed.references
+
+
+# SourceFile properties computed eagerly for pool workers and the scan cache, with their JSON decoders
+EXTRACTIONS: Dict[str, Callable[[Any], Any]] = {
+    "module_imports": lambda value: [(specifier, tuple(names)) for specifier, names in value],
+    "exports": frozenset,
+    "star_exports": frozenset,
+    "imported_names": frozenset,
+    "declared": frozenset,
+    "references": dict,
+}
+
+
+def analyze_source(path: Path, known_digest: Optional[str] = None) -> SourceFile:
+    """
+    Read one file and compute every extraction eagerly (process pool worker).
+
+    When the content hashes to `known_digest` nothing is extracted and the
+    file comes back marked `unchanged`, for the caller to fill from its cache.
+    """
+    source = SourceFile(path=path, rel=str(path))
+    try:
+        data = path.read_bytes()
+    except OSError as e:
+        source.error = str(e)
+        return source
+    source.digest = hashlib.sha1(data).hexdigest()
+    if source.digest == known_digest:
+        source.unchanged = True
+        return source
+    try:
+        source.text = data.decode('utf-8')
+    except UnicodeDecodeError as e:
+        source.error = str(e)
+        return source
+    for name in EXTRACTIONS:
+        getattr(source, name)
+    return source
+
+
+def read_source(path: Path) -> SourceFile:
+    source = SourceFile(path=path, rel=str(path))
+    try:
+        source.text = path.read_bytes().decode('utf-8')
+    except (OSError, UnicodeDecodeError) as e:
+        source.error = str(e)
+    return source
+
+
+@dataclass
+class JsonDocument:
+    path: Path
+    data: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+
+
+class ScanContext:
+    """One walk of src/, each source file read once, parsed artifacts and JSON documents cached"""
+
+    # Below this many files a process pool costs more than it saves
+    PARALLEL_MIN_FILES = 64
+
+    def __init__(self, repo_path: Path, src: str = "src", jobs: int = 1, cache: Optional[ScanCache] = None):
+        """cache: optional ScanCache; unchanged files are served from it and it is saved after loading"""
+        self.repo_path = Path(repo_path)
+        self.jobs = jobs
+        self.cache = cache
+        self.src_dir = self.repo_path / src
+        self.files: List[SourceFile] = []
+        self.by_path: Dict[Path, SourceFile] = {}
+        self._paths: Dict[Path, bool] = {}
+        self._json: Dict[str, JsonDocument] = {}
+        self._stores: Dict[str, Optional["SeedStore"]] = {}
+        self._json_lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.src_dir.is_dir():
+            return
+        paths = []
+        for directory, subdirs, names in os.walk(self.src_dir):
+            subdirs.sort()
+            paths.extend(Path(directory) / name for name in sorted(names) if name.endswith(SOURCE_SUFFIXES))
+
+        cache = self.cache
+        keys = [str(path.relative_to(self.repo_path)) for path in paths]
+        stats = [path.stat() for path in paths] if cache is not None else []
+        sources: List[Optional[SourceFile]] = [None] * len(paths)
+        pending = []
+        for i, path in enumerate(paths):
+            entry = cache.lookup(keys[i], stats[i]) if cache is not None else None
+            if entry is not None:
+                sources[i] = SourceFile.from_cache(path, entry)
+                cache.unchanged += 1
+            else:
+                pending.append(i)
+
+        if self.jobs > 1 and len(pending) >= self.PARALLEL_MIN_FILES:
+            chunksize = max(1, len(pending) // (self.jobs * 4))
+            digests = [cache.digest(keys[i]) if cache is not None else None for i in pending]
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                analyzed = executor.map(analyze_source, [paths[i] for i in pending], digests, chunksize=chunksize)
+                for i, source in zip(pending, analyzed):
+                    sources[i] = source
+        elif cache is not None:
+            for i in pending:
+                sources[i] = analyze_source(paths[i], cache.digest(keys[i]))
+        else:
+            for i in pending:
+                sources[i] = read_source(paths[i])
+
+        for i, source in enumerate(sources):
+            if cache is not None:
+                if source.unchanged:
+                    source = SourceFile.from_cache(paths[i], cache.entries[keys[i]])
+                    cache.same_content += 1
+                elif i in pending:
+                    cache.analyzed += 1
+                cache.store(keys[i], stats[i], source.digest, source.error, source.artifacts())
+            self.add(source)
+        if cache is not None:
+            cache.save()
+
+    def add(self, source: SourceFile) -> SourceFile:
+        self.files.append(source)
+        self.by_path[source.path.resolve()] = source
+        return source
+
+    @property
+    def readable(self) -> List[SourceFile]:
+        return [source for source in self.files if source.error is None]
+
+    def under(self, *parts: str, suffix: Optional[str] = None) -> List[SourceFile]:
+        """Source files below src/<parts...>, optionally with one suffix"""
+        base = self.src_dir.joinpath(*parts)
+        return [
+            source for source in self.files
+            if source.path.is_relative_to(base) and (suffix is None or source.path.suffix == suffix)
+        ]
+
+    def exists(self, path: Path) -> bool:
+        """File existence, answered from the index for the source tree and memoized for anything else"""
+        path = path.resolve()
+        if path in self.by_path:
+            return True
+        known = self._paths.get(path)
+        if known is None:
+            known = self._paths[path] = path.exists()
+        return known
+
+    def json(self, rel: str) -> JsonDocument:
+        """A repo JSON file, parsed once per scan"""
+        with self._json_lock:
+            return self._load_json(rel)
+
+    def _load_json(self, rel: str) -> JsonDocument:
+        document = self._json.get(rel)
+        if document is None:
+            document = JsonDocument(self.repo_path / rel)
+            if document.exists:
+                try:
+                    with open(document.path) as f:
+                        document.data = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    document.error = e
+            self._json[rel] = document
+        return document
+
+    def seed_store(self, rel: str) -> Optional["SeedStore"]:
+        """
+        The existing SeedStore, if it indexes the seed catalog at `rel` as it is now.
+
+        None when there is no store, asin_verifier is not importable, the store
+        cannot be opened or it is out of date; callers then use json(). The
+        store is only read: syncing it is up to asin_verifier.
+        """
+        with self._json_lock:
+            if rel not in self._stores:
+                self._stores[rel] = self._open_store(rel)
+            return self._stores[rel]
+
+    def _open_store(self, rel: str) -> Optional["SeedStore"]:
+        store_path = self.repo_path / SEED_STORE_PATH
+        if not store_path.exists():
+            return None
+        try:
+            from asin_verifier.seedstore import SeedStore
+        except ImportError:
+            return None
+        store = None
+        try:
+            store = SeedStore(str(store_path))
+            if store.current(str(self.repo_path / rel)):
+                return store
+        except (OSError, sqlite3.Error):
+            pass
+        if store is not None:
+            store.close()
+        return None
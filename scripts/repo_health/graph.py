@@ -0,0 +1,176 @@
+"""
+Module dependency graph of the TS/TSX source tree
+
+Built once per scan from the per-file import/export extractions: every
+import specifier is resolved the way the bundler does it (relative paths,
+tsconfig `paths` aliases such as `@/*`, extension and index probing), giving
+forward edges, reverse edges (importers) and an export table per module with
+`export * from` followed. Dead-module, broken-import and missing-export
+questions are then lookups in these indexes.
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .context import ScanContext, SourceFile
+from .lexer import ANY_EXPORT
+
+# Probed in order for an extensionless specifier, then the same as index files
+RESOLVE_EXTENSIONS = (".ts", ".tsx", ".d.ts", ".js", ".jsx", ".mjs", ".json")
+
+_LINE_COMMENT = re.compile(r'^\s*//.*$', re.MULTILINE)
+_BLOCK_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+
+
+@dataclass
+class ImportEdge:
+    source: Path
+    specifier: str
+    names: Tuple[str, ...]          # imported export names; "*" for a namespace, () for side effects
+    target: Optional[Path] = None   # resolved module, None when unresolved or external
+    external: bool = False          # bare package specifier (node_modules)
+
+
+def load_tsconfig(path: Path) -> dict:
+    """tsconfig.json allows comments and trailing commas; fall back to stripping them"""
+    try:
+        text = path.read_text(encoding='utf-8')
+    except OSError:
+        return {}
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        text = _TRAILING_COMMA.sub(r'\1', _BLOCK_COMMENT.sub('', _LINE_COMMENT.sub('', text)))
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return {}
+
+
+class PathAliases:
+    """compilerOptions.paths patterns (`@/*` -> [`./src/*`]), longest prefix first"""
+
+    def __init__(self, tsconfig: dict, root: Path):
+        options = tsconfig.get("compilerOptions", {})
+        self.base = root / options.get("baseUrl", ".")
+        self.patterns: List[Tuple[str, str, List[str]]] = []
+        for pattern, targets in options.get("paths", {}).items():
+            prefix, _, suffix = pattern.partition("*")
+            self.patterns.append((prefix, suffix if "*" in pattern else None, targets))
+        self.patterns.sort(key=lambda entry: len(entry[0]), reverse=True)
+
+    def expand(self, specifier: str) -> Optional[List[Path]]:
+        """Candidate paths for an aliased specifier, or None if no pattern matches"""
+        for prefix, suffix, targets in self.patterns:
+            if suffix is None:
+                if specifier == prefix:
+                    return [self.base / target for target in targets]
+            elif specifier.startswith(prefix) and specifier.endswith(suffix) and \
+                    len(specifier) >= len(prefix) + len(suffix):
+                star = specifier[len(prefix):len(specifier) - len(suffix)]
+                return [self.base / target.replace("*", star) for target in targets]
+        return None
+
+
+class ModuleGraph:
+    """Forward/reverse import edges and export tables over a ScanContext"""
+
+    def __init__(self, context: ScanContext, tsconfig: Optional[Path] = None):
+        self.context = context
+        tsconfig = tsconfig if tsconfig is not None else context.repo_path / "tsconfig.json"
+        self.aliases = PathAliases(load_tsconfig(tsconfig), context.repo_path.resolve())
+        self.modules: Dict[Path, SourceFile] = {
+            source.path.resolve(): source for source in context.files if source.error is None
+        }
+        self.edges: Dict[Path, List[ImportEdge]] = {}
+        self.importers: Dict[Path, Set[Path]] = {}
+        self._exports: Dict[Path, Set[str]] = {}
+        self._build()
+
+    def _build(self):
+        for path, source in self.modules.items():
+            edges = []
+            for specifier, names in source.module_imports:
+                edge = ImportEdge(path, specifier, names)
+                candidates = self.candidates(path, specifier)
+                if candidates is None:
+                    edge.external = True
+                else:
+                    edge.target = self.probe(candidates)
+                if edge.target is not None:
+                    self.importers.setdefault(edge.target, set()).add(path)
+                edges.append(edge)
+            self.edges[path] = edges
+
+    def candidates(self, importer: Path, specifier: str) -> Optional[List[Path]]:
+        """Base paths a specifier may refer to; None for external packages"""
+        if specifier.startswith(("./", "../")) or specifier in (".", ".."):
+            return [importer.parent / specifier]
+        if specifier.startswith("/"):
+            return [Path(specifier)]
+        return self.aliases.expand(specifier)
+
+    def probe(self, candidates: List[Path]) -> Optional[Path]:
+        """First existing file for the candidates: as-is, with each extension, then as a directory index"""
+        for base in candidates:
+            # Collapse . and .. lexically, without touching the filesystem
+            base = Path(os.path.normpath(base))
+            options = [base] + [base.with_name(base.name + ext) for ext in RESOLVE_EXTENSIONS] + \
+                [base / f"index{ext}" for ext in RESOLVE_EXTENSIONS]
+            for option in options:
+                if option in self.modules:
+                    return option
+                if self.context.exists(option) and not option.is_dir():
+                    return option
+        return None
+
+    # -- queries ---------------------------------------------------------
+
+    def exports(self, path: Path) -> Set[str]:
+        """Names a module exports, including those re-exported with `export * from`"""
+        cached = self._exports.get(path)
+        if cached is not None:
+            return cached
+        source = self.modules.get(path)
+        if source is None:
+            # Not analyzed (JSON, JS outside src, ...): anything may be there
+            return {ANY_EXPORT}
+        names: Set[str] = set(source.exports)
+        # Guard against export * cycles before recursing
+        self._exports[path] = names
+        for edge in self.edges.get(path, []):
+            if edge.specifier in source.star_exports:
+                if edge.target is None:
+                    names.add(ANY_EXPORT)
+                else:
+                    names.update(name for name in self.exports(edge.target) if name != "default")
+        return names
+
+    def broken_imports(self) -> Iterator[ImportEdge]:
+        """Relative or aliased imports that resolve to no file"""
+        for edges in self.edges.values():
+            for edge in edges:
+                if not edge.external and edge.target is None:
+                    yield edge
+
+    def missing_exports(self) -> Iterator[Tuple[ImportEdge, str]]:
+        """(edge, name) for every imported name its resolved module does not export"""
+        for edges in self.edges.values():
+            for edge in edges:
+                if edge.target is None or edge.target not in self.modules:
+                    continue
+                exported = self.exports(edge.target)
+                if ANY_EXPORT in exported:
+                    continue
+                for name in edge.names:
+                    if name != "*" and name not in exported:
+                        yield edge, name
+
+    def unimported(self, paths: List[Path]) -> List[Path]:
+        """The given modules that nothing imports"""
+        return [path for path in paths if not self.importers.get(path.resolve())]
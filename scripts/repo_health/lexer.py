@@ -0,0 +1,702 @@
+"""
+Lightweight TypeScript/TSX lexer for the health checks
+
+One pass over the text produces identifier, string, number and punctuation
+tokens with their offsets. Comments and string contents are skipped rather
+than tokenized, template literals are entered only for their ${...} code,
+and in .tsx files JSX text and attribute names are skipped while tag names
+and {expressions} are kept. A second walk over the token list (with bracket
+matching) classifies identifiers as declarations, property names / object
+keys, or references, and collects imports and exports.
+
+This is a heuristic, not a parser: it is tuned so that "possibly undefined"
+names are rare and real, not to accept or reject programs.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+# Token kinds
+ID, NUM, STR, PUNCT, JSX_TAG, JSX_END = "id", "num", "str", "punct", "jsxtag", "jsxend"
+
+Token = Tuple[str, str, int]    # (kind, value, offset)
+
+# One capture around the whole alternation keeps every branch led by a literal or
+# character class, so the regex engine rejects non-matching branches on their
+# first character; the Python side then dispatches on that character (_FIRST).
+# Comments and strings are written unrolled rather than as per-character
+# alternations. 2/3: string contents.
+_CODE = re.compile(r"""\s*(
+        //[^\n]*|/\*[^*]*(?:\*+[^*/][^*]*)*(?:\*+/|\Z)
+      | [^\W\d][\w$]*|\$[\w$]*
+      | 0[xXbBoO][\da-fA-F_]+n?|\d[\d_]*\.?[\d_]*(?:[eE][+-]?\d+)?n?|\.\d[\d_]*(?:[eE][+-]?\d+)?n?
+      | '([^'\\\n]*(?:\\[\s\S][^'\\\n]*)*)'?
+      | "([^"\\\n]*(?:\\[\s\S][^"\\\n]*)*)"?
+      | `
+      | =>|\.\.\.|\?\.(?!\d)|\?\?=?|===?|!==?|<=|>=|&&=?|\|\|=?|\*\*=?|<<=?|>>>?=?|[+\-*%&|^]=|\+\+|--
+      | [{}()\[\];,<>+\-*%&|^!~?:=.@\#/]
+    )""", re.VERBOSE)
+# Token class by first character; anything else (non-ASCII) starts an identifier
+_FIRST: Dict[str, str] = {
+    **{char: ID for char in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_$"},
+    **{char: NUM for char in "0123456789"},
+    **{char: PUNCT for char in "{}()[];,<>+-*%&|^!~?:=@#"},
+    "'": STR, '"': STR, "/": "/", ".": ".", "`": "`",
+}
+_REGEX_LITERAL = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+_TEMPLATE_CHUNK = re.compile(r'(?:[^`\\$]|\\[\s\S]|\$(?!\{))*')
+_JSX_TEXT = re.compile(r'[^<{]*')
+_JSX_NAME = re.compile(r'\s*([A-Za-z_$][\w$]*(?:[.:\-][\w$]+)*)')
+_JSX_ATTR_STRING = re.compile(r'\s*(?:"[^"]*"|\'[^\']*\')')
+_JSX_CLOSE = re.compile(r'<\s*/\s*[\w$.:\-]*\s*>')
+_JSX_SKIP = re.compile(r'\s*(?://[^\n]*|/\*[\s\S]*?\*/)?\s*')
+
+KEYWORDS = frozenset("""
+    break case catch class const continue debugger default delete do else enum export extends false finally
+    for function if import in instanceof new null return super switch this throw true try typeof var void
+    while with yield let static implements interface package private protected public await async of get set
+    as satisfies keyof infer is asserts readonly declare abstract namespace module type unique override
+    accessor constructor undefined never unknown any
+""".split())
+
+# Built-in type names, never references to something importable
+TYPE_NAMES = frozenset(("string", "number", "boolean", "object", "symbol", "bigint"))
+
+# After these a '/' starts a regular expression and a '<' (in .tsx) starts JSX
+_OPERAND_KEYWORDS = frozenset(("return", "typeof", "case", "do", "else", "in", "of", "new", "delete", "void",
+                               "throw", "yield", "await", "instanceof", "default"))
+_CONTROL = frozenset(("if", "for", "while", "switch", "with", "catch", "return", "typeof", "await", "new",
+                      "yield", "void", "delete", "in", "of", "instanceof", "super", "import"))
+_MODIFIERS = frozenset(("public", "private", "protected", "readonly", "static", "override", "declare",
+                        "abstract", "async", "get", "set", "accessor"))
+_DECLARATORS = frozenset(("const", "let", "var"))
+_NAMED_DECLARATIONS = frozenset(("function", "class", "interface", "enum", "namespace", "module"))
+_STATEMENT_START = frozenset(("const", "let", "var", "function", "class", "if", "for", "while", "return", "export",
+                              "import", "switch", "try", "throw", "interface", "type", "enum", "do"))
+
+# Identifiers the main walk acts on (anything else only matters before `=>`)
+_STATEMENT_KEYWORDS = _DECLARATORS | _NAMED_DECLARATIONS | {"import", "export", "type", "require", "module"}
+_NON_REFERENCES = KEYWORDS | TYPE_NAMES
+_BRACKETS = frozenset("()[]{}")
+_AFTER_PARAMETERS = frozenset(("=>", "{", ":"))
+_CALL_CONTEXT = frozenset(("function", "catch", ">", ">>"))
+
+# Export table entry meaning "exports cannot be enumerated statically"
+ANY_EXPORT = "*"
+
+
+class _AbortJSX(Exception):
+    """A '<' taken for JSX turned out not to be (e.g. a `<T,>` generic)"""
+
+
+def _expression_expected(tokens: List[Token]) -> bool:
+    """True when the next token starts an operand (so '/' is a regex, '<' may open JSX)"""
+    if not tokens:
+        return True
+    kind, value, _ = tokens[-1]
+    if kind == PUNCT:
+        return value not in (")", "]", "}")
+    if kind == ID:
+        return value in _OPERAND_KEYWORDS
+    return False
+
+
+def tokenize(text: str, jsx: bool = False) -> List[Token]:
+    """Tokens of a TS (or, with jsx=True, TSX) source; comments and literal contents are not tokenized"""
+    tokens: List[Token] = []
+    append = tokens.append
+    finditer = _CODE.finditer
+    first_kind = _FIRST.get
+    braces: List[str] = []          # "{", or the mode a closing } resumes: "tmpl", "jsxtag", "jsxchild"
+    elements: List[int] = []        # open element count per JSX root being lexed
+    pos = 0
+    end = len(text)
+    mode = "code"
+    # Where each JSX root being lexed began: (offset, token count, braces, open roots) to rewind to
+    roots: List[Tuple[int, int, List[str], int]] = []
+    no_jsx_at = -1
+
+    while pos < end:
+        if mode == "code":
+            # Stay in one finditer() until something switches mode or needs a different pattern
+            for match in finditer(text, pos):
+                value = match.group(1)
+                kind = first_kind(value[0], ID)
+                if kind == ID:
+                    append((ID, value, match.start(1)))
+                elif kind == PUNCT:
+                    if value == "{":
+                        braces.append("{")
+                    elif value == "}":
+                        if braces:
+                            resume = braces.pop()
+                            if resume != "{":
+                                pos, mode = match.end(), resume
+                                break
+                    elif value == "<" and jsx:
+                        start = match.start(1)
+                        if start != no_jsx_at and _expression_expected(tokens) and start + 1 < end \
+                                and (text[start + 1].isalpha() or text[start + 1] in "_$>"):
+                            roots.append((start, len(tokens), list(braces), len(elements)))
+                            elements.append(1)
+                            pos, mode = start + 1, "jsxtag-name"
+                            break
+                    append((PUNCT, value, match.start(1)))
+                elif kind == STR:
+                    group = 2 if value[0] == "'" else 3
+                    append((STR, match.group(group), match.start(group)))
+                elif kind == "/":
+                    if value.startswith(("//", "/*")):
+                        continue    # comment
+                    start = match.start(1)
+                    if value == "/" and _expression_expected(tokens):
+                        literal = _REGEX_LITERAL.match(text, start)
+                        if literal is not None:
+                            append((STR, literal.group(), start))
+                            pos = literal.end()
+                            break
+                    append((PUNCT, value, start))
+                elif kind == ".":
+                    append((NUM if len(value) > 1 and value[1] != "." else PUNCT, value, match.start(1)))
+                elif kind == NUM:
+                    append((NUM, value, match.start(1)))
+                else:
+                    append((STR, "`", match.start(1)))
+                    pos, mode = match.end(), "tmpl"
+                    break
+            else:
+                break               # nothing but whitespace left
+
+        elif mode == "tmpl":
+            pos = _TEMPLATE_CHUNK.match(text, pos).end()
+            if pos >= end:
+                break
+            if text[pos] == "`":
+                pos += 1
+                mode = "code"
+            else:                   # ${
+                pos += 2
+                braces.append("tmpl")
+                mode = "code"
+
+        else:
+            try:
+                pos, mode = _lex_jsx(text, pos, mode, tokens, braces, elements)
+                if len(elements) < len(roots):
+                    roots.pop()
+            except _AbortJSX:
+                start, count, saved, depth = roots.pop()
+                del tokens[count:]
+                braces[:] = saved
+                del elements[depth:]
+                no_jsx_at = start
+                pos = start
+                mode = "code"
+
+    return tokens
+
+
+def _lex_jsx(text: str, pos: int, mode: str, tokens: List[Token], braces: List[str],
+             elements: List[int]) -> Tuple[int, str]:
+    """Advance through JSX markup; returns (position, mode) at the next piece of code or markup"""
+    end = len(text)
+    if mode == "jsxtag-name":
+        name = _JSX_NAME.match(text, pos)
+        if name is not None:
+            tokens.append((JSX_TAG, name.group(1), name.start(1)))
+            pos = name.end()
+        return pos, "jsxtag"
+
+    if mode == "jsxtag":
+        pos = _JSX_SKIP.match(text, pos).end()
+        if pos >= end:
+            return pos, mode
+        char = text[pos]
+        if char == ">":
+            return pos + 1, "jsxchild"
+        if text.startswith("/>", pos):
+            return _close_element(pos + 2, tokens, elements)
+        if char == "{":
+            braces.append("jsxtag")
+            return pos + 1, "code"
+        if char == "=":
+            value = _JSX_ATTR_STRING.match(text, pos + 1)
+            return (value.end() if value is not None else pos + 1), mode
+        name = _JSX_NAME.match(text, pos)
+        if name is not None:
+            return name.end(), mode        # attribute name: not a reference
+        raise _AbortJSX()
+
+    # jsxchild: skip text up to the next tag or {expression}
+    pos = _JSX_TEXT.match(text, pos).end()
+    if pos >= end:
+        return pos, mode
+    if text[pos] == "{":
+        braces.append("jsxchild")
+        return pos + 1, "code"
+    closing = _JSX_CLOSE.match(text, pos)
+    if closing is not None:
+        return _close_element(closing.end(), tokens, elements)
+    elements[-1] += 1
+    return pos + 1, "jsxtag-name"
+
+
+def _close_element(pos: int, tokens: List[Token], elements: List[int]) -> Tuple[int, str]:
+    elements[-1] -= 1
+    if elements[-1] > 0:
+        return pos, "jsxchild"
+    elements.pop()
+    tokens.append((JSX_END, "", pos))
+    return pos, "code"
+
+
+@dataclass
+class ImportRecord:
+    specifier: str
+    names: Tuple[str, ...]      # export names required from the module ("default", "*" for namespaces)
+    line: int
+
+
+@dataclass
+class Lexed:
+    """What the checks need from one file"""
+    imports: List[ImportRecord] = field(default_factory=list)
+    exports: Set[str] = field(default_factory=set)
+    star_exports: Set[str] = field(default_factory=set)
+    declared: Set[str] = field(default_factory=set)
+    imported: Set[str] = field(default_factory=set)         # local names bound by imports
+    references: Dict[str, int] = field(default_factory=dict)  # name -> first line used
+    tokens: int = 0
+
+
+def lex(text: str, jsx: bool = False) -> Lexed:
+    return _Analyzer(text, tokenize(text, jsx)).run()
+
+
+class _Analyzer:
+    """Classify the identifier tokens of one file and collect its imports and exports"""
+
+    # Look-around past either end of the token list lands on these blanks (negative indexes included)
+    PADDING = 8
+
+    def __init__(self, text: str, tokens: List[Token]):
+        self.text = text
+        self.tokens = tokens
+        self.kinds = [kind for kind, _, _ in tokens] + [""] * self.PADDING
+        self.values = [value for _, value, _ in tokens] + [""] * self.PADDING
+        self.partner = self._match_brackets()
+        self.role: Dict[int, str] = {}        # token index -> "decl", "key", "skip"
+        self.result = Lexed(tokens=len(tokens))
+        # Lines are asked for in increasing offset order within a walk: count on from the last answer
+        self._line_at, self._line = 0, 1
+
+    def line(self, offset: int) -> int:
+        if offset < self._line_at:
+            self._line_at, self._line = 0, 1
+        self._line += self.text.count("\n", self._line_at, offset)
+        self._line_at = offset
+        return self._line
+
+    def _match_brackets(self) -> Dict[int, int]:
+        partner: Dict[int, int] = {}
+        stack: List[int] = []
+        pairs = {")": "(", "]": "[", "}": "{"}
+        kinds, values = self.kinds, self.values
+        for i, value in enumerate(values):
+            if value not in _BRACKETS or kinds[i] != PUNCT:
+                continue
+            if value in "([{":
+                stack.append(i)
+            else:
+                # Unbalanced input: unwind to the nearest matching opener, if any
+                while stack and values[stack[-1]] != pairs[value]:
+                    stack.pop()
+                if stack:
+                    opener = stack.pop()
+                    partner[opener] = i
+                    partner[i] = opener
+        return partner
+
+    # -- helpers ---------------------------------------------------------
+
+    def value(self, i: int) -> str:
+        return self.values[i]
+
+    def kind(self, i: int) -> str:
+        return self.kinds[i]
+
+    def is_punct(self, i: int, *values: str) -> bool:
+        return self.kinds[i] == PUNCT and self.values[i] in values
+
+    def is_name(self, i: int) -> bool:
+        return self.kinds[i] == ID and self.values[i] not in KEYWORDS
+
+    def skip_group(self, i: int) -> int:
+        """Index after the bracket group opening at i (or i + 1)"""
+        return self.partner.get(i, i) + 1
+
+    def declare(self, i: int):
+        self.role[i] = "decl"
+        self.result.declared.add(self.value(i))
+
+    # -- walk ------------------------------------------------------------
+
+    def run(self) -> Lexed:
+        tokens, kinds, values, partner = self.tokens, self.kinds, self.values, self.partner
+        for i, (kind, value, _) in enumerate(tokens):
+            if kind == PUNCT:
+                # Parameter lists are followed by a body or return type, or follow `function`/`catch`
+                if value == "(" and i in partner and (values[partner[i] + 1] in _AFTER_PARAMETERS or
+                                                      not _CALL_CONTEXT.isdisjoint(values[max(0, i - 3):i])):
+                    self.parameters(i)
+                continue
+            if kind != ID or (values[i - 1] in (".", "?.") and kinds[i - 1] == PUNCT):
+                continue
+            if values[i + 1] == "=>" and kinds[i + 1] == PUNCT and value not in KEYWORDS:
+                self.declare(i)
+            elif value not in _STATEMENT_KEYWORDS:
+                continue
+            elif value == "import":
+                self.import_statement(i)
+            elif value == "export":
+                self.export_statement(i)
+            elif value in _DECLARATORS:
+                self.declarators(i + 1)
+            elif value in _NAMED_DECLARATIONS or (value == "type" and self.is_name(i + 1)
+                                                  and self.is_punct(i + 2, "=", "<")):
+                self.named_declaration(i)
+            elif value == "require" and self.is_punct(i + 1, "(") and self.kind(i + 2) == STR:
+                self.result.imports.append(ImportRecord(self.value(i + 2), (), self.line(tokens[i][2])))
+            elif value == "module" and self.is_punct(i + 1, ".") and self.value(i + 2) == "exports":
+                self.result.exports.add(ANY_EXPORT)
+
+        self.references()
+        return self.result
+
+    def references(self):
+        references, role, kinds, values = self.result.references, self.role, self.kinds, self.values
+        for i, (kind, value, offset) in enumerate(self.tokens):
+            if kind != ID:
+                if kind == JSX_TAG:
+                    head = value.split(".")[0]
+                    if head and (head[0].isupper() or "." in value) and head not in references:
+                        references[head] = self.line(offset)
+                continue
+            # Only the first reference matters, and most identifiers repeat
+            if value in references or value in _NON_REFERENCES or i in role:
+                continue
+            if values[i - 1] in (".", "?.", "#") and kinds[i - 1] == PUNCT:
+                continue            # property access / private member
+            following = values[i + 1]
+            if following == ":" or (following == "?" and values[i + 2] == ":"):
+                if not self.is_punct(i - 1, "?") and values[i - 1] != "case":
+                    continue        # object key, type member or labelled statement
+            references[value] = self.line(offset)
+
+    # -- declarations ----------------------------------------------------
+
+    def named_declaration(self, i: int):
+        j = i + 1
+        if self.is_punct(j, "*"):
+            j += 1
+        if self.is_name(j):
+            self.declare(j)
+        if self.value(i) in ("class", "interface"):
+            self.class_body(j)
+
+    def class_body(self, i: int):
+        """Mark member names of the class or interface whose header continues at i"""
+        while i < len(self.tokens) and not self.is_punct(i, "{", ";"):
+            i = self.skip_group(i) if self.is_punct(i, "(", "[") else i + 1
+        if not self.is_punct(i, "{") or i not in self.partner:
+            return
+        j, close = i + 1, self.partner[i]
+        expect_member = True
+        while j < close:
+            kind, value, _ = self.tokens[j]
+            if kind == PUNCT and value in "([{":
+                j = self.skip_group(j)
+                expect_member = self.value(j - 1) == "}"
+                continue
+            if kind == PUNCT and value in (";", "}"):
+                expect_member = True
+            elif expect_member and kind == ID:
+                if value in _MODIFIERS and (self.kind(j + 1) == ID or self.is_punct(j + 1, "*", "#", "[")):
+                    pass
+                else:
+                    self.role[j] = "key"
+                    expect_member = False
+            elif kind == PUNCT and value not in ("*", "#"):
+                expect_member = False
+            j += 1
+
+    def declarators(self, i: int):
+        """`const a = 1, { b, c: d } = x, [e] = y`"""
+        while i < len(self.tokens):
+            self.binding(i)
+            i = self.skip_group(i) if self.is_punct(i, "{", "[") else i + 1
+            # Walk the type annotation / initializer to the next declarator
+            while i < len(self.tokens):
+                kind, value, _ = self.tokens[i]
+                if kind == PUNCT and value in "([{":
+                    i = self.skip_group(i)
+                    continue
+                if kind == PUNCT and value in (";", ")", "]", "}"):
+                    return
+                if kind == ID and value in _STATEMENT_START and i > 0 and not self.is_punct(i - 1, ".", "?."):
+                    return
+                if kind == PUNCT and value == ",":
+                    i += 1
+                    break
+                i += 1
+            else:
+                return
+
+    def binding(self, i: int):
+        """Declare the names bound by a binding target starting at token i"""
+        if self.is_name(i):
+            self.declare(i)
+        elif self.is_punct(i, "{", "[") and i in self.partner:
+            self.pattern(i + 1, self.partner[i], is_object=self.value(i) == "{")
+
+    def pattern(self, start: int, stop: int, is_object: bool):
+        """Elements of a destructuring pattern between start and stop (exclusive)"""
+        i = start
+        while i < stop:
+            if self.is_punct(i, "..."):
+                i += 1
+            element = i
+            if is_object and self.is_punct(i + 1, ":") and (self.kind(i) in (ID, STR, NUM) or self.is_punct(i, "[")):
+                if self.kind(i) == ID:
+                    self.role[i] = "key"
+                element = (self.skip_group(i) if self.is_punct(i, "[") else i + 1) + 1
+            self.binding(element)
+            # Skip any default value to the next element
+            i = self.skip_group(element) if self.is_punct(element, "{", "[") else element + 1
+            while i < stop and not self.is_punct(i, ","):
+                i = self.skip_group(i) if self.is_punct(i, "(", "[", "{") else i + 1
+            i += 1
+
+    def parameters(self, i: int):
+        """Declare the parameters when the parenthesis at i opens a function's parameter list"""
+        close = self.partner[i]
+        before = i - 1
+        if self.is_punct(before, "<") or self.value(before) == ">":
+            # f<T>(...) / <T>(...) => : look past the type parameter list
+            depth, j = 0, before
+            while j >= 0:
+                if self.value(j) in (">", ">>"):
+                    depth += len(self.value(j))
+                elif self.value(j) == "<":
+                    depth -= 1
+                    if depth <= 0:
+                        break
+                j -= 1
+            before = j - 1 if depth <= 0 else before
+
+        previous = self.value(before)
+        named = self.kind(before) == ID
+        if previous == "catch":
+            pass
+        elif previous == "function" or (named and self.value(before - 1) == "function") or \
+                (self.is_punct(before, "*") and self.value(before - 1) == "function"):
+            pass
+        elif not self.body_follows(close):
+            return
+        elif named and previous in _CONTROL:
+            return
+        elif named and not self.is_punct(before - 1, ".", "?."):
+            self.role.setdefault(before, "key")     # method name
+        self.parameter_list(i + 1, close)
+
+    def body_follows(self, close: int) -> bool:
+        """`) =>`, `) {`, or a return type annotation followed by either"""
+        j = close + 1
+        if self.is_punct(j, "=>", "{"):
+            return True
+        if not self.is_punct(j, ":"):
+            return False
+        j += 1
+        depth = 0
+        for _ in range(64):
+            if j >= len(self.tokens):
+                return False
+            kind, value, _ = self.tokens[j]
+            if kind == PUNCT:
+                if value in "([" or (value == "{" and (depth > 0 or self.is_punct(j - 1, ":", "|", "&", "<", ","))):
+                    j = self.skip_group(j)
+                    continue
+                if value == "<":
+                    depth += 1
+                elif value in (">", ">>"):
+                    depth -= len(value)
+                elif depth <= 0 and value in ("{", "=>"):
+                    return True
+                elif depth <= 0 and value in (";", ",", ")", "]", "}", "="):
+                    return False
+            j += 1
+        return False
+
+    def parameter_list(self, start: int, stop: int):
+        i = start
+        while i < stop:
+            while self.value(i) in _MODIFIERS and (self.kind(i + 1) == ID or self.is_punct(i + 1, "{", "[")):
+                i += 1
+            if self.is_punct(i, "..."):
+                i += 1
+            self.binding(i)
+            i = self.skip_group(i) if self.is_punct(i, "{", "[") else i + 1
+            # Skip `?: Type = default` to the next parameter, minding generic commas
+            depth = 0
+            while i < stop:
+                kind, value, _ = self.tokens[i]
+                if kind == PUNCT and value in "([{":
+                    i = self.skip_group(i)
+                    continue
+                if kind == PUNCT and value == "<":
+                    depth += 1
+                elif kind == PUNCT and value in (">", ">>"):
+                    depth -= len(value)
+                elif kind == PUNCT and value == "," and depth <= 0:
+                    break
+                i += 1
+            i += 1
+
+    # -- modules ---------------------------------------------------------
+
+    def import_statement(self, i: int):
+        line = self.line(self.tokens[i][2])
+        j = i + 1
+        if self.is_punct(j, "("):
+            if self.kind(j + 1) == STR:
+                self.result.imports.append(ImportRecord(self.value(j + 1), (), line))
+            return
+        if self.kind(j) == STR:
+            self.result.imports.append(ImportRecord(self.value(j), (), line))
+            return
+        if self.is_punct(j, "."):
+            return                  # import.meta
+        if self.value(j) == "type" and (self.is_punct(j + 1, "{", "*") or (self.is_name(j + 1) and self.value(j + 2) != "from")):
+            j += 1
+
+        names: List[str] = []
+        while j < len(self.tokens):
+            kind, value, _ = self.tokens[j]
+            if kind == ID and value == "from" and self.kind(j + 1) == STR:
+                self.role[j] = "skip"
+                self.result.imports.append(ImportRecord(self.value(j + 1), tuple(names), line))
+                return
+            if kind == PUNCT and value == "*" and self.value(j + 1) == "as":
+                names.append("*")
+                self.import_local(j + 2)
+                j += 3
+            elif kind == PUNCT and value == "{" and j in self.partner:
+                names.extend(self.import_specifiers(j + 1, self.partner[j]))
+                j = self.partner[j] + 1
+            elif kind == ID and value not in KEYWORDS:
+                names.append("default")
+                self.import_local(j)
+                if self.is_punct(j + 1, "="):
+                    return          # import x = require('y') / import A = B.C
+                j += 1
+            elif kind == PUNCT and value == ",":
+                j += 1
+            else:
+                return
+
+    def import_local(self, i: int):
+        if self.kind(i) == ID:
+            self.role[i] = "decl"
+            self.result.imported.add(self.value(i))
+
+    def import_specifiers(self, start: int, stop: int) -> List[str]:
+        """`{ a, b as c, type d }`: returns the imported names, binds the local ones"""
+        names = []
+        for first, last in self.specifier_ranges(start, stop):
+            names.append(self.value(first))
+            self.role[first] = "skip"
+            self.import_local(last)
+        return names
+
+    def specifier_ranges(self, start: int, stop: int) -> List[Tuple[int, int]]:
+        """(name token, local/alias token) per `name [as alias]` in a specifier list"""
+        ranges = []
+        i = start
+        while i < stop:
+            if self.value(i) == "type" and self.kind(i + 1) in (ID, STR) and self.value(i + 1) != "as":
+                self.role[i] = "skip"
+                i += 1
+            if self.kind(i) in (ID, STR):
+                last = i + 2 if self.value(i + 1) == "as" else i
+                if last != i:
+                    self.role[i + 1] = "skip"
+                ranges.append((i, last))
+                i = last + 1
+            while i < stop and not self.is_punct(i, ","):
+                i += 1
+            i += 1
+        return ranges
+
+    def export_statement(self, i: int):
+        result = self.result
+        j = i + 1
+        if self.is_punct(j, "="):
+            result.exports.add(ANY_EXPORT)
+            return
+        if self.value(j) == "default":
+            result.exports.add("default")
+            return                  # a following function/class name is declared by the main walk
+        if self.value(j) == "type" and self.is_punct(j + 1, "{", "*"):
+            j += 1
+        if self.is_punct(j, "*"):
+            alias = self.value(j + 2) if self.value(j + 1) == "as" else None
+            k = j + 3 if alias else j + 1
+            if alias:
+                result.exports.add(alias)
+                self.role[j + 2] = "skip"
+            if self.value(k) == "from" and self.kind(k + 1) == STR:
+                self.role[k] = "skip"
+                specifier = self.value(k + 1)
+                result.imports.append(ImportRecord(specifier, ("*",) if alias else (), self.line(self.tokens[i][2])))
+                if not alias:
+                    result.star_exports.add(specifier)
+            return
+        if self.is_punct(j, "{") and j in self.partner:
+            close = self.partner[j]
+            ranges = self.specifier_ranges(j + 1, close)
+            result.exports.update(self.value(last) for _, last in ranges)
+            if self.value(close + 1) == "from" and self.kind(close + 2) == STR:
+                self.role[close + 1] = "skip"
+                for first, last in ranges:
+                    self.role[first] = self.role[last] = "skip"
+                result.imports.append(ImportRecord(self.value(close + 2), tuple(self.value(first) for first, _ in ranges),
+                                                   self.line(self.tokens[i][2])))
+            else:
+                for first, last in ranges:
+                    if last != first:
+                        self.role[last] = "skip"
+            return
+
+        # export [declare] [async] [abstract] <declaration>
+        while self.value(j) in ("declare", "async", "abstract"):
+            j += 1
+        keyword = self.value(j)
+        if keyword in _DECLARATORS:
+            before = set(result.declared)
+            self.declarators(j + 1)
+            if self.is_punct(j + 1, "{", "["):
+                result.exports.update(self.destructured_names(j + 1))
+            else:
+                result.exports.update(result.declared - before)
+                k = j + 1
+                if self.is_name(k):
+                    result.exports.add(self.value(k))
+        elif keyword in _NAMED_DECLARATIONS or keyword == "type":
+            k = j + 2 if self.is_punct(j + 1, "*") else j + 1
+            if self.kind(k) == ID:
+                result.exports.add(self.value(k))
+
+    def destructured_names(self, i: int) -> Set[str]:
+        declared = {self.value(k) for k in range(i, self.skip_group(i)) if self.role.get(k) == "decl"}
+        return declared or {ANY_EXPORT}
@@ -0,0 +1,354 @@
+"""
+DXM Repo Health Scanner
+Audits codebase for: missing imports, dead components, broken exports,
+ASIN validity, JSON schema failures, duplicate products.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Set, Dict, List, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from .cache import ScanCache
+from .context import ScanContext
+from .graph import ModuleGraph
+
+SEED_PATH = "data/asin-seed.json"
+
+
+# (progress line, check method) in report order
+CHECKS = [
+    ("1️⃣ Scanning for missing imports...", "check_missing_imports"),
+    ("2️⃣ Scanning for dead components...", "check_dead_components"),
+    ("3️⃣ Scanning for broken exports...", "check_broken_exports"),
+    ("4️⃣ Validating ASIN format...", "check_asin_validity"),
+    ("5️⃣ Validating JSON schemas...", "check_json_schemas"),
+    ("6️⃣ Checking for duplicate products...", "check_duplicate_products"),
+]
+
+
+class DXMRepoScanner:
+    def __init__(self, repo_path: str = ".", jobs: int = 1, cache_path: Optional[str] = None):
+        """
+        jobs: worker processes for per-file analysis (and threads for running checks side by side).
+        cache_path: per-file scan cache (e.g. <repo>/.dxm-scan-cache); only changed files are re-analyzed.
+        """
+        self.repo_path = Path(repo_path)
+        self.jobs = max(1, jobs)
+        self.cache_path = cache_path
+        self.issues = defaultdict(list)
+        self.warnings = defaultdict(list)
+        self.info = defaultdict(list)
+        self._context = None
+        self._graph = None
+
+    @property
+    def context(self) -> ScanContext:
+        """Files and documents for this scan, loaded on first use"""
+        if self._context is None:
+            cache = ScanCache(self.cache_path) if self.cache_path else None
+            self._context = ScanContext(self.repo_path, jobs=self.jobs, cache=cache)
+        return self._context
+
+    @property
+    def graph(self) -> ModuleGraph:
+        """Import/export graph of the source tree, built on first use"""
+        if self._graph is None:
+            self._graph = ModuleGraph(self.context)
+        return self._graph
+
+    def scan_all(self):
+        """Run all health checks."""
+        print("🔍 DXM Repo Health Scanner")
+        print("=" * 70)
+
+        if self.cache_path:
+            cache = self.context.cache
+            print(f"\n♻️ Scan cache: {cache.summary()}")
+
+        if self.jobs > 1:
+            self.run_parallel()
+        else:
+            print()
+            for label, check in CHECKS:
+                print(label)
+                getattr(self, check)()
+
+        print("\n" + "=" * 70)
+        return self.print_report()
+
+    def run_parallel(self):
+        """
+        Analyze files on a process pool, then run the checks side by side.
+
+        Each check collects into its own scanner and the findings are merged
+        in CHECKS order, so the report is identical to a sequential scan.
+        """
+        print(f"\n⚡ Analyzing {self.context.src_dir} on {self.jobs} processes "
+              f"({len(self.context.files)} files)...")
+        self.graph
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(CHECKS))) as executor:
+            futures = [executor.submit(self._run_isolated, check) for _, check in CHECKS]
+            for (label, _), future in zip(CHECKS, futures):
+                print(label)
+                self.merge(future.result())
+
+    def _run_isolated(self, check: str) -> "DXMRepoScanner":
+        partial = DXMRepoScanner(self.repo_path)
+        partial._context = self.context
+        partial._graph = self.graph
+        getattr(partial, check)()
+        return partial
+
+    def merge(self, other: "DXMRepoScanner"):
+        for mine, theirs in ((self.issues, other.issues), (self.warnings, other.warnings), (self.info, other.info)):
+            for category, items in theirs.items():
+                mine[category].extend(items)
+
+    def check_missing_imports(self):
+        """Find undefined variables and missing imports."""
+        builtins = self._get_builtins()
+
+        for source in self.context.files:
+            if source.error is not None:
+                self.issues[source.rel].append(f"Parse error: {source.error}")
+                continue
+
+            # References (outside comments, strings and JSX text) nothing in the file binds
+            references = source.references
+            undefined = references.keys() - source.declared - source.imported_names - builtins
+
+            # Filter false positives
+            undefined = {u for u in undefined if len(u) > 2 and not u[0].isupper()}
+
+            if undefined:
+                self.warnings[source.rel].append(
+                    f"Possible undefined: {', '.join(f'{u} (L{references[u]})' for u in sorted(undefined)[:5])}"
+                )
+
+    def check_dead_components(self):
+        """Find components that are defined but never imported."""
+        components_dir = self.context.src_dir / "components"
+
+        if not components_dir.exists():
+            return
+
+        components = [source for source in self.context.under("components", suffix=".tsx") if source.error is None]
+
+        # Find unused components: no module imports them (statically, dynamically or via an index)
+        for path in self.graph.unimported([source.path for source in components]):
+            self.warnings["Dead Components"].append(
+                f"{path.stem} ({path}) - never imported"
+            )
+
+    def check_broken_exports(self):
+        """Find imports of files that don't exist or of names their module doesn't export."""
+        for edge in self.graph.broken_imports():
+            self.issues[self._display(edge.source)].append(
+                f"Broken import: {edge.specifier}"
+            )
+
+        for edge, name in self.graph.missing_exports():
+            self.issues[self._display(edge.source)].append(
+                f"Missing export: {name} from {edge.specifier}"
+            )
+
+    def _display(self, path: Path) -> str:
+        """The path as the rest of the report shows it"""
+        source = self.graph.modules.get(path)
+        return source.rel if source is not None else str(path)
+
+    def _seed_products(self) -> List[Tuple[str, int, str, Optional[str]]]:
+        """
+        (category, position, asin, title) of every seed product, in catalog order.
+
+        An index query on the SeedStore when an up-to-date one exists, else a
+        walk of the parsed JSON; raises the JSON's read or parse error.
+        """
+        store = self.context.seed_store(SEED_PATH)
+        if store is not None:
+            return store.listing()
+        seed = self.context.json(SEED_PATH)
+        if seed.error is not None:
+            raise seed.error
+        return [
+            (category, position, product.get("asin", ""), product.get("title"))
+            for category, products in seed.data.get("products", {}).items() if isinstance(products, list)
+            for position, product in enumerate(products)
+        ]
+
+    def check_asin_validity(self):
+        """Validate ASIN format (10-char alphanumeric)."""
+        if not self.context.exists(self.repo_path / SEED_PATH):
+            self.warnings["ASIN Check"].append("asin-seed.json not found")
+            return
+
+        try:
+            invalid_asins = []
+            all_asins = []
+
+            for category, _, asin, title in self._seed_products():
+                all_asins.append(asin)
+
+                # Check format: 10 alphanumeric characters
+                if not re.match(r'^[A-Z0-9]{10}$', asin):
+                    invalid_asins.append({
+                        'asin': asin,
+                        'product': 'Unknown' if title is None else title,
+                        'category': category
+                    })
+
+            if invalid_asins:
+                for item in invalid_asins:
+                    self.issues["ASIN Validity"].append(
+                        f"{item['asin']} ({item['product']}) - Invalid format"
+                    )
+            else:
+                self.info["ASIN Validity"].append(
+                    f"✅ All {len(all_asins)} ASINs valid"
+                )
+        except (OSError, json.JSONDecodeError) as e:
+            self.issues["ASIN Check"].append(f"Invalid JSON: {e}")
+
+    def check_json_schemas(self):
+        """Validate JSON files against expected schemas."""
+        json_files = [
+            (SEED_PATH, ["version", "mode", "products"]),
+        ]
+
+        for json_path, required_fields in json_files:
+            if not self.context.exists(self.repo_path / json_path):
+                self.warnings["JSON Schemas"].append(f"{json_path} not found")
+                continue
+
+            try:
+                # Seed catalogs keep their top-level fields in the store; anything else is parsed
+                store = self.context.seed_store(json_path)
+                if store is not None:
+                    data = store.fields()
+                else:
+                    document = self.context.json(json_path)
+                    if document.error is not None:
+                        raise document.error
+                    data = document.data
+
+                # Check required fields
+                missing = [f for f in required_fields if f not in data]
+
+                if missing:
+                    self.issues["JSON Schemas"].append(
+                        f"{json_path}: missing fields {missing}"
+                    )
+                else:
+                    self.info["JSON Schemas"].append(
+                        f"✅ {json_path} schema valid"
+                    )
+            except (OSError, json.JSONDecodeError) as e:
+                self.issues["JSON Schemas"].append(
+                    f"{json_path}: {e}"
+                )
+
+    def check_duplicate_products(self):
+        """Find duplicate products (by ASIN) in seed data."""
+        if not self.context.exists(self.repo_path / SEED_PATH):
+            return
+
+        try:
+            products = self._seed_products()
+            asin_map = defaultdict(list)
+
+            for category, idx, asin, title in products:
+                if asin:
+                    asin_map[asin].append({
+                        'category': category,
+                        'index': idx,
+                        'title': 'Unknown' if title is None else title
+                    })
+
+            duplicates = {asin: items for asin, items in asin_map.items() if len(items) > 1}
+
+            if duplicates:
+                for asin, items in duplicates.items():
+                    categories = ', '.join([f"{i['category']}[{i['index']}]" for i in items])
+                    self.issues["Duplicate Products"].append(
+                        f"{asin}: {items[0]['title']} appears in {categories}"
+                    )
+            else:
+                self.info["Duplicate Products"].append(
+                    f"✅ No duplicates found ({len(products)} products)"
+                )
+        except Exception as e:
+            self.issues["Duplicate Products"].append(f"Check failed: {e}")
+
+    def print_report(self):
+        """Print formatted report."""
+        print("\n📋 HEALTH SCAN REPORT")
+        print("=" * 70)
+
+        # Issues (critical)
+        if self.issues:
+            print("\n❌ ISSUES (Critical):")
+            for category, items in self.issues.items():
+                print(f"\n  {category}:")
+                for item in items[:5]:  # Show first 5
+                    print(f"    • {item}")
+                if len(items) > 5:
+                    print(f"    ... and {len(items) - 5} more")
+
+        # Warnings
+        if self.warnings:
+            print("\n⚠️ WARNINGS:")
+            for category, items in self.warnings.items():
+                print(f"\n  {category}:")
+                for item in items[:3]:  # Show first 3
+                    print(f"    • {item}")
+                if len(items) > 3:
+                    print(f"    ... and {len(items) - 3} more")
+
+        # Info (pass checks)
+        if self.info:
+            print("\n✅ PASSED:")
+            for category, items in self.info.items():
+                for item in items:
+                    print(f"  {item}")
+
+        # Summary
+        total_issues = sum(len(v) for v in self.issues.values())
+        total_warnings = sum(len(v) for v in self.warnings.values())
+
+        print("\n" + "=" * 70)
+        if total_issues == 0 and total_warnings == 0:
+            print("🟢 REPO HEALTH: EXCELLENT")
+            return 0
+        elif total_issues == 0:
+            print(f"🟡 REPO HEALTH: GOOD ({total_warnings} warnings)")
+            return 0
+        else:
+            print(f"🔴 REPO HEALTH: NEEDS ATTENTION ({total_issues} issues, {total_warnings} warnings)")
+            return 1
+
+    @staticmethod
+    def _get_builtins() -> Set[str]:
+        """Return common JavaScript/TypeScript built-ins."""
+        return {
+            'console', 'Math', 'Object', 'Array', 'String', 'Number', 'Boolean',
+            'Date', 'RegExp', 'JSON', 'Promise', 'async', 'await',
+            'function', 'class', 'export', 'import', 'const', 'let', 'var',
+            'if', 'else', 'for', 'while', 'return', 'true', 'false', 'null',
+            'undefined', 'this', 'super', 'extends', 'static', 'public', 'private',
+            'readonly', 'interface', 'type', 'enum', 'abstract', 'declare',
+            'typeof', 'instanceof', 'new', 'delete', 'void', 'try', 'catch',
+            'finally', 'throw', 'switch', 'case', 'break', 'continue',
+            'React', 'ReactDOM', 'useState', 'useEffect', 'useContext', 'useRef',
+            'next', 'Image', 'Link', 'router', 'path', 'fs', 'http', 'url',
+            # Runtime globals (browser, Node, edge)
+            'window', 'document', 'navigator', 'location', 'history', 'localStorage', 'sessionStorage',
+            'fetch', 'setTimeout', 'clearTimeout', 'setInterval', 'clearInterval', 'requestAnimationFrame',
+            'cancelAnimationFrame', 'queueMicrotask', 'structuredClone', 'alert', 'confirm', 'prompt',
+            'crypto', 'performance', 'atob', 'btoa', 'globalThis', 'self', 'process', 'require', 'module',
+            'exports', '__dirname', '__filename', 'arguments', 'eval', 'parseInt', 'parseFloat', 'isNaN',
+            'isFinite', 'encodeURIComponent', 'decodeURIComponent', 'encodeURI', 'decodeURI', 'escape',
+            'unescape', 'gtag', 'dataLayer',
+        }
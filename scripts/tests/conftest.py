@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The packages live next to their entry-point scripts, not on an installed path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
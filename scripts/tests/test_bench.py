@@ -0,0 +1,12 @@
+from asin_verifier.bench import percentile
+from asin_verifier.metrics import VerifierMetrics
+
+
+def test_latency_percentiles_are_exact():
+    metrics = VerifierMetrics(keep_samples=True)
+    for ms in [30] * 98 + [51, 52]:
+        metrics.completed(ms / 1000, "remote")
+    # The histogram interpolates between its 0.05 and 0.1 buckets; the samples give the real tail
+    assert percentile(metrics.samples, 99) == 0.051
+    assert percentile(metrics.samples, 50) == 0.030
+    assert VerifierMetrics().samples is None
@@ -0,0 +1,28 @@
+import pytest
+
+from asin_verifier import TitleClassifier
+
+
+@pytest.mark.parametrize("title", [
+    "MSI GeForce RTX 4060 Graphics Card for Gaming PC",
+    "ASUS RX 7600 for Desktop PC",
+    "XFX Radeon RX 6600 Graphics Card, Multi-Monitor support",
+])
+def test_card_evidence_beats_exclusions(title):
+    assert TitleClassifier().classify(title).is_gpu
+
+
+@pytest.mark.parametrize("title", [
+    "Acer Nitro Gaming Laptop, GeForce RTX 4050",
+    "AMD Ryzen 7 Processor with Radeon Graphics",
+    "Skytech Gaming PC, GeForce Graphics",
+])
+def test_systems_are_not_gpus(title):
+    assert not TitleClassifier().classify(title).is_gpu
+
+
+def test_batch_offsets_survive_length_changing_lowercase():
+    # 'İ'.lower() is two characters long
+    first, second = TitleClassifier().classify_many(["İİİİİİ Desk Lamp", "MSI RTX 4070 12GB"])
+    assert not first.is_gpu and first.brand is None
+    assert (second.brand, second.vram, second.tier) == ("MSI", "12GB", "RTX 4070")
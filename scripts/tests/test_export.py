@@ -0,0 +1,64 @@
+import json
+import zipfile
+
+import pytest
+
+from asin_verifier import ValidationResult, export_results, read_columns
+from asin_verifier.export import FIELDS, ResultWriter
+
+RESULT = ValidationResult("B0TEST0001", 200, "GPU", True, tier="RTX 4070")
+
+
+def test_result_writer_is_abstract():
+    with pytest.raises(TypeError):
+        ResultWriter("unused.jsonl")
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".colz", ".json", ".jsonl"])
+def test_append_extends_matching_export(tmp_path, suffix):
+    path = str(tmp_path / f"results{suffix}")
+    export_results([RESULT], path)
+    export_results([RESULT], path, append=True)
+    if suffix == ".colz":
+        assert sum(len(group["asin"]) for group in read_columns(path)) == 2
+    elif suffix == ".json":
+        assert len(json.load(open(path, encoding='utf-8'))) == 2
+    elif suffix == ".jsonl":
+        assert len(open(path, encoding='utf-8').read().splitlines()) == 2
+    else:
+        assert len(open(path, encoding='utf-8').read().splitlines()) == 3
+
+
+def test_csv_append_rejects_other_header(tmp_path):
+    path = tmp_path / "results.csv"
+    path.write_text(",".join(FIELDS[:-1]) + "\r\nB0OLD00001,200,GPU,True,,,,,True\r\n", encoding='utf-8')
+    with pytest.raises(ValueError, match="Cannot append"):
+        export_results([RESULT], str(path), append=True)
+    assert "B0TEST0001" not in path.read_text(encoding='utf-8')
+
+
+def test_colz_append_rejects_other_schema(tmp_path):
+    path = tmp_path / "results.colz"
+    schema = {"format": "dxm-colz", "version": 1, "revision": 0, "fields": FIELDS[:-1], "row_groups": []}
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr("_schema/00000.json", json.dumps(schema))
+    with pytest.raises(ValueError, match="Cannot append"):
+        export_results([RESULT], str(path), append=True)
+
+
+@pytest.mark.parametrize("suffix", [".json", ".jsonl"])
+def test_json_append_rejects_other_fields(tmp_path, suffix):
+    path = tmp_path / f"results{suffix}"
+    old = {name: None for name in FIELDS[:-1]}
+    path.write_text(json.dumps([old], indent=2) if suffix == ".json" else json.dumps(old) + "\n", encoding='utf-8')
+    before = path.read_text(encoding='utf-8')
+    with pytest.raises(ValueError, match="Cannot append"):
+        export_results([RESULT], str(path), append=True)
+    assert path.read_text(encoding='utf-8') == before
+
+
+def test_json_append_to_empty_array(tmp_path):
+    path = tmp_path / "results.json"
+    path.write_text("[]\n", encoding='utf-8')
+    export_results([RESULT], str(path), append=True)
+    assert json.load(open(path, encoding='utf-8'))[0]["asin"] == "B0TEST0001"
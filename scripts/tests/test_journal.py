@@ -0,0 +1,14 @@
+from asin_verifier import ValidationJournal, ValidationResult
+
+
+def test_resume_after_torn_line_keeps_next_result(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    with ValidationJournal(str(path)) as journal:
+        journal.append(ValidationResult("B0TEST0001", 200, "GPU", True))
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"asin": "B0TEST0002", "sta')   # killed mid-write
+
+    with ValidationJournal(str(path)) as journal:
+        journal.append(ValidationResult("B0TEST0003", 404, "", False))
+
+    assert sorted(ValidationJournal(str(path)).load()) == ["B0TEST0001", "B0TEST0003"]
@@ -0,0 +1,54 @@
+import textwrap
+
+from repo_health import DXMRepoScanner, lex
+
+WIDGET = textwrap.dedent('''\
+    import React, { useState } from 'react';
+    import type { Product } from '@/types/product';
+    // import { formatPrice } from '@/lib/format';
+
+    interface Props { product: Product; onSelect?: (id: string) => void }
+
+    export default function Widget({ product, onSelect }: Props) {
+      const [open, setOpen] = useState(false);
+      const label = `${product.title} - ${formatPrice(product.price)}`;
+      const total = items.reduce((sum, item) => sum + item.price, 0);
+      /* fallbackLabel is only mentioned in this comment */
+      return (
+        <div className="widget" onClick={() => setOpen(!open)}>
+          price for someone who reads text
+          <span title={label}>{missingValue ?? 'none, not undefinedInString'}</span>
+          {open && <button onClick={() => onSelect?.(product.asin)}>{total}</button>}
+        </div>
+      );
+    }
+    ''')
+
+
+def test_undefined_references_in_tsx_are_flagged(tmp_path):
+    components = tmp_path / "src" / "components"
+    components.mkdir(parents=True)
+    (components / "Widget.tsx").write_text(WIDGET, encoding='utf-8')
+
+    scanner = DXMRepoScanner(str(tmp_path))
+    scanner.check_missing_imports()
+
+    [warning] = scanner.warnings[str(components / "Widget.tsx")]
+    assert warning == "Possible undefined: formatPrice (L9), items (L10), missingValue (L15)"
+
+
+def test_comments_strings_and_jsx_text_are_not_references():
+    lexed = lex(WIDGET, jsx=True)
+    for name in ("fallbackLabel", "undefinedInString", "someone", "reads", "title", "price", "className"):
+        assert name not in lexed.references
+    assert {"open", "setOpen", "label", "total", "sum", "item", "product", "onSelect"} <= lexed.declared
+    assert lexed.imported == {"React", "useState", "Product"}
+
+
+def test_imports_skip_commented_out_code():
+    lexed = lex(WIDGET, jsx=True)
+    assert [(record.specifier, record.names, record.line) for record in lexed.imports] == [
+        ("react", ("default", "useState"), 1),
+        ("@/types/product", ("Product",), 2),
+    ]
+    assert lexed.exports == {"default"}
@@ -0,0 +1,59 @@
+from asin_verifier import NegativeFilter, ResultCache, TitleClassifier, ValidationJournal, is_definitive
+from asin_verifier.extract import NO_TITLE, extract_stream
+from asin_verifier.negative import NOT_FOUND, NOT_GPU, SKIPPED
+from asin_verifier.verifier import result_from_page
+
+
+def _result(body: bytes, status_code: int = 200):
+    return result_from_page("B0TEST0001", status_code, extract_stream([body]), TitleClassifier())
+
+
+def test_failed_extraction_is_not_recorded_as_not_gpu(tmp_path):
+    result = _result(b"<html><body>oops</body></html>")
+    assert result.title == NO_TITLE
+    assert NegativeFilter.reason_for(result) is None
+
+    negative = NegativeFilter(str(tmp_path / "negative.sqlite"))
+    try:
+        assert not negative.record(result)
+        assert "B0TEST0001" not in negative
+    finally:
+        negative.close()
+
+
+def test_failed_extraction_settles_nothing(tmp_path):
+    result = _result(b"<html><body>captcha</body></html>")
+    assert not is_definitive(result)
+
+    cache = ResultCache(str(tmp_path / "cache.sqlite"))
+    try:
+        assert cache.ttl_for(result) == 0
+    finally:
+        cache.close()
+    with ValidationJournal(str(tmp_path / "journal.jsonl")) as journal:
+        journal.append(result)
+    assert ValidationJournal(str(tmp_path / "journal.jsonl")).load() == {}
+
+
+def test_real_non_gpu_title_is_recorded():
+    result = _result(b'<html><span id="productTitle">Ergonomic Office Chair, Black</span></html>')
+    assert NegativeFilter.reason_for(result) == NOT_GPU
+
+
+def test_404_is_recorded():
+    assert NegativeFilter.reason_for(_result(b"", status_code=404)) == NOT_FOUND
+
+
+def test_skipped_asin_is_not_recorded_as_settled(tmp_path):
+    negative = NegativeFilter(str(tmp_path / "negative.sqlite"))
+    try:
+        assert negative.record(_result(b"", status_code=404))
+        skipped = negative.skip_result("B0TEST0001")
+    finally:
+        negative.close()
+    assert (skipped.status_code, skipped.title) == (0, SKIPPED)
+    assert not is_definitive(skipped)
+
+    with ValidationJournal(str(tmp_path / "journal.jsonl")) as journal:
+        journal.append(skipped)
+    assert ValidationJournal(str(tmp_path / "journal.jsonl")).load() == {}
@@ -0,0 +1,39 @@
+from asin_verifier.prices import PriceHistory
+from asin_verifier.verifier import ValidationResult
+
+
+def _priced(asin: str, price: float):
+    return ValidationResult(asin, 200, "title", True, price=price, valid=True)
+
+
+def test_interleaved_writers_decode_each_others_segments(tmp_path):
+    path = str(tmp_path / "price-history.bin")
+    gui, cli = PriceHistory(path), PriceHistory(path)
+    gui.record([_priced("B0TEST0001", 500.0)], when=1000)
+    cli.record([_priced("B0TEST0002", 300.0), _priced("B0TEST0001", 480.0)], when=2000)
+    gui.record([_priced("B0TEST0003", 120.0), _priced("B0TEST0002", 290.0)], when=3000)
+    cli.record([_priced("B0TEST0001", 470.0)], when=4000)
+
+    expected = {
+        "B0TEST0001": [(1000, 500.0), (2000, 480.0), (4000, 470.0)],
+        "B0TEST0002": [(2000, 300.0), (3000, 290.0)],
+        "B0TEST0003": [(3000, 120.0)],
+    }
+    reader = PriceHistory(path)
+    assert {asin: reader.series(asin) for asin in expected} == expected
+
+    # A compaction by one instance is picked up by the other's next append
+    gui.compact()
+    cli.record([_priced("B0TEST0003", 110.0)], when=5000)
+    reader = PriceHistory(path)
+    assert reader.series("B0TEST0003") == [(3000, 120.0), (5000, 110.0)]
+    assert reader.series("B0TEST0001") == expected["B0TEST0001"]
+
+
+def test_append_drops_a_torn_tail(tmp_path):
+    path = tmp_path / "price-history.bin"
+    PriceHistory(str(path)).record([_priced("B0TEST0001", 500.0)], when=1000)
+    with open(path, 'ab') as f:
+        f.write(b"DXPH\x00\x00\x01\x00partial")
+    PriceHistory(str(path)).record([_priced("B0TEST0001", 450.0)], when=2000)
+    assert PriceHistory(str(path)).series("B0TEST0001") == [(1000, 500.0), (2000, 450.0)]
@@ -0,0 +1,30 @@
+from asin_verifier import TitleClassifier
+from asin_verifier.extract import extract_stream
+from asin_verifier.seed import merge_results
+from asin_verifier.verifier import result_from_page
+
+
+def _result(title: str):
+    page = extract_stream([f'<span id="productTitle">{title}</span>'.encode()])
+    return result_from_page("B0TEST0001", 200, page, TitleClassifier())
+
+
+def _seed():
+    return {"products": {"gpu": [
+        {"asin": "B0TEST0001", "title": "old", "brand": "Sapphire", "vram": "16GB", "price": 500},
+    ]}}
+
+
+def test_fallback_brand_and_vram_keep_curated_data():
+    seed = _seed()
+    diff = merge_results(seed, [_result("Radeon Graphics Card")])
+    product = seed["products"]["gpu"][0]
+    assert (product["brand"], product["vram"]) == ("Sapphire", "16GB")
+    assert set(diff.updated["B0TEST0001"]) == {"title"}
+
+
+def test_detected_brand_and_vram_are_refreshed():
+    seed = _seed()
+    merge_results(seed, [_result("XFX Radeon RX 7800 XT 20GB Graphics Card")])
+    product = seed["products"]["gpu"][0]
+    assert (product["brand"], product["vram"]) == ("XFX", "20GB")
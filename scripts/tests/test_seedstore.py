@@ -0,0 +1,96 @@
+import json
+
+from asin_verifier import TitleClassifier
+from asin_verifier.extract import extract_stream
+from asin_verifier.seed import merge_products, merge_results
+from asin_verifier.seedstore import SeedStore
+from asin_verifier.verifier import result_from_page
+from repo_health import DXMRepoScanner
+
+
+def _result(asin: str, title: str):
+    page = extract_stream([f'<span id="productTitle">{title}</span>'.encode()])
+    return result_from_page(asin, 200, page, TitleClassifier())
+
+
+SEED = {
+    "version": "1.0",
+    "products": {
+        "gpu": [{"asin": "B0TEST0001", "title": "old", "brand": "Sapphire", "vram": "16GB", "price": 500}],
+        "memory": [{"asin": "B0TEST0002", "title": "DDR5 kit"}, {"asin": "B0TEST0001", "title": "mislabeled"}],
+    },
+    "lastUpdated": "2024-01-01",
+}
+
+
+def _write_seed(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(SEED), encoding="utf-8")
+
+
+def test_store_merge_matches_json_merge(tmp_path):
+    seed_path = tmp_path / "asin-seed.json"
+    _write_seed(seed_path)
+    results = [
+        _result("B0TEST0001", "XFX Radeon RX 7800 XT 20GB Graphics Card"),
+        _result("B0TEST0003", "MSI GeForce RTX 4070 12GB Graphics Card"),
+    ]
+
+    expected = json.loads(json.dumps(SEED))
+    expected_diff = merge_results(expected, results)
+    expected["lastUpdated"] = "2024-02-01"
+
+    with SeedStore(str(tmp_path / "store.sqlite")) as store:
+        store.sync(str(seed_path))
+        diff, touched = merge_products(results, lambda asin: store.get(asin, "gpu"))
+        store.upsert_many(touched.values(), "gpu")
+        store.set_field("lastUpdated", "2024-02-01")
+        store.export(str(seed_path))
+        assert not store.sync(str(seed_path))
+
+    assert (diff.added, diff.updated) == (expected_diff.added, expected_diff.updated)
+    exported = json.loads(seed_path.read_text(encoding="utf-8"))
+    assert exported == expected
+    assert list(exported) == list(SEED)
+
+
+def _scan_seed(repo):
+    scanner = DXMRepoScanner(str(repo))
+    scanner.check_asin_validity()
+    scanner.check_json_schemas()
+    scanner.check_duplicate_products()
+    return scanner
+
+
+def test_scanner_seed_checks_never_write_a_store(tmp_path):
+    _write_seed(tmp_path / "data" / "asin-seed.json")
+    scanner = _scan_seed(tmp_path)
+
+    assert not (tmp_path / SeedStore.DEFAULT_PATH).exists()
+    assert scanner.info["ASIN Validity"] == ["✅ All 3 ASINs valid"]
+    assert scanner.issues["JSON Schemas"] == ["data/asin-seed.json: missing fields ['mode']"]
+    assert scanner.issues["Duplicate Products"] == ["B0TEST0001: old appears in gpu[0], memory[1]"]
+
+
+def test_scanner_queries_an_up_to_date_store(tmp_path):
+    seed_path = tmp_path / "data" / "asin-seed.json"
+    _write_seed(seed_path)
+    with SeedStore(str(tmp_path / SeedStore.DEFAULT_PATH)) as store:
+        store.sync(str(seed_path))
+
+    scanner = _scan_seed(tmp_path)
+    assert scanner.context.seed_store("data/asin-seed.json") is not None
+    assert scanner.issues["Duplicate Products"] == ["B0TEST0001: old appears in gpu[0], memory[1]"]
+
+    # Edited since the last sync: the stale store is left alone and the JSON is read
+    seed_path.write_text(json.dumps({**SEED, "mode": "live"}), encoding="utf-8")
+    scanner = _scan_seed(tmp_path)
+    assert scanner.context.seed_store("data/asin-seed.json") is None
+    assert scanner.info["JSON Schemas"] == ["✅ data/asin-seed.json schema valid"]
+
+
+def test_unreadable_seed_is_reported(tmp_path):
+    (tmp_path / "data" / "asin-seed.json").mkdir(parents=True)
+    scanner = _scan_seed(tmp_path)
+    assert scanner.issues["ASIN Check"][0].startswith("Invalid JSON: ")
+    assert scanner.issues["JSON Schemas"][0].startswith("data/asin-seed.json: ")
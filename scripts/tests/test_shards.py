@@ -0,0 +1,76 @@
+import json
+import time
+
+import pytest
+
+from asin_verifier.cli import build_parser
+from asin_verifier.shards import ShardJob, ShardWorker
+from asin_verifier.verifier import ValidationResult
+
+
+class SlowVerifier:
+    """Yields one result per `delay` seconds, calling `during` after the first"""
+
+    def __init__(self, delay: float, during=None):
+        self.delay = delay
+        self.during = during
+
+    def validate_many(self, asins, concurrency=8):
+        for i, asin in enumerate(asins):
+            time.sleep(self.delay)
+            if i == 1 and self.during is not None:
+                self.during()
+            yield i, ValidationResult(asin, 200, "title", True, valid=True)
+
+
+def _job(tmp_path, lease_seconds):
+    return ShardJob.create(str(tmp_path / "job"), [f"B0TEST{i:04d}" for i in range(6)], shards=1,
+                           lease_seconds=lease_seconds)
+
+
+def test_renew_refuses_expired_and_taken_over_leases(tmp_path):
+    job = _job(tmp_path, 0.2)
+    assert job.try_lease(0, "a")
+    assert job.renew(0, "a")
+    time.sleep(0.3)
+    assert not job.renew(0, "a")
+    assert job.try_lease(0, "b")
+    assert not job.renew(0, "a")
+    assert job.read_lease(0)["worker"] == "b"
+
+
+def test_slow_results_keep_the_lease(tmp_path):
+    # Each result takes longer than the lease; only the heartbeat thread keeps other workers out
+    job = _job(tmp_path, 0.3)
+    claims = []
+    worker = ShardWorker(job, SlowVerifier(0.4, during=lambda: claims.append(job.try_lease(0, "b"))),
+                         worker_id="a")
+    assert worker.claim() == 0
+    assert worker.process(0)
+    assert claims == [False]
+    assert job.done(0) and worker.completed == [0]
+
+
+def test_takeover_abandons_the_shard(tmp_path):
+    job = _job(tmp_path, 0.3)
+
+    def take_over():
+        # Another worker forces the lease over, as after an expiry it did not see renewed
+        lease = job.lease_path(0)
+        lease.write_text(json.dumps({"worker": "b", "expires": time.time() + 60}), encoding="utf-8")
+
+    worker = ShardWorker(job, SlowVerifier(0.1, during=take_over), worker_id="a")
+    assert worker.claim() == 0
+    assert not worker.process(0)
+    assert worker.abandoned == [0] and not job.done(0)
+    assert job.read_lease(0)["worker"] == "b"
+
+
+def test_shard_count_must_be_positive(tmp_path, capsys):
+    for shards in (0, -3):
+        with pytest.raises(ValueError):
+            ShardJob.create(str(tmp_path / f"job{shards}"), ["B0TEST0001"], shards=shards)
+        assert not (tmp_path / f"job{shards}").exists()
+        with pytest.raises(SystemExit):
+            build_parser().parse_args(["shard", "plan", str(tmp_path / "cli"), "--shards", str(shards)])
+    assert "must be at least 1" in capsys.readouterr().err
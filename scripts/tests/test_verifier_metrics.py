@@ -0,0 +1,31 @@
+import socket
+
+from asin_verifier import ASINVerifier, FetchScheduler
+
+
+def _closed_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _verifier(max_retries: int, base_delay: float, deadline: float) -> ASINVerifier:
+    scheduler = FetchScheduler(rate=1000, burst=1000, max_retries=max_retries, base_delay=base_delay)
+    return ASINVerifier(scheduler=scheduler, base_url=f"http://127.0.0.1:{_closed_port()}",
+                        timeout=(1, 1), deadline=deadline)
+
+
+def test_failure_abandoned_at_the_deadline_counts_once():
+    # With no time budget, any backoff after the first refused attempt overruns the deadline
+    verifier = _verifier(max_retries=3, base_delay=1.0, deadline=0.0)
+    result = verifier.validate_asin("B0TEST0001")
+    assert result.title == "Error"
+    assert verifier.metrics.counters["attempts"] == 1
+    assert sum(verifier.metrics.errors.values()) == 1
+
+
+def test_retried_failures_count_each_attempt():
+    verifier = _verifier(max_retries=2, base_delay=0.001, deadline=30.0)
+    verifier.validate_asin("B0TEST0001")
+    assert verifier.metrics.counters["attempts"] == 3
+    assert sum(verifier.metrics.errors.values()) == 3